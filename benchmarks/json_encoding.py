@@ -0,0 +1,56 @@
+"""Measures the time to encode a 100k row `Datasets.create` payload with a datetime column
+
+Compares the isinstance chain the client used to encode with, the type dispatch registry on the standard library
+json module, and the orjson and ujson backends when they are installed.
+
+    python benchmarks/json_encoding.py
+"""
+from datetime import datetime, date, timedelta
+from enum import Enum
+import json
+import timeit
+
+from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.client.serialization import get_dumps
+
+ROWS = 100000
+REPEAT = 3
+
+start = datetime(2017, 1, 1)
+payload = {
+    'data': [{'timestamp': start + timedelta(hours=i), 'sales': i * 1.5, 'store': 'store-%d' % (i % 50)}
+             for i in range(ROWS)],
+    'columns': {'timestamp': ColumnMetadata({'dataType': 'date', 'role': 'timestamp'}),
+                'sales': ColumnMetadata({'dataType': 'numeric', 'role': 'target'})}
+}
+
+
+def isinstance_chain(obj):
+    # the encoder as it was before the registry, trimmed to the types in this payload
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, ColumnMetadata):
+        val = {'dataType': obj.data_type, 'role': obj.role}
+        if obj.imputation is not None:
+            val['imputation'] = obj.imputation
+        if obj.aggregation is not None:
+            val['aggregation'] = obj.aggregation
+        return val
+    if isinstance(obj, Enum):
+        return obj.name
+    raise TypeError("Type %s not serializable" % type(obj))
+
+
+if __name__ == '__main__':
+    cases = [('isinstance chain', lambda: json.dumps(payload, default=isinstance_chain))]
+    for backend in ('json', 'orjson', 'ujson'):
+        try:
+            dumps = get_dumps(backend)
+        except ImportError:
+            print('%-20s not installed' % backend)
+            continue
+        cases.append(('registry, %s' % backend, lambda dumps=dumps: dumps(payload)))
+
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print('%-20s %8.1f ms for %d rows' % (name, best * 1000, ROWS))
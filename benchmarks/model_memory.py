@@ -0,0 +1,38 @@
+"""Measures the memory used by each `Word` and `DistanceMetric`, as read from a vocabulary or anomaly session
+
+Compares the slotted models with equivalent classes that keep a per-instance __dict__, as the models used to.
+Only the objects themselves are counted; the values they hold are shared between instances.
+
+    python benchmarks/model_memory.py [count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from nexosisapi.distance_metric import DistanceMetric
+from nexosisapi.word import Word
+
+
+def bytes_per_object(cls, data, count):
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls(data) for _ in range(count)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    # leave out the list holding the objects
+    return (used - sys.getsizeof([None] * count)) / float(count)
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    cases = [
+        (Word, {'text': 'forecast', 'type': 0, 'rank': 12}),
+        (DistanceMetric, {'anomaly': '0.42', 'mahalanobis_distance': '3.5', 'x': 1, 'y': 2}),
+    ]
+    for cls, data in cases:
+        unslotted = type(cls.__name__, (cls,), {})
+        before = bytes_per_object(unslotted, data, count)
+        after = bytes_per_object(cls, data, count)
+        print('%-16s %7.1f bytes with __dict__  %7.1f bytes slotted  (%d instances)' %
+              (cls.__name__, before, after, count))
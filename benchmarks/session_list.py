@@ -0,0 +1,54 @@
+"""Measures the time to build a page of sessions, as returned by `Sessions.list`
+
+Compares parsing every date up front with dateutil, as the models used to, against the lazy parsing they do now,
+both when the dates are never read and when every date is read.
+
+    python benchmarks/session_list.py
+"""
+import timeit
+
+import dateutil.parser
+
+from nexosisapi.session import SessionResponse
+
+PAGE_SIZE = 1000
+REPEAT = 5
+
+page = [{
+    'sessionId': '015fd3f5-1a3c-4f8e-9a52-%012d' % i,
+    'type': 'forecast',
+    'status': 'completed',
+    'statusHistory': [],
+    'dataSourceName': 'sales',
+    'targetColumn': 'sales',
+    'startDate': '2017-03-25T00:00:00+00:00',
+    'endDate': '2017-04-25T00:00:00+00:00',
+    'requestedDate': '2017-12-19T04:30:16.070806+00:00',
+    'resultInterval': 'day',
+    'links': [],
+    'extraParameters': {}
+} for i in range(PAGE_SIZE)]
+
+
+def eager():
+    for item in page:
+        SessionResponse(item, {})
+        for field in ('startDate', 'endDate', 'requestedDate'):
+            dateutil.parser.parse(item[field])
+
+
+def lazy_unread():
+    for item in page:
+        SessionResponse(item, {})
+
+
+def lazy_read():
+    for item in page:
+        session = SessionResponse(item, {})
+        session.start_date, session.end_date, session.requested_date
+
+
+if __name__ == '__main__':
+    for name, func in [('eager dateutil', eager), ('lazy, dates unread', lazy_unread), ('lazy, dates read', lazy_read)]:
+        best = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print('%-20s %8.2f ms per page of %d' % (name, best * 1000, PAGE_SIZE))
@@ -1,5 +1,10 @@
+import sys
+
 NEXOSIS_API_KEY = 'NEXOSIS_API_KEY'
 SESSION_STATUS_HEADER = 'Nexosis-Session-Status'
 
 from .client.client import Client
-from .client.client_error import ClientError
\ No newline at end of file
+from .client.client_error import ClientError, CircuitOpenError, DeadlineExceededError
+
+if sys.version_info >= (3, 5):
+    from .client.aio import AsyncClient
@@ -1,5 +1,8 @@
 class Algorithm(object):
     """A description of the algorithm used to generate results"""
+
+    __slots__ = ('_name', '_desc', '_key')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
@@ -1,6 +1,8 @@
 from nexosisapi.algorithm import Algorithm
 
 class AlgorithmContestant(object):
+    __slots__ = ('_id', '_algorithm', '_metrics', '_links', '_datasource_properties', '_data')
+
     def __init__(self, data_dict):
         self._id = data_dict['id']
         self._algorithm = Algorithm(data_dict['algorithm'])
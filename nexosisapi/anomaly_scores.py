@@ -3,6 +3,8 @@ from nexosisapi.paged_list import PagedList
 
 
 class AnomalyScores(Session):
+    __slots__ = ('_metrics', '_data')
+
     def __init__(self, data_dict=None):
         super(AnomalyScores, self).__init__(data_dict)
         self._metrics = data_dict.get('metrics', {})
@@ -1,4 +1,6 @@
 class CalendarJoin(object):
+    __slots__ = ('_name', '_url', '_time_zone')
+
     def __init__(self, data_dict):
         self._name = data_dict.get('name')
         self._url = data_dict.get('url')
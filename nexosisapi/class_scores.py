@@ -3,6 +3,8 @@ from nexosisapi.paged_list import PagedList
 
 
 class ClassScores(Session):
+    __slots__ = ('_classes', '_metrics', '_data')
+
     def __init__(self, data_dict=None):
         super(ClassScores, self).__init__(data_dict)
         self._classes = data_dict.get('classes', [])
@@ -0,0 +1,2 @@
+from .client import AsyncClient
+from .http_client import AsyncHttpClient
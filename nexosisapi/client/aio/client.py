@@ -0,0 +1,94 @@
+import os
+
+from nexosisapi import NEXOSIS_API_KEY
+
+from .datasets import Datasets
+from .imports import Imports
+from .models import Models
+from .sessions import Sessions
+from .views import Views
+from .vocabularies import Vocabularies
+from .http_client import AsyncHttpClient
+
+
+class AsyncClient(object):
+    """An asyncio interface into the Nexosis API.
+
+    Every operation mirrors the one on `Client`, but is a coroutine and returns the same response objects. Many
+    requests may be in flight at once from one event loop, e.g. with `asyncio.gather`; the number of open
+    connections is bounded by the transport's `limit`.
+
+    Use as an async context manager, or await `close`, to release the connections.
+    """
+    def __init__(self, key=None, uri='https://ml.nexosis.com/v1', client=None, **kwargs):
+        """
+        :param str key: the api key to use, defaults to the NEXOSIS_API_KEY environment variable
+        :param str uri: the base uri of the API
+        :param client: the transport to use for requests, defaults to an `AsyncHttpClient`
+        :param kwargs: options passed to the default `AsyncHttpClient`, e.g. limit, limit_per_host,
+            keepalive_timeout, json_backend and timeout
+        """
+        self._key = key or os.environ.get(NEXOSIS_API_KEY)
+        if uri.endswith('/'):
+            uri = uri[:-1]
+        self._uri = uri
+
+        if client is None:
+            client = AsyncHttpClient(self._key, uri, **kwargs)
+        self._client = client
+        self._models = Models(self._client)
+        self._datasets = Datasets(self._client)
+        self._imports = Imports(self._client)
+        self._sessions = Sessions(self._client)
+        self._views = Views(self._client)
+        self._vocabularies = Vocabularies(self._client)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Release the connections held by this client"""
+        close = getattr(self._client, 'close', None)
+        if close is not None:
+            await close()
+
+    @property
+    def datasets(self):
+        """Dataset based API operations"""
+        return self._datasets
+
+    @property
+    def imports(self):
+        """Import based API operations"""
+        return self._imports
+
+    @property
+    def models(self):
+        """Model based API operations"""
+        return self._models
+
+    @property
+    def sessions(self):
+        """Session based API operations"""
+        return self._sessions
+
+    @property
+    def views(self):
+        """View based API operations"""
+        return self._views
+
+    @property
+    def vocabularies(self):
+        """Vocabulary based API operations"""
+        return self._vocabularies
+
+    async def get_account_balance(self):
+        """Gets the current account balance"""
+        _, status, headers = await self._client.request_with_headers('GET', 'data')
+        header = headers.get('nexosis-account-balance') if status == 200 else None
+        if header is not None:
+            return float(header.split(' ')[0])
+        return None
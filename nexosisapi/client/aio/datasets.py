@@ -0,0 +1,123 @@
+from nexosisapi.dataset import Dataset
+from nexosisapi.dataset_summary import DatasetSummary
+from nexosisapi.paged_list import PagedList
+from nexosisapi.list_queries import DatasetListQuery
+from nexosisapi.client.datasets import Datasets as _Datasets, _file_writer
+
+
+class Datasets(object):
+    """Dataset based API operations, see `nexosisapi.client.datasets.Datasets`"""
+
+    def __init__(self, base_client):
+        self._client = base_client
+
+    async def create(self, dataset_name, data, metadata=None):
+        """Save data in a named dataset
+
+        :param str dataset_name: the name of the dataset
+        :param list data: a `list` of `dict` where each dict is the set of values in the data set.
+        :param dict metadata: a dict of `str` keys to `ColumnMetadata` items
+
+        :return: a `DatasetSummary` describing the dataset
+        :rtype: DatasetSummary
+        """
+        return await self._create(dataset_name, {'data': data, 'columns': metadata}, 'application/json')
+
+    async def create_csv(self, dataset_name, csv_file):
+        """Save data from a CSV file in a named dataset
+
+        :param str dataset_name: the name of the dataset
+        :param file csv_file: an open file to read the csv data from
+
+        :return: a `DatasetSummary` describing the dataset
+        :rtype: DatasetSummary
+        """
+        return await self._create(dataset_name, csv_file.read(), 'text/csv')
+
+    async def _create(self, dataset_name, content, content_type):
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+
+        response = await self._client.request('PUT', '/data/%s' % dataset_name, data=content,
+                                              headers={'Content-Type': content_type})
+
+        return DatasetSummary(response)
+
+    async def list(self, dataset_list_query=DatasetListQuery()):
+        """Get the list of saved datasets, optionally filtering by name
+
+        :param DatasetListQuery dataset_list_query: query options to limit results of the request
+        :return: a `list` of DatasetSummary objects representing the dataset stored
+        :rtype: list
+        """
+        listing = await self._client.request('GET', '/data', params=dataset_list_query.query_parameters())
+
+        return PagedList.from_response(
+            [DatasetSummary(item) for item in listing.get('items', [])],
+            listing)
+
+    async def get(self, dataset_name, page_number=0, page_size=50, start_date=None, end_date=None, include=None):
+        """Get the data stored in a data set
+
+        :param str dataset_name: name of the dataset
+        :param int page_number: zero-based page number of results to retrieve
+        :param int page_size: count of results to retrieve in each page (default 50, max 1000).
+        :param datetime start_date: the first date to return in the response
+        :param datetime end_date: the last date to return in the response
+        :param include: string or array of strings specifying the names of the columns from the dataset to return
+        :return: a `Dataset` with the data queried
+        :rtype: Dataset
+        """
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+
+        params = _Datasets.process_parameters(page_number, page_size, start_date, end_date, include)
+
+        dataset = await self._client.request('GET', '/data/%s' % dataset_name, params=params)
+
+        return Dataset(dataset)
+
+    async def get_csv(self, dataset_name, csv_file, page_number=0, page_size=50, start_date=None, end_date=None,
+                      include=None):
+        """Get the data stored in a data set, and write it to a file
+
+        :param str dataset_name: name of the dataset
+        :param FileIO csv_file: an open, writeable text or binary file to save the data to
+        :param int page_number: zero-based page number of results to retrieve
+        :param int page_size: count of results to retrieve in each page (default 50, max 1000).
+        :param datetime start_date: the first date to return in the response
+        :param datetime end_date: the last date to return in the response
+        :param include: string or array of strings specifying the names of the columns from the dataset to return
+        """
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+        if csv_file is None:
+            raise ValueError('csv_file is required and was not provided')
+
+        params = _Datasets.process_parameters(page_number, page_size, start_date, end_date, include)
+
+        data = await self._client.request('GET', '/data/%s' % dataset_name, params=params,
+                                          headers={'Accept': 'text/csv'})
+
+        _file_writer(csv_file)(data)
+
+    async def remove(self, dataset_name, start_date=None, end_date=None, cascade=None):
+        """Delete a dataset by name
+
+        :param str dataset_name: name of the dataset
+        :param datetime start_date: the starting date to remove from the dataset
+        :param datetime end_date: the ending date to remove from the dataset
+        :param list cascade: set the cascade options of the removal; any of 'forecast', 'session' or 'view'
+        """
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+
+        filter_options = {}
+        if start_date:
+            filter_options['startDate'] = start_date
+        if end_date:
+            filter_options['endDate'] = end_date
+        if cascade:
+            filter_options['cascade'] = cascade
+
+        await self._client.request('DELETE', '/data/%s' % dataset_name, params=filter_options)
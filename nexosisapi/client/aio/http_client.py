@@ -0,0 +1,111 @@
+import json
+from datetime import datetime, date
+
+from nexosisapi.client.client_error import ClientError
+from nexosisapi.client.http_client import BaseHttpClient, DEFAULT_TIMEOUT
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def _encode_params(params):
+    # aiohttp only accepts str/int/float query values, so mirror what requests does with everything else
+    encoded = []
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if isinstance(item, bool):
+                item = str(item)
+            elif isinstance(item, (datetime, date)):
+                item = str(item)
+            elif not isinstance(item, (str, int, float)):
+                item = str(item)
+            encoded.append((key, item))
+    return encoded
+
+
+def _client_timeout(timeout):
+    # mirror requests, where the read timeout applies to each read rather than the whole response
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+def _error_body(body):
+    # gateway errors, among others, may not carry a json body describing the error
+    try:
+        return json.loads(body.decode('utf-8'))
+    except ValueError:
+        return {}
+
+
+def _process_body(body, status, headers):
+    if len(body) == 0:
+        return None, status, headers
+
+    content_type = headers.get('content-type', '').split(';')[0]
+    if content_type == 'application/json':
+        return json.loads(body.decode('utf-8')), status, headers
+    else:
+        return body, status, headers
+
+
+class AsyncHttpClient(BaseHttpClient):
+    def __init__(self, key, uri, limit=100, limit_per_host=0, keepalive_timeout=15, json_backend='json',
+                 timeout=DEFAULT_TIMEOUT):
+        """Create a non-blocking transport for the asynchronous API operations
+
+        Requires the aiohttp package (`pip install nexosisapi[async]`).
+
+        :param str key: the api key sent with each request
+        :param str uri: the base uri of the API
+        :param int limit: the maximum number of simultaneous connections; 0 for no limit
+        :param int limit_per_host: the maximum number of simultaneous connections to one host; 0 for no limit
+        :param float keepalive_timeout: seconds an idle connection is kept open for reuse
+        :param str json_backend: the library used to encode request bodies: 'json', 'orjson', 'ujson' or 'auto'
+        :param timeout: the seconds to wait for a connection and then for each read of the response, either as a
+            (connect, read) tuple or one number for both
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncHttpClient requires the aiohttp package: pip install nexosisapi[async]')
+        super(AsyncHttpClient, self).__init__(key, uri, json_backend)
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        # created lazily so the session binds to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host,
+                                             keepalive_timeout=self._keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=_client_timeout(self._timeout))
+        return self._session
+
+    async def close(self):
+        """Close all pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request_with_headers(self, verb, uri_path, **kwargs):
+        args = self._process_args(kwargs)
+        if 'params' in args:
+            args['params'] = _encode_params(args['params'])
+        if 'timeout' in args:
+            args['timeout'] = _client_timeout(args['timeout'])
+
+        async with self._get_session().request(verb, self._get_uri(uri_path), **args) as response:
+            body = await response.read()
+            if response.status < 400:
+                return _process_body(body, response.status, response.headers)
+            else:
+                raise ClientError(uri_path, response.status, _error_body(body), response.headers)
+
+    async def request(self, verb, uri_path, **kwargs):
+        response, _, _ = await self.request_with_headers(verb, uri_path, **kwargs)
+        return response
@@ -0,0 +1,259 @@
+from nexosisapi.confusion_matrix import ConfusionMatrix
+from nexosisapi.paged_list import PagedList
+from nexosisapi.session import SessionResult, SessionResponse
+from nexosisapi.time_interval import TimeInterval
+from nexosisapi.session_contest import SessionContest
+from nexosisapi.algorithm_contestant import AlgorithmContestant
+from nexosisapi.session_selection_metrics import SessionSelectionMetrics
+from nexosisapi.class_scores import ClassScores
+from nexosisapi.anomaly_scores import AnomalyScores
+
+from nexosisapi.list_queries import SessionListQuery
+from nexosisapi.feature_importance import FeatureImportance
+from nexosisapi.timeseries_outliers import TimeseriesOutliers
+from nexosisapi.anomaly_distances import AnomalyDistances
+
+
+class Sessions(object):
+    """Session based API operations, see `nexosisapi.client.sessions.Sessions`"""
+
+    def __init__(self, client):
+        self._client = client
+
+    async def _create_session(self, datasource_name, action_type, start_date, end_date, target_column=None,
+                              event_name=None, result_interval=TimeInterval.day, column_metadata=None,
+                              callback_url=None):
+        if datasource_name is None:
+            raise ValueError('datasource_name is required and was not provided')
+        if start_date is None:
+            raise ValueError('start_date is required and was not provided')
+        if end_date is None:
+            raise ValueError('end_date is required and was not provided')
+
+        response, _, headers = await self._client.request_with_headers('POST', 'sessions/%s' % action_type,
+                                                                       data={
+                                                                           'dataSourceName': datasource_name,
+                                                                           'columns': column_metadata,
+                                                                           'targetColumn': target_column,
+                                                                           'eventName': event_name,
+                                                                           'startDate': start_date,
+                                                                           'endDate': end_date,
+                                                                           'resultInterval': result_interval.name,
+                                                                           'callbackUrl': callback_url
+                                                                       })
+        return SessionResponse(response, headers)
+
+    async def create_forecast(self, datasource_name, target_column, start_date, end_date,
+                              result_interval=TimeInterval.day, callback_url=None):
+        """Create a new forecast for a datasource
+
+        :rtype: SessionResponse
+        """
+        return await self._create_session(datasource_name, 'forecast', start_date, end_date, target_column,
+                                          result_interval=result_interval, callback_url=callback_url)
+
+    async def create_forecast_with_metadata(self, datasource_name, column_metadata, start_date, end_date,
+                                            result_interval=TimeInterval.day, callback_url=None):
+        """Create a new forecast for a datasource using column metadata
+
+        :rtype: SessionResponse
+        """
+        return await self._create_session(datasource_name, 'forecast', start_date, end_date,
+                                          result_interval=result_interval, column_metadata=column_metadata,
+                                          callback_url=callback_url)
+
+    async def analyze_impact(self, datasource_name, target_column, event_name, start_date, end_date,
+                             result_interval=TimeInterval.day, callback_url=None):
+        """Create a new impact analysis on a datasource
+
+        :rtype: SessionResponse
+        """
+        return await self._create_session(datasource_name, 'impact', start_date, end_date, target_column,
+                                          event_name, result_interval, callback_url=callback_url)
+
+    async def estimate_forecast(self, datasource_name, target_column, start_date, end_date,
+                                result_interval=TimeInterval.day):
+        """Estimate a new forecast for a datasource
+
+        :rtype: SessionResponse
+        """
+        return await self._create_session(datasource_name, 'forecast', start_date, end_date, target_column,
+                                          result_interval=result_interval)
+
+    async def estimate_impact(self, datasource_name, target_column, event_name, start_date, end_date,
+                              result_interval=TimeInterval.day):
+        """Estimate an impact analysis on a dataset
+
+        :rtype: SessionResponse
+        """
+        return await self._create_session(datasource_name, 'impact', start_date, end_date, target_column,
+                                          event_name, result_interval)
+
+    async def train_model(self, datasource_name, target_column=None, column_metadata=None,
+                          prediction_domain='regression', callback_url=None, extra_parameters=None):
+        """Train a model for later predictions
+
+        :rtype: SessionResponse
+        """
+        response, _, headers = await self._client.request_with_headers('POST', 'sessions/model',
+                                                                       data={
+                                                                           'predictionDomain': prediction_domain,
+                                                                           'dataSourceName': datasource_name,
+                                                                           'targetColumn': target_column,
+                                                                           'columns': column_metadata,
+                                                                           'callbackUrl': callback_url,
+                                                                           'extraParameters': extra_parameters
+                                                                       })
+
+        return SessionResponse(response, headers)
+
+    async def train_anomalies_model(self, datasource_name, contains_anomalies=True, column_metadata=None):
+        """Train an anomaly detection model
+
+        :rtype: SessionResponse
+        """
+        return await self.train_model(datasource_name=datasource_name, column_metadata=column_metadata,
+                                      extra_parameters={'containsAnomalies': contains_anomalies})
+
+    async def list(self, session_list_query=SessionListQuery()):
+        """Get a list of all sessions, optionally filtering on session parameters
+
+        :rtype: PagedList
+        """
+        response, _, headers = await self._client.request_with_headers(
+            'GET', 'sessions', params=session_list_query.query_parameters())
+        return PagedList.from_response(
+            [SessionResponse(item, headers) for item in response.get('items', [])],
+            response)
+
+    async def remove(self, session_id):
+        """Remove a session based on the session id"""
+        if session_id is None:
+            raise ValueError('session_id is required and was not provided')
+
+        await self._client.request('DELETE', 'sessions/%s' % session_id)
+
+    async def remove_sessions(self, **kwargs):
+        await self._client.request('DELETE', 'sessions', params=kwargs)
+
+    async def get_results(self, session_id):
+        """Get the results of a session based on the session id
+
+        :rtype: SessionResult
+        """
+        if session_id is None:
+            raise ValueError('session_id is required and was not provided')
+
+        response = await self._client.request('GET', 'sessions/%s/results' % session_id)
+        return SessionResult(response)
+
+    async def get(self, session_id):
+        """Get a session based on the session id
+
+        :rtype: SessionResponse
+        """
+        if session_id is None:
+            raise ValueError('session_id is required and was not provided')
+
+        response, _, headers = await self._client.request_with_headers('GET', 'sessions/%s' % session_id)
+        return SessionResponse(response, headers)
+
+    async def get_confusion_matrix(self, session_id):
+        """Get the confusion matrix results for a completed classification model.
+
+        :rtype: ConfusionMatrix
+        """
+        if session_id is None:
+            raise ValueError('session_id is required and was not provided')
+
+        response = await self._client.request('GET', 'sessions/%s/results/confusionmatrix' % session_id)
+        return ConfusionMatrix(response)
+
+    async def _get_paged_result(self, session_id, path, page_number, page_size):
+        if session_id is None or not session_id:
+            raise ValueError('session_id is required and was not provided')
+        query = {
+            'page': page_number,
+            'pageSize': page_size}
+        return await self._client.request('GET', 'sessions/{0}/results/{1}'.format(session_id, path), params=query)
+
+    async def get_class_scores(self, session_id, page_number=0, page_size=50):
+        """Gets the class scores for each result of a completed classification model session
+
+        :rtype: ClassScores
+        """
+        return ClassScores(await self._get_paged_result(session_id, 'classScores', page_number, page_size))
+
+    async def get_anomaly_scores(self, session_id, page_number=0, page_size=50):
+        """Gets the scores of the entire dataset generated by a completed anomalies session
+
+        :rtype: AnomalyScores
+        """
+        return AnomalyScores(await self._get_paged_result(session_id, 'anomalyScores', page_number, page_size))
+
+    async def get_contest(self, session_id):
+        """Get information about the algorithm contestants used to determine session results
+
+        :rtype: SessionContest
+        """
+        if session_id is None or not session_id:
+            raise ValueError('session_id is required and was not provided')
+        response = await self._client.request('GET', 'sessions/%s/contest' % session_id)
+        return SessionContest(response)
+
+    async def get_champion(self, session_id):
+        """Information about the winning algorithm for the given session
+
+        :rtype: AlgorithmContestant
+        """
+        if session_id is None or not session_id:
+            raise ValueError('session_id is required and was not provided')
+        response = await self._client.request('GET', 'sessions/%s/contest/champion' % session_id)
+        return AlgorithmContestant(response)
+
+    async def get_contestant(self, session_id, contestant_id):
+        """Information about a contestant for this session
+
+        :rtype: AlgorithmContestant
+        """
+        if session_id is None or not session_id:
+            raise ValueError('session_id is required and was not provided')
+        if contestant_id is None or not contestant_id:
+            raise ValueError('contestant_id is required and was not provided')
+        response = await self._client.request('GET',
+                                              'sessions/{0}/contest/contestants/{1}'.format(session_id,
+                                                                                            contestant_id))
+        return AlgorithmContestant(response)
+
+    async def get_contest_selection_criteria(self, session_id):
+        """Information about the dataset on which the session was based
+
+        :rtype: SessionSelectionMetrics
+        """
+        if session_id is None or not session_id:
+            raise ValueError('session_id is required and was not provided')
+        response = await self._client.request('GET', 'sessions/{0}/contest/selection'.format(session_id))
+        return SessionSelectionMetrics(response)
+
+    async def get_feature_importance(self, session_id, page_number=0, page_size=50):
+        """Feature importance scores for a completed session
+
+        :rtype: FeatureImportance
+        """
+        return FeatureImportance(await self._get_paged_result(session_id, 'featureimportance', page_number,
+                                                              page_size))
+
+    async def get_timeseries_outliers(self, session_id, page_number=0, page_size=50):
+        """Outliers and their smoothed values for a completed timeseries session
+
+        :rtype: TimeseriesOutliers
+        """
+        return TimeseriesOutliers(await self._get_paged_result(session_id, 'outliers', page_number, page_size))
+
+    async def get_distance_metrics(self, session_id, page_number=0, page_size=50):
+        """Distances and anomaly scores for a completed anomalies session
+
+        :rtype: AnomalyDistances
+        """
+        return AnomalyDistances(await self._get_paged_result(session_id, 'mahalanobisdistances', page_number,
+                                                             page_size))
@@ -0,0 +1,59 @@
+import random
+import time
+
+from . import deadline
+from .client_error import ClientError, CircuitOpenError
+
+
+def backoff_delay(attempt, initial=0.5, maximum=30.0, jitter=True):
+    """Get the time to wait before retrying an operation
+
+    The delay doubles with each attempt up to `maximum`; with jitter a random delay up to that value is used so that
+    many clients retrying at once spread out their requests.
+
+    :param int attempt: the zero-based number of the retry
+    :param float initial: the delay before the first retry, in seconds
+    :param float maximum: the largest delay to return, in seconds
+    :param bool jitter: randomize the delay between 0 and the computed value
+    :return: the number of seconds to wait
+    :rtype: float
+    """
+    delay = min(maximum, initial * (2 ** attempt))
+    if jitter:
+        return random.uniform(0, delay)
+    return delay
+
+
+def is_transient(error):
+    """Whether an error raised by a request is worth retrying: throttling, server errors and connection failures"""
+    if isinstance(error, CircuitOpenError):
+        # the request was never sent, and retrying before the circuit closes would just fail again
+        return False
+    if isinstance(error, ClientError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, IOError)
+
+
+def call_with_retries(func, retries=3, is_retryable=is_transient, initial=0.5, maximum=30.0):
+    """Call a function, retrying it with exponential backoff when it fails with a retryable error
+
+    :param func: the function to call, taking no arguments
+    :param int retries: the number of times to retry after the first failure
+    :param is_retryable: a function given the raised error, returning True if it should be retried
+    :param float initial: the delay before the first retry, in seconds
+    :param float maximum: the largest delay between retries, in seconds
+    :return: the result of `func`
+    """
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e):
+                raise
+            delay = backoff_delay(attempt, initial, maximum)
+            left = deadline.remaining()
+            if left is not None and delay >= left:
+                raise
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,56 @@
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+from . import deadline
+
+
+def chunks(iterable, size):
+    """Split an iterable into lists of at most `size` items, reading only one chunk at a time
+
+    :param iterable: the items to split
+    :param int size: the largest number of items in a chunk
+    """
+    if size is None or size < 1:
+        raise ValueError('size must be a positive number')
+
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ordered_map(func, items, workers):
+    """Apply a function to items on a pool of threads, yielding the results in the order of the items
+
+    Items are taken from the iterable only as workers free up, so at most `workers` items are held at once. If a
+    call raises, the error is raised when its result is reached and the remaining work is cancelled. The workers run
+    under the caller's `deadline`, and no more items are started once it has passed.
+
+    :param func: the function to apply to each item
+    :param items: an iterable of items
+    :param int workers: the number of calls to run at the same time
+    """
+    if workers is None or workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    func = deadline.propagate(func)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = collections.deque()
+    try:
+        for item in items:
+            deadline.check('starting the remaining work')
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
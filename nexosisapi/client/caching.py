@@ -0,0 +1,331 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from .serialization import encode
+
+
+_missing = object()
+
+
+class LRUCache(object):
+    """A thread-safe least-recently-used cache with optional expiry and size limits
+
+    Entries are dropped, oldest use first, once there are more than `max_entries` of them or their sizes add up to
+    more than `max_bytes`. An entry older than `ttl` seconds is treated as missing.
+    """
+
+    def __init__(self, max_entries=10000, ttl=None, max_bytes=None):
+        """
+        :param int max_entries: the most entries to keep, or None for no limit
+        :param float ttl: the number of seconds an entry stays valid, or None to keep entries until evicted
+        :param int max_bytes: the most total size, as given to `set`, to keep, or None for no limit
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hits(self):
+        """The number of lookups that found a value"""
+        return self._hits
+
+    @property
+    def misses(self):
+        """The number of lookups that found nothing, or an expired value"""
+        return self._misses
+
+    @property
+    def size(self):
+        """The total size of the entries held"""
+        return self._bytes
+
+    def get(self, key, default=None):
+        """Look up a value, marking it as recently used
+
+        :return: the value, or `default` if it is missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key, _missing)
+            if entry is not _missing and self._ttl is not None and time.time() - entry[2] > self._ttl:
+                self._remove(key)
+                entry = _missing
+            if entry is _missing:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.pop(key)
+            self._entries[key] = entry
+            return entry[0]
+
+    def set(self, key, value, size=0):
+        """Store a value, evicting the least recently used entries if a limit is passed
+
+        :param int size: the size to count for this entry against `max_bytes`
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
+            self._entries[key] = (value, size, time.time())
+            self._bytes += size
+            while (self._max_entries is not None and len(self._entries) > self._max_entries) or \
+                    (self._max_bytes is not None and self._bytes > self._max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def discard(self, key):
+        """Remove a value if it is present"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        """Remove every value, leaving the hit and miss counts alone"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)[1]
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=encode)
+
+
+class PredictionCache(object):
+    """Remembers the predictions made for each feature row so repeated rows need not be sent again
+
+    Rows are keyed on the model id plus a hash of the row and its extra parameters, so keys do not depend on the
+    order of the keys in either dict. Assign one to `Models.prediction_cache` to use it.
+    """
+
+    def __init__(self, max_entries=100000, ttl=None, max_bytes=64 * 1024 * 1024):
+        """
+        :param int max_entries: the most predicted rows to keep
+        :param float ttl: the number of seconds a prediction stays valid, or None to keep it until evicted
+        :param int max_bytes: the most memory, measured as the encoded size of the predicted rows, to use
+        """
+        self._rows = LRUCache(max_entries, ttl, max_bytes)
+        self._responses = {}
+
+    @property
+    def hits(self):
+        """The number of rows answered from the cache"""
+        return self._rows.hits
+
+    @property
+    def misses(self):
+        """The number of rows that had to be predicted by the API"""
+        return self._rows.misses
+
+    def clear(self):
+        self._rows.clear()
+        self._responses.clear()
+
+    def predict(self, model_id, features, extra_parameters, send):
+        """Answer what rows it can from the cache, calling `send` for the rest
+
+        :param str model_id: the id of the model to use for prediction
+        :param list features: the feature rows to predict
+        :param dict extra_parameters: extended capability for a particular model
+        :param send: called with the list of rows missing from the cache, returning the API response
+        :return: a response for all of `features`, in their order, holding copies of the cached rows
+        :raises ValueError: if the API predicts a different number of rows than were sent, since they cannot then be
+            matched to the rows they belong to
+        """
+        extra = _canonical(extra_parameters or {})
+        keys = [(model_id, hashlib.sha1(('%s|%s' % (_canonical(row), extra)).encode('utf-8')).hexdigest())
+                for row in features]
+        results = [self._rows.get(key, _missing) for key in keys]
+
+        missing = OrderedDict()
+        for index, result in enumerate(results):
+            if result is _missing:
+                missing.setdefault(keys[index], features[index])
+
+        if not missing:
+            response = dict(self._responses.get(model_id) or {'modelId': model_id})
+        else:
+            response = dict(send(list(missing.values())))
+            predicted = response.get('data') or []
+            if len(predicted) != len(missing):
+                raise ValueError('%d rows were sent for prediction but %d were returned'
+                                 % (len(missing), len(predicted)))
+            for key, row in zip(missing, predicted):
+                self._rows.set(key, dict(row), len(_canonical(row)))
+            self._responses[model_id] = dict((k, v) for k, v in response.items() if k != 'data')
+            by_key = dict(zip(missing, predicted))
+            results = [by_key[key] if result is _missing else result for key, result in zip(keys, results)]
+
+        # the cache keeps its own rows, so hand out copies that callers are free to change
+        response['data'] = [dict(row) for row in results]
+        return response
+
+
+class _ResultCounter(object):
+    """Counts how often the lookups of a result cache are answered"""
+
+    def __init__(self):
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self):
+        """The number of lookups answered from the cache"""
+        return self._hits
+
+    @property
+    def misses(self):
+        """The number of lookups that had to go to the API"""
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """The fraction of lookups answered from the cache"""
+        total = self._hits + self._misses
+        return float(self._hits) / total if total else 0.0
+
+    def _counted(self, value):
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+
+class MemoryResultCache(_ResultCounter):
+    """Keeps the result payloads of completed sessions, which never change once the session has completed, in
+    memory, dropping the least recently used past the given limits
+
+    Assign one to `Sessions.result_cache` to use it.
+    """
+
+    def __init__(self, max_entries=1000, ttl=None, max_bytes=None):
+        """
+        :param int max_entries: the most payloads to keep
+        :param float ttl: the number of seconds a payload stays valid, or None to keep it until evicted
+        :param int max_bytes: the most memory, measured as the encoded size of the payloads, to use
+        """
+        super(MemoryResultCache, self).__init__()
+        self._entries = LRUCache(max_entries, ttl, max_bytes)
+        self._measure = max_bytes is not None
+        self._keys = {}
+
+    def get(self, session_id, key):
+        """Look up a stored payload
+
+        :param str session_id: the session the payload belongs to
+        :param str key: the request, including its parameters, that returned the payload
+        :return: the payload, or None if it is not stored
+        """
+        return self._counted(self._entries.get((session_id, key)))
+
+    def set(self, session_id, key, value):
+        """Store the payload returned by a request for a completed session"""
+        size = len(_canonical(value)) if self._measure else 0
+        with self._lock:
+            self._keys.setdefault(session_id, set()).add(key)
+        self._entries.set((session_id, key), value, size)
+
+    def invalidate(self, session_id):
+        """Drop every payload stored for a session"""
+        with self._lock:
+            keys = self._keys.pop(session_id, ())
+        for key in keys:
+            self._entries.discard((session_id, key))
+
+    def clear(self):
+        """Drop every payload"""
+        with self._lock:
+            self._keys.clear()
+        self._entries.clear()
+
+
+class DiskResultCache(_ResultCounter):
+    """Keeps the result payloads of completed sessions as json files under a directory, one sub-directory per
+    session, so they are shared between processes and survive restarts
+
+    Assign one to `Sessions.result_cache` to use it.
+    """
+
+    def __init__(self, directory):
+        """
+        :param str directory: the directory to keep the payloads in; it is created if needed
+        """
+        super(DiskResultCache, self).__init__()
+        self._directory = directory
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def _session_directory(self, session_id):
+        session_id = str(session_id)
+        if not re.match(r'^[\w-]+$', session_id):
+            session_id = hashlib.sha1(session_id.encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, session_id)
+
+    def _path(self, session_id, key):
+        return os.path.join(self._session_directory(session_id),
+                            hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, session_id, key):
+        """Look up a stored payload
+
+        :param str session_id: the session the payload belongs to
+        :param str key: the request, including its parameters, that returned the payload
+        :return: the payload, or None if it is not stored
+        """
+        try:
+            with open(self._path(session_id, key), 'r') as f:
+                value = json.load(f)
+        except (IOError, OSError, ValueError):
+            value = None
+        return self._counted(value)
+
+    def set(self, session_id, key, value):
+        """Store the payload returned by a request for a completed session"""
+        directory = self._session_directory(session_id)
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+        except OSError:
+            if not os.path.isdir(directory):
+                raise
+        # write to a temporary file first so other readers never see a partly written payload
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(handle, 'w') as f:
+            json.dump(value, f)
+        try:
+            os.rename(temp_path, self._path(session_id, key))
+        except OSError:
+            # another process stored the same payload first
+            os.remove(temp_path)
+
+    def invalidate(self, session_id):
+        """Drop every payload stored for a session"""
+        shutil.rmtree(self._session_directory(session_id), ignore_errors=True)
+
+    def clear(self):
+        """Drop every payload"""
+        if os.path.isdir(self._directory):
+            for name in os.listdir(self._directory):
+                shutil.rmtree(os.path.join(self._directory, name), ignore_errors=True)
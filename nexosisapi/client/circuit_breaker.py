@@ -0,0 +1,158 @@
+from collections import deque
+import threading
+import time
+
+from .client_error import ClientError, CircuitOpenError
+from .endpoints import endpoint_family
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def is_failure(error):
+    """Whether an error shows an endpoint is unhealthy: server errors and connection failures, but not errors in
+    the request itself, such as a 404 or 400, or throttling"""
+    if isinstance(error, ClientError):
+        return error.status >= 500
+    return isinstance(error, IOError)
+
+
+class _Circuit(object):
+    def __init__(self):
+        self.state = CLOSED
+        self.calls = deque()
+        self.opened = None
+        self.trials = 0
+        self.successes = 0
+
+
+class CircuitBreaker(object):
+    """Stops sending requests to a group of endpoints while too many of them are failing
+
+    Each endpoint family (see `endpoint_family`) has its own circuit. While a circuit is closed, requests are sent
+    and their outcomes counted over the last `window` seconds. Once at least `minimum_calls` have been made and
+    `failure_rate` of them failed, or took longer than `slow_call_duration`, the circuit opens: requests to that
+    family fail at once with a `CircuitOpenError` instead of waiting on the struggling endpoint. After
+    `open_duration` seconds the circuit is half-open and lets `trial_calls` requests through; if they succeed it
+    closes again, and if any fails it opens for another `open_duration`.
+    """
+
+    def __init__(self, failure_rate=0.5, minimum_calls=10, window=30.0, open_duration=30.0, trial_calls=1,
+                 slow_call_duration=None, is_failure=is_failure):
+        """
+        :param float failure_rate: the fraction of failed calls in the window that opens the circuit
+        :param int minimum_calls: the fewest calls in the window before the failure rate is considered
+        :param float window: the seconds of recent calls counted
+        :param float open_duration: the seconds a circuit stays open before trying requests again
+        :param int trial_calls: the successful requests needed while half-open to close the circuit
+        :param float slow_call_duration: calls taking longer than this many seconds count as failures; None to
+            judge calls only by their outcome
+        :param is_failure: a function given the error raised by a request, returning True if it counts as a failure
+        """
+        self._failure_rate = failure_rate
+        self._minimum_calls = minimum_calls
+        self._window = window
+        self._open_duration = open_duration
+        self._trial_calls = trial_calls
+        self._slow_call_duration = slow_call_duration
+        self._is_failure = is_failure
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def state(self, family):
+        """The state of the circuit for an endpoint family: 'closed', 'open' or 'half_open'"""
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.time() - circuit.opened >= self._open_duration:
+                return HALF_OPEN
+            return circuit.state
+
+    def allow(self, uri_path):
+        """Check that a request may be sent, before sending it
+
+        :param str uri_path: the path of the request
+        :return: the endpoint family of the request, to pass to `record`
+        :raises CircuitOpenError: when the circuit for the request's endpoint family is open
+        """
+        family = endpoint_family(uri_path)
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits.setdefault(family, _Circuit())
+            if circuit.state == OPEN and now - circuit.opened >= self._open_duration:
+                circuit.state = HALF_OPEN
+                circuit.trials = 0
+                circuit.successes = 0
+            if circuit.state == HALF_OPEN:
+                if circuit.trials >= self._trial_calls:
+                    raise CircuitOpenError(uri_path, family)
+                circuit.trials += 1
+            elif circuit.state == OPEN:
+                raise CircuitOpenError(uri_path, family)
+        return family
+
+    def cancel(self, family):
+        """Give back a request let through by `allow` that was not sent after all, without counting an outcome
+
+        :param str family: the endpoint family returned by `allow`
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is not None and circuit.state == HALF_OPEN and circuit.trials > 0:
+                circuit.trials -= 1
+
+    def record(self, family, error, duration):
+        """Count the outcome of a request let through by `allow`
+
+        :param str family: the endpoint family returned by `allow`
+        :param error: the error the request raised, or None if it succeeded
+        :param float duration: the seconds the request took
+        """
+        failed = (error is not None and self._is_failure(error)) or \
+            (self._slow_call_duration is not None and duration > self._slow_call_duration)
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits.setdefault(family, _Circuit())
+            if circuit.state == HALF_OPEN:
+                if failed:
+                    self._open(circuit, now)
+                else:
+                    circuit.successes += 1
+                    if circuit.successes >= self._trial_calls:
+                        circuit.state = CLOSED
+                        circuit.calls.clear()
+                return
+            if circuit.state == OPEN:
+                return
+
+            circuit.calls.append((now, failed))
+            while circuit.calls and now - circuit.calls[0][0] > self._window:
+                circuit.calls.popleft()
+            failures = sum(1 for _, call_failed in circuit.calls if call_failed)
+            if len(circuit.calls) >= self._minimum_calls and failures >= self._failure_rate * len(circuit.calls):
+                self._open(circuit, now)
+
+    @staticmethod
+    def _open(circuit, now):
+        circuit.state = OPEN
+        circuit.opened = now
+        circuit.calls.clear()
+
+    def call(self, uri_path, func):
+        """Call a function sending a request, if the circuit for its endpoint family allows it
+
+        :param str uri_path: the path of the request
+        :param func: the function sending the request, taking no arguments
+        :return: the result of `func`
+        """
+        family = self.allow(uri_path)
+        started = time.time()
+        try:
+            result = func()
+        except Exception as e:
+            self.record(family, e, time.time() - started)
+            raise
+        self.record(family, None, time.time() - started)
+        return result
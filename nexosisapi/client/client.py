@@ -14,15 +14,26 @@ from nexosisapi import NEXOSIS_API_KEY
 
 class Client(object):
     """The main interface into the Nexosis API.
+
+    The client holds a pool of open connections to the API; call `close` (or use the client as a context manager)
+    to release them when done.
     """
-    def __init__(self, key=None, uri='https://ml.nexosis.com/v1', client=None):
+    def __init__(self, key=None, uri='https://ml.nexosis.com/v1', client=None, **kwargs):
+        """
+        :param str key: the api key to use, defaults to the NEXOSIS_API_KEY environment variable
+        :param str uri: the base uri of the API
+        :param client: the transport to use for requests, defaults to an `HttpClient`
+        :param kwargs: options passed to the default `HttpClient`, e.g. pool_connections, pool_maxsize,
+            pool_block, idle_timeout, json_backend, retry_policy, rate_limiter, circuit_breaker, timeout
+            and instruments
+        """
         self._key = key or os.environ.get(NEXOSIS_API_KEY)
         if uri.endswith('/'):
             uri = uri[:-1]
         self._uri = uri
 
         if client is None:
-            client = HttpClient(self._key, uri)
+            client = HttpClient(self._key, uri, **kwargs)
         self._client = client
         self._models = Models(self._client)
         self._datasets = Datasets(self._client)
@@ -31,6 +42,18 @@ class Client(object):
         self._views = Views(self._client)
         self._vocabularies = Vocabularies(self._client)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Release the connections held by this client"""
+        close = getattr(self._client, 'close', None)
+        if close is not None:
+            close()
+
     @property
     def datasets(self):
         """Dataset based API operations"""
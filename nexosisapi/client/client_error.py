@@ -22,11 +22,17 @@ class ErrorResponse(object):
         return self._details
 
 
+class DeadlineExceededError(Exception):
+    """Raised when an operation does not finish within the time it was allowed"""
+    pass
+
+
 class ClientError(Exception):
-    def __init__(self, url, status, body):
+    def __init__(self, url, status, body, headers=None):
         self._url = url
         self._status = status
         self._error_details = ErrorResponse(body)
+        self._headers = headers or {}
 
     @property
     def url(self):
@@ -39,3 +45,23 @@ class ClientError(Exception):
     @property
     def error_details(self):
         return self._error_details
+
+    @property
+    def headers(self):
+        return self._headers
+
+
+class CircuitOpenError(ClientError):
+    """Raised without sending a request when the circuit breaker for its endpoints is open"""
+
+    def __init__(self, url, family):
+        super(CircuitOpenError, self).__init__(url, 503, {
+            'statusCode': 503,
+            'errorType': 'CircuitOpen',
+            'message': 'requests to %s are failing, so this request was not sent' % family
+        })
+        self._family = family
+
+    @property
+    def family(self):
+        return self._family
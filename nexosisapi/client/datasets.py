@@ -1,7 +1,94 @@
+import codecs
+import csv
+import io
+import json
+import sys
+
+from nexosisapi.columnar import read_frame, _pandas
 from nexosisapi.dataset import Dataset
 from nexosisapi.dataset_summary import DatasetSummary
 from nexosisapi.paged_list import PagedList
 from nexosisapi.list_queries import DatasetListQuery
+from .backoff import call_with_retries
+from .batching import chunks, ordered_map
+from .paging import iter_items, iter_pages, query_for_page
+
+
+def _encode_blocks(text_file, block_size=65536):
+    while True:
+        block = text_file.read(block_size)
+        if not block:
+            return
+        yield block.encode('utf-8')
+
+
+# the python 2 csv module only reads and writes byte strings
+_PY2 = sys.version_info[0] < 3
+_CsvBuffer = io.BytesIO if _PY2 else io.StringIO
+
+
+def _csv_lines(csv_file):
+    # binary files are decoded by a reader that, unlike io.TextIOWrapper, does not close the caller's file
+    binary = isinstance(csv_file.read(0), bytes)
+    if _PY2:
+        return csv_file if binary else (line.encode('utf-8') for line in csv_file)
+    return codecs.getreader('utf-8')(csv_file) if binary else csv_file
+
+
+def _split_csv(csv_file, rows_per_request):
+    reader = csv.reader(_csv_lines(csv_file))
+    header = next(reader, None)
+    if header is None:
+        return
+
+    for batch in chunks(reader, rows_per_request):
+        content = _CsvBuffer()
+        writer = csv.writer(content, lineterminator='\n')
+        writer.writerow(header)
+        writer.writerows(batch)
+        yield content.getvalue(), len(batch)
+
+
+def _frame_csv(frame, rows_per_block, repeat_header):
+    # each block of rows is written to csv on its own, so only one block is ever held as text
+    for start in range(0, len(frame), rows_per_block):
+        block = frame.iloc[start:start + rows_per_block]
+        yield block.to_csv(index=False, header=repeat_header or start == 0).encode('utf-8'), len(block)
+
+
+def _frame_records(frame):
+    # pandas does the conversion of numpy values and timestamps to json types
+    return json.loads(frame.to_json(orient='records', date_format='iso'))
+
+
+def _file_writer(target):
+    # text files need the downloaded bytes decoded, which has to carry partial characters over between chunks
+    try:
+        target.write(b'')
+        return target.write
+    except TypeError:
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        return lambda chunk: target.write(decoder.decode(chunk))
+
+
+# the API returns at most this many rows in a page, whatever page size is asked for
+_MAX_PAGE_SIZE = 1000
+
+
+def _write_csv_page(chunks, write, skip_header):
+    """Write a page of csv to a file, dropping its header row when `skip_header` is set"""
+    header_pending = skip_header
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if header_pending:
+            index = chunk.find(b'\n')
+            if index < 0:
+                continue
+            chunk = chunk[index + 1:]
+            header_pending = False
+        write(chunk)
+
 
 class Datasets(object):
     """Dataset based API operations"""
@@ -9,29 +96,138 @@ class Datasets(object):
     def __init__(self, base_client):
         self._client = base_client
 
-    def create(self, dataset_name, data, metadata=None):
+    def create(self, dataset_name, data, metadata=None, chunk_size=None, workers=4, retries=3, progress=None):
         """Save data in a named dataset
 
+        When `chunk_size` is given the rows are uploaded in batches of that size, several at a time, each one
+        appended to the dataset. A batch that fails with a transient error is retried on its own, and only
+        `workers` batches are held in memory at once, so `data` may be a generator over a very large set of rows.
+
         :param str dataset_name: the name of the dataset
-        :param list data: a `list` of `dict` where each dict is the set of values in the data set.
+        :param list data: a `list` of `dict` where each dict is the set of values in the data set. When uploading in
+            chunks this may be any iterable of `dict`.
         :param dict metadata: a dict of `str` keys to `ColumnMetadata` items where the string key matches one
             of the keys from the entries in the data dicts
+        :param int chunk_size: the number of rows to send in each request, or None to send all rows in one request
+        :param int workers: the number of chunks to upload at the same time
+        :param int retries: the number of times to retry a chunk that fails with a transient error
+        :param progress: an optional function called with the total number of rows uploaded after each chunk
 
         :return: a `DatasetSummary` describing the dataset
         :rtype: DatasetSummary
         """
-        return self._create(dataset_name, {'data': data, 'columns': metadata}, 'application/json')
+        if chunk_size is None:
+            return self._create(dataset_name, {'data': data, 'columns': metadata}, 'application/json')
+
+        def bodies():
+            for index, batch in enumerate(chunks(data, chunk_size)):
+                # the metadata only needs to be set by the request creating the dataset
+                body = {'data': batch, 'columns': metadata} if index == 0 else {'data': batch}
+                yield body, len(batch)
+
+        return self._upload_chunks(dataset_name, bodies(), 'application/json', workers, retries, progress)
 
-    def create_csv(self, dataset_name, csv_file):
+    def create_csv(self, dataset_name, csv_file, rows_per_request=None, workers=4, retries=3, progress=None):
         """Save data from a CSV file in a named dataset
 
+        The file is streamed to the API rather than read into memory. When `rows_per_request` is given the file is
+        instead split on row boundaries into several uploads, each repeating the header row, which are sent several
+        at a time and retried individually on transient errors.
+
         :param str dataset_name: the name of the dataset
         :param file csv_file: an open file to read the csv data from
+        :param int rows_per_request: the number of rows to send in each request, or None to stream the whole file
+            in one request
+        :param int workers: the number of requests to send at the same time when splitting the file
+        :param int retries: the number of times to retry a part of the file that fails with a transient error
+        :param progress: an optional function called with the total number of rows uploaded after each part
+
+        :return: a `DatasetSummary` describing the dataset
+        :rtype: DatasetSummary
+        """
+        if rows_per_request is None:
+            # binary files can be handed straight to the transport; text is encoded a block at a time
+            content = csv_file if isinstance(csv_file.read(0), bytes) else _encode_blocks(csv_file)
+            return self._create(dataset_name, content, 'text/csv')
+
+        return self._upload_chunks(dataset_name, _split_csv(csv_file, rows_per_request), 'text/csv', workers,
+                                   retries, progress)
+
+    def create_from_frame(self, dataset_name, frame, metadata=None, rows_per_request=None, workers=4, retries=3,
+                          progress=None):
+        """Save the rows of a pandas DataFrame in a named dataset
+
+        The frame is written to csv a block of rows at a time as it is sent, rather than being converted to a list
+        of dicts first. When `rows_per_request` is given the blocks are sent as separate uploads, several at a
+        time, each retried on its own after a transient error. Csv cannot carry column metadata, so when
+        `metadata` is given the first block is sent as json to create the dataset with it.
+
+        :param str dataset_name: the name of the dataset
+        :param pandas.DataFrame frame: the data to save; the index is not included
+        :param dict metadata: a dict of `str` column names to `ColumnMetadata` items
+        :param int rows_per_request: the number of rows to send in each request, or None to stream the whole frame
+            in one request
+        :param int workers: the number of requests to send at the same time when splitting the frame
+        :param int retries: the number of times to retry a request that fails with a transient error
+        :param progress: an optional function called with the total number of rows uploaded after each request
 
         :return: a `DatasetSummary` describing the dataset
         :rtype: DatasetSummary
         """
-        return self._create(dataset_name, csv_file.read(), 'text/csv')
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+        if len(frame) == 0:
+            raise ValueError('there is no data to upload')
+
+        block_rows = rows_per_request or 1000
+        uploaded = 0
+        if metadata is not None:
+            first = frame.iloc[:block_rows]
+            summary = self._create_chunk(dataset_name, {'data': _frame_records(first), 'columns': metadata},
+                                         'application/json', retries)
+            uploaded = len(first)
+            if progress is not None:
+                progress(uploaded)
+            frame = frame.iloc[uploaded:]
+            if len(frame) == 0:
+                return summary
+
+        if rows_per_request is None:
+            content = (block for block, _ in _frame_csv(frame, block_rows, repeat_header=False))
+            summary = self._create(dataset_name, content, 'text/csv')
+            if progress is not None:
+                progress(uploaded + len(frame))
+            return summary
+
+        def report(count):
+            progress(uploaded + count)
+
+        return self._upload_chunks(dataset_name, _frame_csv(frame, block_rows, repeat_header=True), 'text/csv',
+                                   workers, retries, report if progress is not None else None)
+
+    def _upload_chunks(self, dataset_name, bodies, content_type, workers, retries, progress):
+        first, uploaded = next(bodies, (None, 0))
+        if first is None:
+            raise ValueError('there is no data to upload')
+
+        # the first chunk creates the dataset before the remaining chunks are appended
+        summary = self._create_chunk(dataset_name, first, content_type, retries)
+        if progress is not None:
+            progress(uploaded)
+
+        def upload(body):
+            content, count = body
+            return self._create_chunk(dataset_name, content, content_type, retries), count
+
+        for summary, count in ordered_map(upload, bodies, workers):
+            uploaded += count
+            if progress is not None:
+                progress(uploaded)
+
+        return summary
+
+    def _create_chunk(self, dataset_name, content, content_type, retries):
+        return call_with_retries(lambda: self._create(dataset_name, content, content_type), retries)
 
     def _create(self, dataset_name, content, content_type):
         if dataset_name is None:
@@ -70,34 +266,148 @@ class Datasets(object):
         if dataset_name is None:
             raise ValueError('dataset_name is required and was not provided')
 
+        return Dataset(self._get_page(dataset_name, page_number, page_size, start_date, end_date, include))
+
+    def _get_page(self, dataset_name, page_number, page_size, start_date, end_date, include):
         params = Datasets.process_parameters(page_number, page_size, start_date, end_date, include)
 
-        dataset = self._client.request('GET', '/data/%s' % dataset_name, params=params)
+        return self._client.request('GET', '/data/%s' % dataset_name, params=params)
 
-        return Dataset(dataset)
+    def get_all(self, dataset_name, workers=4, page_size=1000, start_date=None, end_date=None, include=None):
+        """Get all of the data stored in a data set, downloading several pages at once
+
+        The first page is read to find the number of pages, then the rest are fetched by `workers` threads and
+        reassembled in order. To process the rows as they arrive instead of holding them all, use `iter_all` with
+        `prefetch` set.
+
+        :param str dataset_name: name of the dataset
+        :param int workers: the number of pages to download at the same time
+        :param int page_size: count of rows to retrieve in each request (default 1000, max 1000).
+        :param datetime start_date: the first date to return in the response
+        :param datetime end_date: the last date to return in the response
+        :param include: string or array of strings specifying the names of the columns from the dataset to return
+        :return: a `Dataset` holding every row as a single page
+        :rtype: Dataset
+        """
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+
+        pages = iter_pages(lambda page: self._get_page(dataset_name, page, page_size, start_date, end_date, include),
+                           lambda response: response.get('totalPages', 0), max(workers - 1, 0))
+        first = next(pages)
+        data = list(first.get('data') or [])
+        for page in pages:
+            data.extend(page.get('data') or [])
+
+        return Dataset({
+            'data': data,
+            'columns': first.get('columns', {}),
+            'links': first.get('links'),
+            'pageNumber': 0,
+            'totalPages': 1,
+            'pageSize': len(data),
+            'totalCount': len(data)
+        })
+
+    def iter_list(self, dataset_list_query=None, prefetch=2):
+        """Iterate over every saved dataset, optionally filtering by name, fetching pages as needed
+
+        :param DatasetListQuery dataset_list_query: query options to limit results of the request; the page number
+            is ignored and the page size defaults to 1000
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of DatasetSummary objects
+        """
+        query = dataset_list_query or DatasetListQuery(page_size=1000)
+        return iter_items(lambda page: self.list(query_for_page(query, page)), lambda listing: listing,
+                          lambda listing: listing.total_pages, prefetch)
+
+    def iter_all(self, dataset_name, page_size=1000, start_date=None, end_date=None, include=None, prefetch=2):
+        """Iterate over all of the rows stored in a data set, fetching pages as needed
+
+        :param str dataset_name: name of the dataset
+        :param int page_size: count of rows to retrieve in each request (default 1000, max 1000).
+        :param datetime start_date: the first date to return
+        :param datetime end_date: the last date to return
+        :param include: string or array of strings specifying the names of the columns from the dataset to return
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of `dict` rows
+        """
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+
+        return iter_items(lambda page: self.get(dataset_name, page, page_size, start_date, end_date, include),
+                          lambda dataset: dataset.data or [], lambda dataset: dataset.total_pages, prefetch)
 
     def get_csv(self, dataset_name, csv_file, page_number=0, page_size=50, start_date=None, end_date=None,
-                include=None):
+                include=None, all_pages=False):
         """Get the data stored in a data set, and write it to a file
 
+        The response is written to the file as it downloads, so memory use does not grow with the size of the data.
+
         :param str dataset_name: name of the dataset
-        :param FileIO csv_file: an open, writeable text file to save the data to
+        :param FileIO csv_file: an open, writeable text or binary file to save the data to
         :param int page_number: zero-based page number of results to retrieve
         :param int page_size: count of results to retrieve in each page (default 50, max 1000).
         :param datetime start_date: the first date to return in the response
         :param datetime end_date: the last date to return in the response
         :param include: string or array of strings specifying the names of the columns from the dataset to return
+        :param bool all_pages: write every page from `page_number` onwards, with a single header row; the number
+            of pages is learned from the row count the API reports, and page sizes above 1000 are reduced to 1000
         """
         if dataset_name is None:
             raise ValueError('dataset_name is required and was not provided')
         if csv_file is None:
             raise ValueError('csv_file is required and was not provided')
 
-        params = Datasets.process_parameters(page_number, page_size, start_date, end_date, include)
+        last_page = page_number
+        if all_pages:
+            page_size = min(page_size, _MAX_PAGE_SIZE)
+            total = self._get_page(dataset_name, 0, 1, start_date, end_date, include).get('totalCount', 0)
+            last_page = max(last_page, -(-total // page_size) - 1)
+
+        write = _file_writer(csv_file)
+        for number in range(page_number, last_page + 1):
+            params = Datasets.process_parameters(number, page_size, start_date, end_date, include)
+            body = self._client.stream('GET', '/data/%s' % dataset_name, params=params,
+                                       headers={'Accept': 'text/csv'})
+            _write_csv_page(body, write, skip_header=number > page_number)
+
+    def get_frame(self, dataset_name, page_size=1000, workers=4, start_date=None, end_date=None, include=None,
+                  dtypes=None):
+        """Get all of the data stored in a data set as a pandas DataFrame
+
+        The pages are downloaded as csv, several at a time, and each is read by pandas as soon as it arrives, so the
+        rows are never held as a list of dicts and only the pages in flight are held as text. Column types come from the dataset's column metadata, see
+        `nexosisapi.columnar.read_frame`.
+
+        :param str dataset_name: name of the dataset
+        :param int page_size: count of rows to retrieve in each request (default 1000, max 1000).
+        :param int workers: the number of pages to download at the same time
+        :param datetime start_date: the first date to return
+        :param datetime end_date: the last date to return
+        :param include: string or array of strings specifying the names of the columns from the dataset to return
+        :param dict dtypes: dtypes to use for some columns in place of the ones chosen from the metadata
+        :rtype: pandas.DataFrame
+        """
+        if dataset_name is None:
+            raise ValueError('dataset_name is required and was not provided')
+
+        # a single row is enough to learn the column metadata and the number of rows
+        probe = self._get_page(dataset_name, 0, 1, start_date, end_date, include)
+        metadata = Dataset(probe).metadata
+        total = probe.get('totalCount', 0)
+        if not total:
+            return read_frame(io.StringIO(u','.join(metadata) + u'\n'), metadata, dtypes)
 
-        data = self._client.request('GET', '/data/%s' % dataset_name, params=params, headers={'Accept': 'text/csv'})
+        def fetch(page_number):
+            params = Datasets.process_parameters(page_number, page_size, start_date, end_date, include)
+            page = b''.join(self._client.stream('GET', '/data/%s' % dataset_name, params=params,
+                                                headers={'Accept': 'text/csv'}))
+            return read_frame(io.BytesIO(page), metadata, dtypes)
 
-        csv_file.write(data)
+        page_size = min(page_size, _MAX_PAGE_SIZE)
+        frames = list(ordered_map(fetch, range(-(-total // page_size)), workers))
+        return _pandas().concat(frames, ignore_index=True)
 
     def remove(self, dataset_name, start_date=None, end_date=None, cascade=None):
         """Delete a dataset by name
@@ -0,0 +1,92 @@
+import contextlib
+import functools
+import threading
+import time
+
+from .client_error import DeadlineExceededError
+
+_local = threading.local()
+
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """Limit the total time spent on the API calls made within a block
+
+    Every request made inside the block, including those made by pagination, session waits and chunked uploads, has
+    its read timeout cut to the time left, and once the time is spent no more requests are sent and
+    `DeadlineExceededError` is raised instead. Deadlines nest, the earliest one applying, and carry over to the
+    worker threads used by operations such as `Datasets.get_all`. This is how to give a single operation, such as
+    `client.models.predict(...)`, a shorter time limit than the client's default timeout.
+
+    :param float seconds: the time allowed for the block; None for no limit
+    """
+    stack = _stack()
+    expires = None if seconds is None else time.time() + seconds
+    current = stack[-1] if stack else None
+    if current is not None and (expires is None or current < expires):
+        expires = current
+    stack.append(expires)
+    try:
+        yield
+    finally:
+        stack.pop()
+
+
+def expires_at():
+    """The time, as returned by `time.time`, when the current deadline ends, or None if there is no deadline"""
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+def remaining():
+    """The seconds left before the current deadline, which may be negative, or None if there is no deadline"""
+    expires = expires_at()
+    return None if expires is None else expires - time.time()
+
+
+def check(action='the operation'):
+    """Raise `DeadlineExceededError` if the current deadline has passed
+
+    :param str action: describes the work that was not done, for the error message
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError('deadline exceeded before %s' % action)
+
+
+def sleep(seconds, action='the operation'):
+    """Wait before doing more work, unless it would end after the current deadline
+
+    :param float seconds: the time to wait
+    :param str action: describes the work that would be done after waiting, for the error message
+    :raises DeadlineExceededError: at once, rather than after waiting, when the deadline would pass first
+    """
+    left = remaining()
+    if left is not None and left <= seconds:
+        raise DeadlineExceededError('deadline would be exceeded before %s' % action)
+    time.sleep(seconds)
+
+
+def propagate(func):
+    """Wrap a function so that, when called on another thread, it runs under the caller's current deadline"""
+    expires = expires_at()
+    if expires is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = _stack()
+        stack.append(expires)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stack.pop()
+
+    return wrapper
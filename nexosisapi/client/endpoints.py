@@ -0,0 +1,32 @@
+def endpoint_family(uri_path):
+    """Get the group of API endpoints a request path belongs to
+
+    Requests are grouped by their first path segment, such as 'data', 'sessions' or 'views', except that
+    predictions ('models/*/predict') are kept apart from the rest of 'models'.
+
+    :param str uri_path: the path of a request, relative to the base uri
+    :rtype: str
+    """
+    parts = uri_path.split('?', 1)[0].strip('/').split('/')
+    if parts[0] == 'models' and len(parts) > 2 and parts[2] == 'predict':
+        return 'models/*/predict'
+    return parts[0]
+
+
+# the only fixed names that follow a collection in a path; anything else there is the id of a resource
+_ACTIONS = frozenset(['forecast', 'impact', 'model', 's3', 'url', 'azure'])
+
+
+def path_template(uri_path):
+    """Get a request path with the ids of resources replaced by '{id}', e.g. 'sessions/{id}/results'
+
+    Paths of the same shape share a template, so they can be grouped when measuring requests.
+
+    :param str uri_path: the path of a request, relative to the base uri
+    :rtype: str
+    """
+    parts = uri_path.split('?', 1)[0].strip('/').split('/')
+    for i in range(1, len(parts)):
+        if (i == 1 and parts[i] not in _ACTIONS) or parts[i - 1] == 'contestants':
+            parts[i] = '{id}'
+    return '/'.join(parts)
@@ -0,0 +1,165 @@
+from nexosisapi.column_metadata import ColumnType
+from nexosisapi.columnar import to_columns, _numpy
+from .paging import iter_pages
+
+FORMATS = ('parquet', 'feather')
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('pyarrow is required to export data, install it with `pip install pyarrow`')
+    return pyarrow
+
+
+def _arrow_type(column):
+    pyarrow = _pyarrow()
+    data_type = column.data_type if column is not None else None
+    if data_type in (ColumnType.numeric, ColumnType.numericMeasure):
+        return pyarrow.float64()
+    if data_type == ColumnType.logical:
+        return pyarrow.bool_()
+    if data_type == ColumnType.date:
+        return pyarrow.timestamp('ns', tz='UTC')
+    return pyarrow.string()
+
+
+def arrow_schema(metadata, columns):
+    """Build the arrow schema for data with the given column metadata
+
+    Numeric columns are float64, logical columns bool, date columns UTC timestamps, and anything else strings. Missing
+    values are written as nulls.
+
+    :param dict metadata: the ColumnMetadata for each column
+    :param list columns: the names of the columns, in order
+    :rtype: pyarrow.Schema
+    """
+    return _pyarrow().schema([(name, _arrow_type(metadata.get(name))) for name in columns])
+
+
+def record_batch(rows, metadata, schema):
+    """Convert rows of data into an arrow record batch
+
+    :param list rows: the rows, each a dict of column name to value
+    :param dict metadata: the ColumnMetadata for each column
+    :param pyarrow.Schema schema: the schema of the batch, see `arrow_schema`
+    :rtype: pyarrow.RecordBatch
+    """
+    pyarrow = _pyarrow()
+    arrays = to_columns(rows, metadata, columns=schema.names)
+    converted = []
+    for field in schema:
+        values = arrays[field.name]
+        if pyarrow.types.is_string(field.type):
+            values = [None if value is None else str(value) for value in values]
+            converted.append(pyarrow.array(values, type=field.type))
+        elif pyarrow.types.is_boolean(field.type):
+            # missing logical values are None, and are written as nulls rather than as false
+            missing = _numpy().array([value is None for value in values], dtype=bool)
+            values = [bool(value) if value is not None else False for value in values]
+            converted.append(pyarrow.array(values, type=field.type, mask=missing))
+        else:
+            converted.append(pyarrow.array(values, type=field.type, from_pandas=True))
+    return pyarrow.RecordBatch.from_arrays(converted, schema=schema)
+
+
+def _open_writer(path, schema, format):
+    pyarrow = _pyarrow()
+    if format == 'parquet':
+        import pyarrow.parquet
+        return pyarrow.parquet.ParquetWriter(path, schema)
+    # feather version 2 is the arrow ipc file format
+    return pyarrow.ipc.new_file(path, schema)
+
+
+def export_pages(pages, path, format='parquet'):
+    """Write pages of data to a parquet or feather file, one page at a time
+
+    The schema is taken from the first page, so only one page needs to be held in memory at once.
+
+    :param pages: an iterable of (rows, metadata) pairs, where rows is a list of dicts and metadata is the
+        ColumnMetadata for each column
+    :param str path: the file to write, or any file-like object pyarrow accepts
+    :param str format: 'parquet' or 'feather'
+    :return: the number of rows written
+    :rtype: int
+    """
+    if format not in FORMATS:
+        raise ValueError('format must be one of %s' % ', '.join(FORMATS))
+
+    writer = None
+    schema = None
+    metadata = None
+    written = 0
+    try:
+        for rows, page_metadata in pages:
+            rows = rows or []
+            if writer is None:
+                metadata = page_metadata or {}
+                columns = list(metadata)
+                columns.extend(name for name in (rows[0] if rows else {}) if name not in metadata)
+                schema = arrow_schema(metadata, columns)
+                writer = _open_writer(path, schema, format)
+            if rows:
+                writer.write_batch(record_batch(rows, metadata, schema))
+                written += len(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def _pages(fetch, total_pages, workers):
+    return iter_pages(fetch, total_pages, max(workers - 1, 0))
+
+
+def export_dataset(client, dataset_name, path, format='parquet', page_size=1000, workers=4, start_date=None,
+                   end_date=None, include=None):
+    """Write all of the data in a data set to a parquet or feather file
+
+    Pages are downloaded `workers` at a time and written as they arrive, so memory use is bounded by a few pages
+    rather than the size of the data set.
+
+    :param Client client: the client to download the data with
+    :param str dataset_name: name of the dataset
+    :param str path: the file to write
+    :param str format: 'parquet' or 'feather'
+    :param int page_size: count of rows to retrieve in each request (default 1000, max 1000).
+    :param int workers: the number of pages to download at the same time
+    :param datetime start_date: the first date to export
+    :param datetime end_date: the last date to export
+    :param include: string or array of strings specifying the names of the columns from the dataset to export
+    :return: the number of rows written
+    :rtype: int
+    """
+    pages = _pages(lambda page: client.datasets.get(dataset_name, page, page_size, start_date, end_date, include),
+                   lambda dataset: dataset.total_pages, workers)
+    return export_pages(((dataset.data, dataset.metadata) for dataset in pages), path, format)
+
+
+def export_view(client, view_name, path, format='parquet', page_size=1000, workers=4, start_date=None,
+                end_date=None, include=None):
+    """Write all of the data in a view to a parquet or feather file, see `export_dataset`
+
+    :param Client client: the client to download the data with
+    :param str view_name: name of the view
+    :return: the number of rows written
+    :rtype: int
+    """
+    pages = _pages(lambda page: client.views.get(view_name, page, page_size, start_date, end_date, include),
+                   lambda view: view.total_pages, workers)
+    return export_pages(((view.data, view.column_metadata) for view in pages), path, format)
+
+
+def export_session_results(client, session_id, path, format='parquet', page_size=1000, workers=4):
+    """Write all of the results of a session to a parquet or feather file, see `export_dataset`
+
+    :param Client client: the client to download the results with
+    :param str session_id: the session to export results for
+    :return: the number of rows written
+    :rtype: int
+    """
+    pages = _pages(lambda page: client.sessions.get_results(session_id, page, page_size),
+                   lambda result: result.total_pages, workers)
+    return export_pages(((result.data, result.column_metadata) for result in pages), path, format)
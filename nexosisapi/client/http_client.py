@@ -1,18 +1,20 @@
-from datetime import datetime, date
-from enum import Enum
-import json
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from . import deadline
+from .client_error import ClientError, DeadlineExceededError
+from .instrumentation import RequestEvent, body_size
+from .serialization import get_dumps
 
-from nexosisapi.column_metadata import ColumnMetadata
-from nexosisapi.view_definition import ViewDefinition
-from nexosisapi.join import Join
-from nexosisapi.column_options import ColumnOptions
-from .client_error import ClientError
+DEFAULT_TIMEOUT = (10.0, 120.0)
 
 
 def _process_response(response):
     if len(response.content) == 0:
-        return None, 0, None
+        return None, response.status_code, response.headers
 
     # content type is probably something like 'application/json; charset: utf-8', so this processes that
     content_type_value = response.headers['content-type']
@@ -24,38 +26,21 @@ def _process_response(response):
         return response.content, response.status_code, response.headers
 
 
-def _json_encode(obj):
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if isinstance(obj, ColumnMetadata):
-        val = {'dataType': obj.data_type, 'role': obj.role}
-        if obj.imputation is not None:
-            val['imputation'] = obj.imputation
-        if obj.aggregation is not None:
-            val['aggregation'] = obj.aggregation
-        return val
-    if isinstance(obj, Enum):
-        return obj.name
-    if isinstance(obj, ViewDefinition):
-        return {
-            'viewName': obj.view_name,
-            'dataSetName': obj.dataset_name,
-            'columns': obj.column_metadata,
-            'joins': obj.joins
-        }
-    if isinstance(obj, Join):
-        return obj.to_hash()
-    if isinstance(obj, ColumnOptions):
-        return {
-            'joinInterval': obj.join_interval
-        }
-    raise TypeError("Type %s not serializable" % type(obj))
+def _error_body(response):
+    # HEAD requests, and some gateway errors, carry no json body to describe the error
+    try:
+        return response.json()
+    except ValueError:
+        return {}
+
 
+class BaseHttpClient(object):
+    """Request building shared by the synchronous and asynchronous transports"""
 
-class HttpClient(object):
-    def __init__(self, key, uri):
+    def __init__(self, key, uri, json_backend='json'):
         self._key = key
         self._uri = uri[0:-1] if uri.endswith('/') else uri
+        self._dumps = get_dumps(json_backend)
 
     def _generate_headers(self):
         return {
@@ -83,17 +68,254 @@ class HttpClient(object):
 
         # copy data to json for proper serialization
         if 'data' in args and args['headers']['Content-Type'] == 'application/json':
-            args['data'] = json.dumps(args['data'], default=_json_encode)
+            args['data'] = self._dumps(args['data'])
 
         return args
 
+
+class HttpClient(BaseHttpClient):
+    def __init__(self, key, uri, pool_connections=10, pool_maxsize=10, pool_block=False, idle_timeout=None,
+                 json_backend='json', retry_policy=None, rate_limiter=None, circuit_breaker=None,
+                 timeout=DEFAULT_TIMEOUT, instruments=None):
+        """Create the transport used by all of the API operations
+
+        Connections are kept alive and reused between calls from a pool shared by every thread using this client.
+
+        :param str key: the api key sent with each request
+        :param str uri: the base uri of the API
+        :param int pool_connections: the number of host connection pools to keep
+        :param int pool_maxsize: the maximum number of connections kept open to a single host
+        :param bool pool_block: when True, callers wait for a free connection instead of opening one past
+            pool_maxsize
+        :param float idle_timeout: seconds a pool may sit unused before its connections are dropped and
+            re-established; None keeps them open until `close` is called
+        :param str json_backend: the library used to encode request bodies: 'json', 'orjson', 'ujson' or 'auto'
+        :param RetryPolicy retry_policy: which failed requests to send again, and when; None to raise the first
+            failure
+        :param RateLimiter rate_limiter: paces requests, shared by every thread using this client; None to send
+            requests as soon as they are made
+        :param CircuitBreaker circuit_breaker: fails requests at once, without sending them, to endpoints that are
+            failing; None to always send requests
+        :param timeout: the seconds to wait for a connection and then for each read of the response, either as a
+            (connect, read) tuple or one number for both. The operations of `Client` do not take a timeout of their
+            own; wrap one in a `deadline` block to bound it, which cuts the timeouts of its requests to the time left.
+        :param instruments: `Instrument` objects told about every request, such as a `HistogramCollector`
+        """
+        super(HttpClient, self).__init__(key, uri, json_backend)
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._timeout = timeout
+        self._instruments = list(instruments or [])
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._idle_timeout = idle_timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._in_flight = 0
+        self._last_used = None
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize,
+                              pool_block=self._pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _acquire_session(self):
+        with self._session_lock:
+            now = time.time()
+            if self._session is not None and self._in_flight == 0 and self._idle_timeout is not None \
+                    and self._last_used is not None and now - self._last_used > self._idle_timeout:
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._new_session()
+            self._in_flight += 1
+            self._last_used = now
+            return self._session
+
+    def _release_session(self):
+        with self._session_lock:
+            self._in_flight -= 1
+            self._last_used = time.time()
+
+    def close(self):
+        """Close all pooled connections. The client may still be used afterwards, and will reconnect as needed."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    @property
+    def rate_limiter(self):
+        return self._rate_limiter
+
+    @property
+    def circuit_breaker(self):
+        return self._circuit_breaker
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @property
+    def instruments(self):
+        """The `Instrument` objects told about every request; add to or remove from this list to change them"""
+        return self._instruments
+
+    def _begin(self, verb, uri_path, args):
+        if not self._instruments:
+            return None
+        event = RequestEvent(verb, uri_path, body_size(args.get('data')))
+        self._notify('before_request', event)
+        return event
+
+    def _notify(self, hook, event):
+        for instrument in self._instruments:
+            getattr(instrument, hook)(event)
+
+    def _observed(self, event, func):
+        # wraps the circuit breaker too, so that requests it fails at once are reported as errors
+        if event is None:
+            return func()
+        try:
+            result = func()
+        except Exception as e:
+            event.error = e
+            self._notify('on_error', event)
+            raise
+        self._notify('after_response', event)
+        return result
+
+    @staticmethod
+    def _time_response(event, response, started, sent, received):
+        event.status = response.status_code
+        event.timings['rate_limit'] = sent - started
+        # requests records the time until the headers arrived; the rest was spent reading the body
+        elapsed = getattr(response, 'elapsed', None)
+        wait = received - sent if elapsed is None else min(elapsed.total_seconds(), received - sent)
+        event.timings['wait'] = wait
+        event.timings['download'] = received - sent - wait
+
+    def _timed_args(self, uri_path, args):
+        deadline.check('requesting %s' % uri_path)
+        timeout = args.get('timeout', self._timeout)
+        left = deadline.remaining()
+        if left is not None:
+            connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            timeout = (left if connect is None else min(connect, left), left if read is None else min(read, left))
+        return dict(args, timeout=timeout)
+
+    @staticmethod
+    def _timed_out(uri_path):
+        # a request cut short by the deadline is reported as such, not as a failure of the endpoint
+        left = deadline.remaining()
+        if left is not None and left <= 0:
+            return DeadlineExceededError('deadline exceeded while requesting %s' % uri_path)
+        return None
+
     def request_with_headers(self, verb, uri_path, **kwargs):
-        response = requests.request(verb, self._get_uri(uri_path), **self._process_args(kwargs))
-        if response.ok:
-            return _process_response(response)
-        else:
-            error = response.json()
-            raise ClientError(uri_path, response.status_code, error)
+        args = self._process_args(kwargs)
+        if self._retry_policy is None:
+            return self._send(verb, uri_path, args)
+        return self._retry_policy.call(verb, lambda: self._send(verb, uri_path, args), args.get('data'))
+
+    def _send(self, verb, uri_path, args):
+        event = self._begin(verb, uri_path, args)
+
+        return self._observed(event, lambda: self._send_once(verb, uri_path, args, event))
+
+    def _send_once(self, verb, uri_path, args, event):
+        session = self._acquire_session()
+        try:
+            response = self._open(session, verb, uri_path, args, event)
+        finally:
+            self._release_session()
+        received = time.time()
+        result = _process_response(response)
+        if event is not None:
+            event.timings['decode'] = time.time() - received
+        return result
+
+    def _open(self, session, verb, uri_path, args, event, stream=False):
+        # only the request itself is timed for the circuit breaker; waiting for the rate limiter is client side pacing
+        breaker = self._circuit_breaker
+        family = breaker.allow(uri_path) if breaker is not None else None
+        started = time.time()
+        try:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            args = self._timed_args(uri_path, args)
+        except Exception:
+            if breaker is not None:
+                breaker.cancel(family)
+            raise
+
+        extra = {'stream': True} if stream else {}
+        sent = time.time()
+        try:
+            response = session.request(verb, self._get_uri(uri_path), **dict(args, **extra))
+        except Exception as e:
+            error = self._timed_out(uri_path) if isinstance(e, requests.exceptions.Timeout) else None
+            if breaker is not None:
+                breaker.record(family, error or e, time.time() - sent)
+            if error is None:
+                raise
+            raise error
+        received = time.time()
+
+        if event is not None:
+            self._time_response(event, response, started, sent, received)
+            if not stream:
+                event.response_bytes = len(response.content)
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(response.status_code, response.headers)
+        error = None
+        if not response.ok:
+            error = ClientError(uri_path, response.status_code, _error_body(response), response.headers)
+        if breaker is not None:
+            breaker.record(family, error, received - sent)
+        if error is not None:
+            if stream:
+                response.close()
+            raise error
+        return response
+
+    def stream(self, verb, uri_path, chunk_size=65536, **kwargs):
+        """Make a request, yielding the body of the response in chunks as it downloads rather than all at once
+
+        :param str verb: the http verb
+        :param str uri_path: the path of the request relative to the base uri
+        :param int chunk_size: the largest number of bytes to yield at a time
+        """
+        args = self._process_args(kwargs)
+
+        # the body is read by the caller, so only the time until the response starts is measured
+        def open_response():
+            event = self._begin(verb, uri_path, args)
+            return self._observed(event, lambda: self._open(session, verb, uri_path, args, event, stream=True))
+
+        session = self._acquire_session()
+        try:
+            # only opening the response is retried; once chunks have been yielded the download cannot start over
+            if self._retry_policy is None:
+                response = open_response()
+            else:
+                response = self._retry_policy.call(verb, open_response, args.get('data'))
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    yield chunk
+            finally:
+                response.close()
+        finally:
+            self._release_session()
 
     # TODO: should be a better way to do this re: the 'verb' argument
     def request(self, verb, uri_path, **kwargs):
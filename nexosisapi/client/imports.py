@@ -1,6 +1,7 @@
 from nexosisapi.import_response import ImportResponse
 from nexosisapi.paged_list import PagedList
 from nexosisapi.list_queries import ImportListQuery
+from .paging import iter_items, query_for_page
 
 class Imports(object):
     def __init__(self, client):
@@ -12,6 +13,18 @@ class Imports(object):
             [ImportResponse(r) for r in response.get('items', [])],
             response)
 
+    def iter_list(self, import_list_query=None, prefetch=2):
+        """
+        Iterate over every import, optionally filtered on import properties, fetching pages as needed
+        :param import_list_query: options to limit the results; the page number is ignored and the page size
+            defaults to 1000
+        :param prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of ImportResponse
+        """
+        query = import_list_query or ImportListQuery(page_size=1000)
+        return iter_items(lambda page: self.list(query_for_page(query, page)), lambda listing: listing,
+                          lambda listing: listing.total_pages, prefetch)
+
     def import_from_s3(self, dataset_name, bucket_name, path, region='us-east-1', creds = None, metadata=None):
         """
         Import a json or csv file (optionally g-zipped) from AWS S3 as a dataset
@@ -0,0 +1,268 @@
+import bisect
+import threading
+import time
+from collections import OrderedDict
+
+from .endpoints import path_template
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000, 100000000)
+
+
+def body_size(body):
+    """The size of a request body, or None if it is a file or generator whose size is not known up front"""
+    if body is None:
+        return 0
+    try:
+        return len(body)
+    except TypeError:
+        return None
+
+
+class RequestEvent(object):
+    """Describes one request sent by `HttpClient`, as it is passed to each `Instrument`
+
+    `timings` holds the seconds spent in each phase of the request, in order:
+
+    - 'rate_limit': waiting for the rate limiter
+    - 'wait': connecting, sending the request and waiting for the server to respond with its headers
+    - 'download': reading the body of the response
+    - 'decode': parsing the body of the response
+
+    `requests` reports connecting and the server's own time together, so they share the 'wait' phase.
+    """
+
+    __slots__ = ('_verb', '_path', '_template', '_started', 'status', 'request_bytes', 'response_bytes', 'timings',
+                 'error')
+
+    def __init__(self, verb, path, request_bytes=None):
+        self._verb = verb.upper()
+        self._path = path
+        self._template = path_template(path)
+        self._started = time.time()
+        self.status = None
+        self.request_bytes = request_bytes
+        self.response_bytes = None
+        self.timings = OrderedDict()
+        self.error = None
+
+    @property
+    def verb(self):
+        return self._verb
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def template(self):
+        """The path with the ids of resources replaced, e.g. 'sessions/{id}/results'"""
+        return self._template
+
+    @property
+    def started(self):
+        return self._started
+
+    @property
+    def duration(self):
+        """The seconds spent on the request: the sum of its timed phases, or the time since it started if none were"""
+        return sum(self.timings.values()) if self.timings else time.time() - self._started
+
+    def __repr__(self):
+        return 'RequestEvent(verb=%r, template=%r, status=%r, duration=%r)' % (
+            self._verb, self._template, self.status, self.duration)
+
+
+class Instrument(object):
+    """Receives events for every request sent by an `HttpClient`; override the methods of interest
+
+    The methods are called on the thread sending the request, so they should be quick and thread safe. Errors they
+    raise are not caught.
+    """
+
+    def before_request(self, event):
+        """Called before a request is sent, including before waiting for the rate limiter
+
+        :param RequestEvent event: the request, without a status or timings yet
+        """
+        pass
+
+    def after_response(self, event):
+        """Called after a successful response has been read and decoded, or for `HttpClient.stream` as soon as the
+        response starts, before its body is read
+
+        :param RequestEvent event: the request, with its status, response size and timings
+        """
+        pass
+
+    def on_error(self, event):
+        """Called when a request fails, either with an error response or because no response was received
+
+        :param RequestEvent event: the request, with `error` set, and the status of the response if there was one
+        """
+        pass
+
+
+class Histogram(object):
+    """Counts observed values into cumulative buckets, like a Prometheus histogram"""
+
+    def __init__(self, buckets=DURATION_BUCKETS):
+        """
+        :param buckets: the ascending upper bounds of the buckets; a bucket for larger values is added
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    @property
+    def buckets(self):
+        return self._buckets
+
+    @property
+    def sum(self):
+        return self._sum
+
+    @property
+    def count(self):
+        return self._count
+
+    def observe(self, value):
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def cumulative(self):
+        """Get (upper bound, count of values at or below it) for each bucket, ending with infinity"""
+        total = 0
+        result = []
+        for bound, count in zip(self._buckets + (float('inf'),), self._counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q):
+        """Estimate a quantile, such as 0.99, as the upper bound of the bucket it falls in
+
+        :return: the estimate, infinity when it falls past the last bucket, or None when nothing was observed
+        """
+        if self._count == 0:
+            return None
+        rank = q * self._count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+
+
+class HistogramCollector(Instrument):
+    """Keeps histograms of the time and size of requests, grouped by verb and path template
+
+    Durations are kept for the whole request ('total') and for each phase, see `RequestEvent`. Pass the collector
+    to `to_prometheus` to export them.
+    """
+
+    def __init__(self, duration_buckets=DURATION_BUCKETS, size_buckets=SIZE_BUCKETS):
+        """
+        :param duration_buckets: the upper bounds, in seconds, of the buckets for durations
+        :param size_buckets: the upper bounds, in bytes, of the buckets for request and response sizes
+        """
+        self._duration_buckets = duration_buckets
+        self._size_buckets = size_buckets
+        self._durations = {}
+        self._sizes = {}
+        self._requests = {}
+        self._lock = threading.Lock()
+
+    def after_response(self, event):
+        self._record(event, event.status)
+
+    def on_error(self, event):
+        self._record(event, 'error' if event.status is None else event.status)
+
+    def _record(self, event, status):
+        key = (event.verb, event.template)
+        with self._lock:
+            self._requests[key + (str(status),)] = self._requests.get(key + (str(status),), 0) + 1
+            self._observe(self._durations, key + ('total',), event.duration, self._duration_buckets)
+            for phase, seconds in event.timings.items():
+                self._observe(self._durations, key + (phase,), seconds, self._duration_buckets)
+            for direction, size in (('request', event.request_bytes), ('response', event.response_bytes)):
+                if size is not None:
+                    self._observe(self._sizes, key + (direction,), size, self._size_buckets)
+
+    @staticmethod
+    def _observe(histograms, key, value, buckets):
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(buckets)
+        histogram.observe(value)
+
+    @property
+    def durations(self):
+        """Histograms of seconds, keyed by (verb, template, phase), where phase 'total' covers the whole request"""
+        with self._lock:
+            return dict(self._durations)
+
+    @property
+    def sizes(self):
+        """Histograms of bytes, keyed by (verb, template, direction), where direction is 'request' or 'response'"""
+        with self._lock:
+            return dict(self._sizes)
+
+    @property
+    def requests(self):
+        """Numbers of requests, keyed by (verb, template, status), where status is 'error' if there was no response"""
+        with self._lock:
+            return dict(self._requests)
+
+    def clear(self):
+        with self._lock:
+            self._durations.clear()
+            self._sizes.clear()
+            self._requests.clear()
+
+
+def _labels(**labels):
+    return ','.join('%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                    for name, value in sorted(labels.items()))
+
+
+def _bound(value):
+    return '+Inf' if value == float('inf') else repr(float(value))
+
+
+def _histogram_lines(name, histograms, label_names):
+    lines = []
+    for key in sorted(histograms):
+        histogram = histograms[key]
+        labels = dict(zip(label_names, key))
+        for bound, total in histogram.cumulative():
+            lines.append('%s_bucket{%s} %d' % (name, _labels(le=_bound(bound), **labels), total))
+        lines.append('%s_sum{%s} %r' % (name, _labels(**labels), float(histogram.sum)))
+        lines.append('%s_count{%s} %d' % (name, _labels(**labels), histogram.count))
+    return lines
+
+
+def to_prometheus(collector, prefix='nexosis_client'):
+    """Write the measurements of a `HistogramCollector` in the Prometheus text exposition format
+
+    :param HistogramCollector collector: the measurements to write
+    :param str prefix: the start of each metric name
+    :rtype: str
+    """
+    lines = ['# HELP %s_requests_total Requests sent to the Nexosis API' % prefix,
+             '# TYPE %s_requests_total counter' % prefix]
+    requests = collector.requests
+    for verb, template, status in sorted(requests):
+        lines.append('%s_requests_total{%s} %d' % (prefix, _labels(verb=verb, path=template, status=status),
+                                                   requests[(verb, template, status)]))
+
+    lines.extend(['# HELP %s_request_duration_seconds Time spent on requests, in total and by phase' % prefix,
+                  '# TYPE %s_request_duration_seconds histogram' % prefix])
+    lines.extend(_histogram_lines('%s_request_duration_seconds' % prefix, collector.durations,
+                                  ('verb', 'path', 'phase')))
+
+    lines.extend(['# HELP %s_payload_bytes Size of request and response bodies' % prefix,
+                  '# TYPE %s_payload_bytes histogram' % prefix])
+    lines.extend(_histogram_lines('%s_payload_bytes' % prefix, collector.sizes, ('verb', 'path', 'direction')))
+    return '\n'.join(lines) + '\n'
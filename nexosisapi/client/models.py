@@ -1,12 +1,29 @@
 from nexosisapi.model_summary import ModelSummary, PredictResults
 from nexosisapi.paged_list import PagedList
 from nexosisapi.list_queries import ModelListQuery
+from .backoff import call_with_retries
+from .batching import chunks, ordered_map
+from .paging import iter_items, query_for_page
 
 class Models(object):
     """Model based API operations"""
 
-    def __init__(self, client):
+    def __init__(self, client, prediction_cache=None):
+        """
+        :param client: the transport to use for requests
+        :param PredictionCache prediction_cache: remembers predictions so repeated rows are not sent again
+        """
         self._client = client
+        self._prediction_cache = prediction_cache
+
+    @property
+    def prediction_cache(self):
+        """The PredictionCache answering repeated predictions, or None to send every row to the API"""
+        return self._prediction_cache
+
+    @prediction_cache.setter
+    def prediction_cache(self, value):
+        self._prediction_cache = value
 
     def list(self, model_list_query=ModelListQuery()):
         """Get a list of all models, optionally filtered on model properties
@@ -19,6 +36,18 @@ class Models(object):
             [ModelSummary(model) for model in response.get('items', [])],
             response)
 
+    def iter_list(self, model_list_query=None, prefetch=2):
+        """Iterate over every model, optionally filtered on model properties, fetching pages as needed
+
+        :param ModelListQuery model_list_query: options to limit the results of the request; the page number is
+            ignored and the page size defaults to 1000
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of ModelSummary
+        """
+        query = model_list_query or ModelListQuery(page_size=1000)
+        return iter_items(lambda page: self.list(query_for_page(query, page)), lambda listing: listing,
+                          lambda listing: listing.total_pages, prefetch)
+
     def get_model(self, model_id):
         """Get a model by id
 
@@ -42,9 +71,48 @@ class Models(object):
         if model_id is None:
             raise ValueError('model_id is required and was not provided')
 
-        response = self._client.request('POST', 'models/%s/predict' % model_id, data={'data': features, 'extraParameters': extra_parameters})
+        return PredictResults(self._predict(model_id, features, extra_parameters))
+
+    def _predict(self, model_id, features, extra_parameters):
+        if self._prediction_cache is not None:
+            return self._prediction_cache.predict(model_id, list(features), extra_parameters,
+                                                  lambda rows: self._send_predict(model_id, rows, extra_parameters))
+        return self._send_predict(model_id, features, extra_parameters)
+
+    def _send_predict(self, model_id, features, extra_parameters):
+        return self._client.request('POST', 'models/%s/predict' % model_id,
+                                    data={'data': features, 'extraParameters': extra_parameters})
+
+    def predict_many(self, model_id, features, batch_size=1000, workers=4, retries=3, extra_parameters={}):
+        """Predicts target values for a large set of features, sending them in batches several at a time.
+
+        Only `workers` batches are held at once, so `features` may be a generator. A batch that fails with a
+        transient error is retried on its own; the predictions are returned in the order of the features.
+
+        :param str model_id: the id of the model to use for prediction
+        :param features: an iterable of dict objects with the features needed for prediction
+        :param int batch_size: the number of rows to send in each request
+        :param int workers: the number of batches to send at the same time
+        :param int retries: the number of times to retry a batch that fails with a transient error
+        :param extra_parameters: extended capability for a particular model, see `predict`
+        :return: PredictResults holding the predictions for every row
+        """
+        if model_id is None:
+            raise ValueError('model_id is required and was not provided')
+
+        def predict_batch(batch):
+            return call_with_retries(lambda: self._predict(model_id, batch, extra_parameters), retries)
+
+        merged = None
+        data = []
+        for response in ordered_map(predict_batch, chunks(features, batch_size), workers):
+            if merged is None:
+                merged = dict(response)
+            data.extend(response.get('data') or [])
 
-        return PredictResults(response)
+        merged = merged or {'modelId': model_id}
+        merged['data'] = data
+        return PredictResults(merged)
 
 
     def remove(self, model_id):
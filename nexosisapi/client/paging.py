@@ -0,0 +1,40 @@
+import copy
+
+from .batching import ordered_map
+
+
+def iter_pages(fetch_page, total_pages, prefetch=2, start_page=0):
+    """Lazily iterate over every page of a paged request
+
+    The first page is fetched on its own to learn how many pages there are; after that up to `prefetch` of the
+    following pages are downloaded in the background while the caller works on the current one. Pages are always
+    yielded in order.
+
+    :param fetch_page: a function taking a zero-based page number and returning that page
+    :param total_pages: a function taking a page and returning the total number of pages
+    :param int prefetch: the number of pages to download ahead of the one being consumed
+    :param int start_page: the page to start from
+    """
+    first = fetch_page(start_page)
+    yield first
+
+    remaining = range(start_page + 1, total_pages(first) or 0)
+    for page in ordered_map(fetch_page, remaining, prefetch + 1):
+        yield page
+
+
+def iter_items(fetch_page, items, total_pages, prefetch=2, start_page=0):
+    """Lazily iterate over the items on every page of a paged request, see `iter_pages`
+
+    :param items: a function taking a page and returning the items on it
+    """
+    for page in iter_pages(fetch_page, total_pages, prefetch, start_page):
+        for item in items(page):
+            yield item
+
+
+def query_for_page(list_query, page_number):
+    """Copy a list query, setting the page number to request"""
+    query = copy.copy(list_query)
+    query.page_number = page_number
+    return query
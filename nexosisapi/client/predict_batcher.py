@@ -0,0 +1,123 @@
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class _Batch(object):
+    def __init__(self, model_id, extra_parameters):
+        self.model_id = model_id
+        self.extra_parameters = extra_parameters
+        self.started = time.time()
+        self.rows = []
+        self.futures = []
+
+
+class PredictBatcher(object):
+    """Combines single-row predictions from many threads into batched requests
+
+    Rows submitted for the same model (and extra parameters) are held for up to `max_wait` seconds, or until
+    `max_batch_size` rows have arrived, and then sent together in one call to `Models.predict`. Each caller gets
+    a future resolving to the prediction for its own row.
+
+    Use as a context manager, or call `close`, to send any waiting rows and stop the background threads.
+    """
+
+    def __init__(self, models, max_batch_size=100, max_wait=0.005, workers=4):
+        """
+        :param Models models: the model operations to predict with, e.g. `client.models`
+        :param int max_batch_size: the most rows to send in one request
+        :param float max_wait: the most seconds a row waits for others to join its batch
+        :param int workers: the number of batches that may be in flight at the same time
+        """
+        self._models = models
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = {}
+        self._closed = False
+        self._condition = threading.Condition()
+        self._dispatcher = threading.Thread(target=self._dispatch, name='nexosis-predict-batcher')
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def submit(self, model_id, features, extra_parameters=None):
+        """Queue a row for prediction
+
+        :param str model_id: the id of the model to use for prediction
+        :param dict features: the features of a single row
+        :param dict extra_parameters: extended capability for a particular model, see `Models.predict`
+        :return: a future resolving to the predicted row as a dict
+        :rtype: concurrent.futures.Future
+        """
+        if model_id is None:
+            raise ValueError('model_id is required and was not provided')
+
+        future = Future()
+        key = (model_id, json.dumps(extra_parameters or {}, sort_keys=True, default=str))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('the PredictBatcher has been closed')
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = self._pending[key] = _Batch(model_id, extra_parameters or {})
+                self._condition.notify()
+            batch.rows.append(features)
+            batch.futures.append(future)
+            if len(batch.rows) >= self._max_batch_size:
+                del self._pending[key]
+                self._executor.submit(self._send, batch)
+        return future
+
+    def predict(self, model_id, features, extra_parameters=None, timeout=None):
+        """Predict a single row, waiting for the batch it joins to be sent
+
+        :param float timeout: the most seconds to wait for the prediction
+        :return: the predicted row
+        :rtype: dict
+        """
+        return self.submit(model_id, features, extra_parameters).result(timeout)
+
+    def close(self):
+        """Send any waiting rows, wait for the outstanding requests and stop the background threads"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self):
+        with self._condition:
+            while True:
+                now = time.time()
+                due = [key for key, batch in self._pending.items()
+                       if self._closed or now - batch.started >= self._max_wait]
+                for key in due:
+                    self._executor.submit(self._send, self._pending.pop(key))
+
+                if self._closed:
+                    return
+                if self._pending:
+                    oldest = min(batch.started for batch in self._pending.values())
+                    self._condition.wait(max(oldest + self._max_wait - now, 0))
+                else:
+                    self._condition.wait()
+
+    def _send(self, batch):
+        try:
+            results = self._models.predict(batch.model_id, batch.rows, batch.extra_parameters).data or []
+            if len(results) != len(batch.rows):
+                raise ValueError('expected %d predictions but received %d' % (len(batch.rows), len(results)))
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+
+        for future, result in zip(batch.futures, results):
+            future.set_result(result)
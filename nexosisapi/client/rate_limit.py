@@ -0,0 +1,241 @@
+import os
+import re
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from . import deadline
+from .retry import parse_retry_after
+
+_QUOTA_HEADER = re.compile(r'^nexosis-account-(\w+)-(current|allotted)$')
+
+
+class TokenBucket(object):
+    """A thread-safe token bucket allowing `rate` operations a second, with bursts of up to `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        """
+        :param float rate: the number of tokens added each second
+        :param float capacity: the most tokens that may be saved up, defaults to one second's worth
+        """
+        if rate <= 0:
+            raise ValueError('rate must be a positive number')
+        self._rate = float(rate)
+        self._capacity = float(capacity or max(rate, 1))
+        self._tokens = self._capacity
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def _refill(self, now):
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _take(self, tokens):
+        # takes the tokens and returns 0, or returns the seconds to wait until they could be taken
+        with self._lock:
+            self._refill(time.time())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self._rate
+
+    def try_acquire(self, tokens=1):
+        """Take tokens if they are available right now
+
+        :return: True if the tokens were taken
+        """
+        return self._take(tokens) == 0
+
+    def acquire(self, tokens=1):
+        """Take tokens, waiting until enough are available"""
+        while True:
+            wait = self._take(tokens)
+            if wait == 0:
+                return
+            deadline.sleep(wait, 'a request could be sent')
+
+    def set_rate(self, rate):
+        """Change the number of tokens added each second"""
+        if rate <= 0:
+            raise ValueError('rate must be a positive number')
+        with self._lock:
+            self._refill(time.time())
+            self._rate = float(rate)
+
+    def pause(self, seconds):
+        """Empty the bucket, and hold back new tokens for `seconds`"""
+        with self._lock:
+            self._refill(time.time())
+            self._tokens = min(self._tokens, 0) - seconds * self._rate
+
+
+class FileTokenBucket(TokenBucket):
+    """A token bucket kept in a local file, so that every process using the same file shares one rate
+
+    The file is locked while it is read and updated, which needs `fcntl` and so is only available on unix. The rate
+    is stored in the file, so a change made by one process applies to all of them.
+    """
+
+    def __init__(self, path, rate, capacity=None):
+        """
+        :param str path: the file to keep the bucket in; it is created if needed
+        :param float rate: the number of tokens added each second, used when the file is first created
+        :param float capacity: the most tokens that may be saved up, defaults to one second's worth
+        """
+        if fcntl is None:
+            raise ImportError('FileTokenBucket requires fcntl, which is not available on this platform')
+        super(FileTokenBucket, self).__init__(rate, capacity)
+        self._path = path
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def rate(self):
+        return self._update(lambda now: None)
+
+    def _update(self, change):
+        # reads the shared state into this object, applies `change`, and writes it back, all under the file lock
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                state = os.read(fd, 128).split()
+                if len(state) == 3:
+                    self._tokens, self._updated, self._rate = [float(value) for value in state]
+                now = time.time()
+                self._refill(now)
+                result = change(now)
+                state = ('%r %r %r' % (self._tokens, self._updated, self._rate)).encode('ascii')
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, state)
+                return result if result is not None else self._rate
+            finally:
+                os.close(fd)
+
+    def _take(self, tokens):
+        def take(now):
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self._rate
+
+        return self._update(take)
+
+    def set_rate(self, rate):
+        if rate <= 0:
+            raise ValueError('rate must be a positive number')
+
+        def change(now):
+            self._rate = float(rate)
+
+        self._update(change)
+
+    def pause(self, seconds):
+        def change(now):
+            self._tokens = min(self._tokens, 0) - seconds * self._rate
+
+        self._update(change)
+
+
+class RateLimiter(object):
+    """Paces the requests of an `HttpClient`, slowing down when the API throttles them
+
+    Every request takes a token from the bucket first. A 429 response halves the rate and holds all requests back
+    for as long as its Retry-After header asks; each successful response then raises the rate a little, up to
+    `max_rate`. The bucket is shared by every thread using the client, and with a `FileTokenBucket` by every
+    process too.
+
+    The nexosis-account-* headers on each response are recorded in `quotas`, so callers can see how much of their
+    allotment is left.
+    """
+
+    def __init__(self, rate=10.0, capacity=None, min_rate=0.5, max_rate=None, increase=0.1, bucket=None):
+        """
+        :param float rate: the requests allowed each second to begin with
+        :param float capacity: the most requests that may be sent in a burst, defaults to one second's worth
+        :param float min_rate: the slowest rate throttling may reduce the limiter to
+        :param float max_rate: the fastest rate the limiter may recover to, defaults to `rate`
+        :param float increase: the requests a second added after each successful response
+        :param TokenBucket bucket: the bucket to take tokens from, such as a `FileTokenBucket` shared between
+            processes; defaults to a new `TokenBucket`
+        """
+        self._bucket = bucket or TokenBucket(rate, capacity)
+        self._min_rate = min_rate
+        self._max_rate = max_rate or self._bucket.rate
+        self._increase = increase
+        self._quotas = {}
+        self._lock = threading.Lock()
+
+    @property
+    def bucket(self):
+        return self._bucket
+
+    @property
+    def rate(self):
+        """The requests currently allowed each second"""
+        return self._bucket.rate
+
+    @property
+    def quotas(self):
+        """The latest account usage reported by the API, as a dict of name (such as 'predictioncount') to a
+        (current, allotted) tuple"""
+        with self._lock:
+            return dict(self._quotas)
+
+    def remaining(self, name):
+        """The amount of an account allotment left, such as remaining('sessioncount'), or None if not yet known"""
+        current, allotted = self.quotas.get(name, (None, None))
+        if current is None or allotted is None:
+            return None
+        return max(allotted - current, 0)
+
+    def acquire(self):
+        """Wait until a request may be sent"""
+        self._bucket.acquire()
+
+    def observe(self, status, headers):
+        """Adjust the rate from the response to a request
+
+        :param int status: the http status of the response
+        :param headers: the headers of the response
+        """
+        headers = headers or {}
+        self._record_quotas(headers)
+        if status == 429:
+            self._bucket.set_rate(max(self._min_rate, self._bucket.rate / 2))
+            self._bucket.pause(parse_retry_after(headers.get('Retry-After')) or 0)
+        elif status < 400:
+            rate = self._bucket.rate
+            if rate < self._max_rate:
+                self._bucket.set_rate(min(self._max_rate, rate + self._increase))
+
+    def _record_quotas(self, headers):
+        found = {}
+        for key, value in headers.items():
+            match = _QUOTA_HEADER.match(key.lower())
+            if match is None:
+                continue
+            try:
+                found.setdefault(match.group(1), {})[match.group(2)] = int(value)
+            except ValueError:
+                continue
+        if found:
+            with self._lock:
+                for name, values in found.items():
+                    current, allotted = self._quotas.get(name, (None, None))
+                    self._quotas[name] = (values.get('current', current), values.get('allotted', allotted))
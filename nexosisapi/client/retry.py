@@ -0,0 +1,135 @@
+from email.utils import parsedate_tz, mktime_tz
+import time
+
+from requests.exceptions import ConnectTimeout
+
+from . import deadline
+from .backoff import backoff_delay
+from .client_error import ClientError, CircuitOpenError
+
+
+def parse_retry_after(value):
+    """Get the number of seconds asked for by a Retry-After header, given either as seconds or as an http date
+
+    :return: the seconds to wait, or None if the value is missing or not understood
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        parsed = parsedate_tz(value)
+        return max(mktime_tz(parsed) - time.time(), 0.0) if parsed else None
+
+
+def retry_after(error):
+    """Get the number of seconds the API asked a client to wait, from the Retry-After header of an error response
+
+    :return: the seconds to wait, or None if the response did not say
+    """
+    return parse_retry_after((getattr(error, 'headers', None) or {}).get('Retry-After'))
+
+
+def _rewinder(body):
+    # returns a function preparing the body to be sent again, or None if it cannot be
+    if body is None or isinstance(body, (bytes, bytearray, str, type(u''), dict)):
+        return lambda: None
+    seekable = getattr(body, 'seekable', None)
+    if hasattr(body, 'seek') and hasattr(body, 'tell') and (seekable is None or seekable()):
+        position = body.tell()
+        return lambda: body.seek(position)
+    return None
+
+
+class RetryPolicy(object):
+    """Decides which failed requests the transport sends again, and how long it waits first
+
+    Throttled (429) and server error responses, and connection failures, are retried for idempotent verbs with
+    exponential backoff and jitter, waiting at least as long as a Retry-After header asks. Other verbs, such as
+    POST, and PUT, which appends rows to a dataset, are only retried when the request cannot have been acted on: a
+    429, or a connection that was never made. Streamed bodies that cannot be rewound are never retried.
+    """
+
+    def __init__(self, retries=3, initial=0.5, maximum=30.0, max_elapsed=120.0,
+                 statuses=(429, 500, 502, 503, 504), idempotent_verbs=('GET', 'HEAD', 'OPTIONS', 'DELETE')):
+        """
+        :param int retries: the most times to retry a request after its first failure
+        :param float initial: the delay before the first retry, in seconds
+        :param float maximum: the largest delay between retries, in seconds
+        :param float max_elapsed: the most seconds to spend on a request, including retries, before giving up;
+            None for no limit
+        :param statuses: the response statuses worth retrying
+        :param idempotent_verbs: the verbs that are safe to send more than once; add 'POST' to retry predictions,
+            which have no side effects. PUT is left out because sending rows to a dataset again after the server
+            saved them would add them twice.
+        """
+        self._retries = retries
+        self._initial = initial
+        self._maximum = maximum
+        self._max_elapsed = max_elapsed
+        self._statuses = frozenset(statuses)
+        self._idempotent_verbs = frozenset(verb.upper() for verb in idempotent_verbs)
+
+    @property
+    def retries(self):
+        return self._retries
+
+    @property
+    def max_elapsed(self):
+        return self._max_elapsed
+
+    def is_retryable(self, verb, error):
+        """Whether a request that failed with `error` may be sent again"""
+        idempotent = verb.upper() in self._idempotent_verbs
+        if isinstance(error, CircuitOpenError):
+            # the request was never sent, and retrying before the circuit closes would just fail again
+            return False
+        if isinstance(error, ClientError):
+            return error.status in self._statuses and (idempotent or error.status == 429)
+        if isinstance(error, ConnectTimeout):
+            return True
+        return idempotent and isinstance(error, IOError)
+
+    def next_delay(self, verb, error, attempt, elapsed):
+        """Get the seconds to wait before retrying a failed request
+
+        :param str verb: the http verb of the request
+        :param error: the error the request failed with
+        :param int attempt: the zero-based number of the retry
+        :param float elapsed: the seconds spent on the request so far
+        :return: the seconds to wait, or None if the request should not be retried
+        """
+        if attempt >= self._retries or not self.is_retryable(verb, error):
+            return None
+        delay = backoff_delay(attempt, self._initial, self._maximum)
+        requested = retry_after(error)
+        if requested is not None:
+            delay = max(delay, requested)
+        if self._max_elapsed is not None and elapsed + delay > self._max_elapsed:
+            return None
+        left = deadline.remaining()
+        if left is not None and delay >= left:
+            return None
+        return delay
+
+    def call(self, verb, func, body=None):
+        """Call a function sending a request, retrying it as this policy allows
+
+        :param str verb: the http verb of the request
+        :param func: the function sending the request, taking no arguments
+        :param body: the body of the request, rewound before each retry when it is a file
+        :return: the result of `func`
+        """
+        started = time.time()
+        rewind = _rewinder(body)
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                delay = self.next_delay(verb, e, attempt, time.time() - started) if rewind is not None else None
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            rewind()
+            attempt += 1
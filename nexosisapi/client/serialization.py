@@ -0,0 +1,105 @@
+from datetime import datetime, date
+from enum import Enum
+import json
+
+from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.view_definition import ViewDefinition
+from nexosisapi.join import Join
+from nexosisapi.column_options import ColumnOptions
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+_encoders = {}
+_resolved = {}
+
+
+def register_encoder(cls, encoder):
+    """Teach the json serializers how to encode a type
+
+    The encoder is also used for subclasses of `cls` that have no encoder of their own.
+
+    :param type cls: the type to encode
+    :param encoder: a function converting an instance of `cls` into something json can encode
+    """
+    _encoders[cls] = encoder
+    _resolved.clear()
+
+
+def encode(obj):
+    """Convert a value json cannot encode natively, for use as the `default` of a json serializer
+
+    The encoder is looked up by the exact type of the value, falling back to the closest registered base class.
+    """
+    cls = type(obj)
+    try:
+        encoder = _resolved[cls]
+    except KeyError:
+        encoder = next((_encoders[base] for base in cls.__mro__ if base in _encoders), None)
+        _resolved[cls] = encoder
+    if encoder is None:
+        raise TypeError("Type %s not serializable" % cls)
+    return encoder(obj)
+
+
+register_encoder(datetime, lambda obj: obj.isoformat())
+register_encoder(date, lambda obj: obj.isoformat())
+register_encoder(Enum, lambda obj: obj.name)
+register_encoder(ColumnMetadata, lambda obj: obj.to_dict())
+register_encoder(ViewDefinition, lambda obj: {
+    'viewName': obj.view_name,
+    'dataSetName': obj.dataset_name,
+    'columns': obj.column_metadata,
+    'joins': obj.joins
+})
+register_encoder(Join, lambda obj: obj.to_hash())
+# enums inside models are named here, rather than left to the backend, since orjson writes enums by value
+register_encoder(ColumnOptions, lambda obj: {'joinInterval': obj.join_interval.name})
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, default=encode)
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj, default=encode, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _ujson_dumps(obj):
+    return ujson.dumps(obj, default=encode)
+
+
+BACKENDS = ('json', 'orjson', 'ujson')
+
+
+def get_dumps(backend='json'):
+    """Get the function used to encode request bodies
+
+    orjson encodes datetimes and enums itself, without calling the registered encoders. Its datetimes match
+    `isoformat`, but enums are written by value rather than by name, so with orjson pass enum names, not enums,
+    in request data. The API models are always encoded with their names.
+
+    :param str backend: 'json' for the standard library, 'orjson' or 'ujson' for those packages, or 'auto' for the
+        fastest one installed
+    :return: a function encoding a value as json text or bytes
+    """
+    if backend == 'auto':
+        backend = 'orjson' if orjson is not None else 'ujson' if ujson is not None else 'json'
+    if backend == 'json':
+        return _stdlib_dumps
+    if backend == 'orjson':
+        if orjson is None:
+            raise ImportError('the orjson backend requires the orjson package: pip install orjson')
+        return _orjson_dumps
+    if backend == 'ujson':
+        if ujson is None:
+            raise ImportError('the ujson backend requires the ujson package: pip install ujson')
+        return _ujson_dumps
+    raise ValueError('backend must be one of %s or auto' % ', '.join(BACKENDS))
@@ -0,0 +1,133 @@
+import datetime
+import time
+
+from nexosisapi.list_queries import SessionListQuery
+from nexosisapi.session import Session
+from nexosisapi.status import FINISHED_STATUSES
+from . import deadline
+from .batching import ordered_map
+from .client_error import DeadlineExceededError
+from .rate_limit import TokenBucket
+
+
+class SessionTracker(object):
+    """Follows many sessions at once, yielding each one as it finishes
+
+    Rather than one poll loop per session, each round refreshes every outstanding session together. Once the
+    tracker knows when the sessions were requested, and enough of them are outstanding, a round lists sessions
+    requested since the earliest of them, which updates up to a thousand sessions per request. Any sessions the
+    listing does not cover are checked individually, several at a time. All requests share one rate budget.
+    """
+
+    def __init__(self, sessions, tracked=(), workers=8, requests_per_second=10.0, poll_interval=5.0,
+                 list_threshold=5):
+        """
+        :param Sessions sessions: the session operations to poll with, e.g. `client.sessions`
+        :param tracked: session ids, or `Session` objects such as those returned when sessions are created
+        :param int workers: the number of individual status checks to run at the same time
+        :param float requests_per_second: the request budget shared by every poll
+        :param float poll_interval: seconds to wait between rounds
+        :param int list_threshold: the fewest outstanding sessions for which a round lists sessions instead of
+            checking each one
+        """
+        self._sessions = sessions
+        self._workers = workers
+        self._budget = TokenBucket(requests_per_second)
+        self._poll_interval = poll_interval
+        self._list_threshold = list_threshold
+        self._pending = {}
+        self._requested = {}
+        self.track(*tracked)
+
+    @property
+    def pending(self):
+        """The ids of the sessions that have not finished yet"""
+        return list(self._pending)
+
+    def track(self, *sessions):
+        """Add session ids or `Session` objects to follow"""
+        for session in sessions:
+            if isinstance(session, Session):
+                self._pending[session.session_id] = session
+                self._requested[session.session_id] = session.requested_date
+            else:
+                self._pending[session] = None
+
+    def finished(self, timeout=None):
+        """Yield each tracked session as it finishes, until none are left
+
+        :param float timeout: the most seconds to wait for all of the sessions, or None to wait indefinitely
+        :raises DeadlineExceededError: when sessions are still running after `timeout` seconds
+        :returns an iterator of `SessionResponse`
+        """
+        started = time.time()
+        while self._pending:
+            for session in self.poll():
+                yield session
+
+            if not self._pending:
+                return
+            delay = self._poll_interval
+            if timeout is not None:
+                remaining = timeout - (time.time() - started)
+                if remaining <= 0:
+                    raise DeadlineExceededError('%d sessions did not finish within %s seconds'
+                                                % (len(self._pending), timeout))
+                delay = min(delay, remaining)
+            deadline.sleep(delay, 'the sessions finished')
+
+    def poll(self):
+        """Refresh every outstanding session once
+
+        :returns a list of the `SessionResponse` objects that have finished since the last poll
+        """
+        done = []
+        unseen = set(self._pending)
+
+        known = [self._requested[s] for s in unseen if self._requested.get(s) is not None]
+        if len(unseen) >= self._list_threshold and known:
+            for session in self._list_since(min(known) - datetime.timedelta(seconds=1), unseen):
+                unseen.discard(session.session_id)
+                if session.status in FINISHED_STATUSES:
+                    done.append(self._finish(session))
+
+        for session in ordered_map(self._check, list(unseen), self._workers):
+            if session is not None:
+                done.append(self._finish(session))
+
+        return done
+
+    def _list_since(self, requested_after, wanted):
+        query = SessionListQuery(page_size=1000, options={'requested_after_date': requested_after})
+        page = 0
+        while wanted:
+            self._budget.acquire()
+            query.page_number = page
+            listing = self._sessions.list(query)
+            for session in listing:
+                if session.session_id in wanted:
+                    yield session
+            page += 1
+            if page >= listing.total_pages:
+                return
+
+    def _check(self, session_id):
+        if self._requested.get(session_id) is None:
+            # the first check downloads the session to learn when it was requested, for later listings
+            self._budget.acquire()
+            session = self._sessions.get(session_id)
+            self._requested[session_id] = session.requested_date
+            return session if session.status in FINISHED_STATUSES else None
+
+        self._budget.acquire()
+        status = self._sessions.get_status(session_id)
+        if status is not None and status not in FINISHED_STATUSES:
+            return None
+        self._budget.acquire()
+        session = self._sessions.get(session_id)
+        return session if session.status in FINISHED_STATUSES else None
+
+    def _finish(self, session):
+        self._pending.pop(session.session_id, None)
+        self._requested.pop(session.session_id, None)
+        return session
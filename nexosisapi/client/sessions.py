@@ -1,6 +1,15 @@
+import random
+import time
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib import urlencode
+
+from nexosisapi import SESSION_STATUS_HEADER
 from nexosisapi.confusion_matrix import ConfusionMatrix
 from nexosisapi.paged_list import PagedList
 from nexosisapi.session import SessionResult, SessionResponse
+from nexosisapi.status import Status, FINISHED_STATUSES
 from nexosisapi.time_interval import TimeInterval
 from nexosisapi.session_contest import SessionContest
 from nexosisapi.algorithm_contestant import AlgorithmContestant
@@ -12,12 +21,63 @@ from nexosisapi.list_queries import SessionListQuery
 from nexosisapi.feature_importance import FeatureImportance
 from nexosisapi.timeseries_outliers import TimeseriesOutliers
 from nexosisapi.anomaly_distances import AnomalyDistances
+from . import deadline
+from .backoff import backoff_delay
+from .client_error import DeadlineExceededError
+from .paging import iter_items, query_for_page
+from .session_tracker import SessionTracker
+
+
+def _parse_status(value):
+    return Status.__members__.get(str(value).lower()) if value else None
+
 
 class Sessions(object):
     """Session based API operations"""
 
-    def __init__(self, client):
+    def __init__(self, client, result_cache=None):
+        """
+        :param client: the transport to use for requests
+        :param result_cache: a MemoryResultCache or DiskResultCache storing the results of completed sessions so they
+            are downloaded only once
+        """
         self._client = client
+        self._result_cache = result_cache
+        self._completed = set()
+
+    @property
+    def result_cache(self):
+        """The MemoryResultCache or DiskResultCache holding the results of completed sessions, or None to always
+        download them"""
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, value):
+        self._result_cache = value
+
+    def _note_status(self, session_id, status):
+        if status == Status.completed:
+            self._completed.add(session_id)
+
+    def _get_result(self, session_id, path, params=None):
+        kwargs = {'params': params} if params is not None else {}
+        cache = self._result_cache
+        if cache is None:
+            return self._client.request('GET', path, **kwargs)
+
+        key = '%s?%s' % (path, urlencode(sorted(params.items()))) if params else path
+        response = cache.get(session_id, key)
+        if response is None:
+            # completion is known from an earlier response, or from the status the payload itself reports, so that
+            # results taken while the session was still running are never kept
+            completed = session_id in self._completed
+            response = self._client.request('GET', path, **kwargs)
+            if not completed and isinstance(response, dict):
+                self._note_status(session_id, _parse_status(response.get('status')))
+                completed = session_id in self._completed
+            if completed:
+                cache.set(session_id, key, response)
+        return response
 
     def _create_session(self, datasource_name, action_type, start_date, end_date, target_column=None, event_name=None,
                         result_interval=TimeInterval.day, column_metadata=None, callback_url=None):
@@ -175,9 +235,22 @@ class Sessions(object):
         :rtype list
         """
         response, _, headers = self._client.request_with_headers('GET', 'sessions', params=session_list_query.query_parameters())
-        return PagedList.from_response(
-            [SessionResponse(item, headers) for item in response.get('items', [])],
-            response)
+        sessions = [SessionResponse(item, headers) for item in response.get('items', [])]
+        for session in sessions:
+            self._note_status(session.session_id, session.status)
+        return PagedList.from_response(sessions, response)
+
+    def iter_list(self, session_list_query=None, prefetch=2):
+        """Iterate over every session, optionally filtering on session parameters, fetching pages as needed
+
+        :param SessionListQuery session_list_query: query options to limit the results of the request; the page
+            number is ignored and the page size defaults to 1000
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :returns an iterator of `SessionResponse`
+        """
+        query = session_list_query or SessionListQuery(page_size=1000)
+        return iter_items(lambda page: self.list(query_for_page(query, page)), lambda listing: listing,
+                          lambda listing: listing.total_pages, prefetch)
 
     def remove(self, session_id):
         """Remove a session based on the session id
@@ -188,14 +261,22 @@ class Sessions(object):
             raise ValueError('session_id is required and was not provided')
 
         self._client.request('DELETE', 'sessions/%s' % session_id)
+        self._completed.discard(session_id)
+        if self._result_cache is not None:
+            self._result_cache.invalidate(session_id)
 
     def remove_sessions(self, **kwargs):
         self._client.request('DELETE', 'sessions', params=kwargs)
+        self._completed.clear()
+        if self._result_cache is not None:
+            self._result_cache.clear()
 
-    def get_results(self, session_id):
+    def get_results(self, session_id, page_number=None, page_size=None):
         """Get the results of a session based on the session id
 
         :param str session_id: the session to get results for
+        :param int page_number: zero-based page number of results to retrieve, or None for the API's default
+        :param int page_size: count of results to retrieve in each page, or None for the API's default
 
         :returns the results of computation run by the session
         :rtype SessionResult
@@ -203,7 +284,10 @@ class Sessions(object):
         if session_id is None:
             raise ValueError('session_id is required and was not provided')
 
-        response = self._client.request('GET', 'sessions/%s/results' % session_id)
+        query = None
+        if page_number is not None or page_size is not None:
+            query = {'page': page_number or 0, 'pageSize': page_size or 50}
+        response = self._get_result(session_id, 'sessions/%s/results' % session_id, query)
         return SessionResult(response)
 
     def get(self, session_id):
@@ -218,7 +302,71 @@ class Sessions(object):
             raise ValueError('session_id is required and was not provided')
 
         response, _, headers = self._client.request_with_headers('GET', 'sessions/%s' % session_id)
-        return SessionResponse(response, headers)
+        session = SessionResponse(response, headers)
+        self._note_status(session_id, session.status)
+        return session
+
+    def get_status(self, session_id):
+        """Get the current status of a session without downloading the session itself
+
+        :param str session_id: the session to check
+        :returns the status of the session, or None if the API did not report it
+        :rtype Status
+        """
+        if session_id is None:
+            raise ValueError('session_id is required and was not provided')
+
+        _, _, headers = self._client.request_with_headers('HEAD', 'sessions/%s' % session_id)
+        status = _parse_status((headers or {}).get(SESSION_STATUS_HEADER))
+        self._note_status(session_id, status)
+        return status
+
+    def wait(self, session_id, timeout=None, initial_interval=1.0, max_interval=60.0):
+        """Wait for a session to finish, then get it
+
+        The session status is polled with lightweight HEAD requests, backing off exponentially (with jitter) from
+        `initial_interval` up to `max_interval` between polls. The full session is downloaded once it is completed,
+        cancelled, failed or estimated.
+
+        :param str session_id: the session to wait for
+        :param float timeout: the most seconds to wait, or None to wait indefinitely
+        :param float initial_interval: seconds to wait before the second poll
+        :param float max_interval: the most seconds to wait between polls
+        :raises DeadlineExceededError: when the session has not finished within `timeout` seconds
+        :returns the information about the finished session
+        :rtype SessionResponse
+        """
+        started = time.time()
+        attempt = 0
+        while True:
+            status = self.get_status(session_id)
+            if status is None:
+                # fall back to the full session if the status header is missing
+                session = self.get(session_id)
+                if session.status in FINISHED_STATUSES:
+                    return session
+            elif status in FINISHED_STATUSES:
+                return self.get(session_id)
+
+            delay = backoff_delay(attempt, initial_interval, max_interval, jitter=False)
+            delay = random.uniform(delay / 2, delay)
+            if timeout is not None:
+                remaining = timeout - (time.time() - started)
+                if remaining <= 0:
+                    raise DeadlineExceededError('session %s did not finish within %s seconds' % (session_id, timeout))
+                delay = min(delay, remaining)
+            deadline.sleep(delay, 'session %s finished' % session_id)
+            attempt += 1
+
+    def track(self, sessions, **kwargs):
+        """Follow many sessions at once, see `SessionTracker`
+
+        :param sessions: session ids, or `Session` objects such as those returned when sessions are created
+        :param kwargs: options for the `SessionTracker`, such as workers, requests_per_second and poll_interval
+        :returns a tracker whose `finished` method yields each session as it finishes
+        :rtype SessionTracker
+        """
+        return SessionTracker(self, sessions, **kwargs)
 
     def get_confusion_matrix(self, session_id):
         """Get the confusion matrix results for a completed classification model.
@@ -231,7 +379,7 @@ class Sessions(object):
         if session_id is None:
             raise ValueError('session_id is required and was not provided')
 
-        response = self._client.request('GET', 'sessions/%s/results/confusionmatrix' % session_id)
+        response = self._get_result(session_id, 'sessions/%s/results/confusionmatrix' % session_id)
         return ConfusionMatrix(response)
 
     def get_class_scores(self, session_id, page_number=0, page_size=50):
@@ -279,7 +427,7 @@ class Sessions(object):
         """
         if session_id is None or not session_id:
             raise ValueError('session_id is required and was not provided')
-        response = self._client.request('GET', 'sessions/%s/contest' % session_id)
+        response = self._get_result(session_id, 'sessions/%s/contest' % session_id)
         return SessionContest(response)
 
     def get_champion(self, session_id):
@@ -291,7 +439,7 @@ class Sessions(object):
         """
         if session_id is None or not session_id:
             raise ValueError('session_id is required and was not provided')
-        response = self._client.request('GET', 'sessions/%s/contest/champion' % session_id)
+        response = self._get_result(session_id, 'sessions/%s/contest/champion' % session_id)
         return AlgorithmContestant(response)
 
     def get_contestant(self, session_id, contestant_id):
@@ -306,8 +454,8 @@ class Sessions(object):
             raise ValueError('session_id is required and was not provided')
         if contestant_id is None or not contestant_id:
             raise ValueError('contestant_id is required and was not provided')
-        response = self._client.request('GET',
-                                        'sessions/{0}/contest/contestants/{1}'.format(session_id, contestant_id))
+        response = self._get_result(session_id,
+                                    'sessions/{0}/contest/contestants/{1}'.format(session_id, contestant_id))
         return AlgorithmContestant(response)
 
     def get_contest_selection_criteria(self, session_id):
@@ -319,8 +467,7 @@ class Sessions(object):
         """
         if session_id is None or not session_id:
             raise ValueError('session_id is required and was not provided')
-        response = self._client.request('GET',
-                                        'sessions/{0}/contest/selection'.format(session_id))
+        response = self._get_result(session_id, 'sessions/{0}/contest/selection'.format(session_id))
         return SessionSelectionMetrics(response)
 
     def get_feature_importance(self, session_id, page_number=0, page_size=50):
@@ -341,8 +488,7 @@ class Sessions(object):
         query = {
             'page': page_number,
             'pageSize': page_size}
-        response = self._client.request('GET',
-                                        'sessions/{0}/results/featureimportance'.format(session_id), params=query)
+        response = self._get_result(session_id, 'sessions/{0}/results/featureimportance'.format(session_id), query)
         return FeatureImportance(response)
 
     def get_timeseries_outliers(self, session_id, page_number=0, page_size=50):
@@ -382,3 +528,58 @@ class Sessions(object):
         response = self._client.request('GET',
                                         'sessions/{0}/results/mahalanobisdistances'.format(session_id), params=query)
         return AnomalyDistances(response)
+
+    def iter_class_scores(self, session_id, page_size=1000, prefetch=2):
+        """
+        Iterate over the class scores of every result of a completed classification model session
+        :param session_id: the completed classification model building session
+        :param page_size: number of items to retrieve in each request, defaults to 1000; 1000 max.
+        :param prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of `dict` scores
+        """
+        return iter_items(lambda page: self.get_class_scores(session_id, page, page_size),
+                          lambda result: result.data, lambda result: result.data.total_pages, prefetch)
+
+    def iter_anomaly_scores(self, session_id, page_size=1000, prefetch=2):
+        """
+        Iterate over the scores of the entire dataset generated by a completed anomalies session
+        :param session_id: the completed anomalies model building session
+        :param page_size: number of items to retrieve in each request, defaults to 1000; 1000 max.
+        :param prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of `dict` scores
+        """
+        return iter_items(lambda page: self.get_anomaly_scores(session_id, page, page_size),
+                          lambda result: result.data, lambda result: result.data.total_pages, prefetch)
+
+    def iter_feature_importance(self, session_id, page_size=1000, prefetch=2):
+        """
+        Iterate over the feature importance scores of a completed session
+        :param session_id: the unique id of the a completed session
+        :param page_size: number of items to retrieve in each request, defaults to 1000; 1000 max.
+        :param prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of (column name, score) tuples
+        """
+        return iter_items(lambda page: self.get_feature_importance(session_id, page, page_size),
+                          lambda result: result.scores.items(), lambda result: result.total_pages, prefetch)
+
+    def iter_timeseries_outliers(self, session_id, page_size=1000, prefetch=2):
+        """
+        Iterate over the outliers of a completed timeseries session
+        :param session_id: the unique id of the a completed timeseries session
+        :param page_size: number of items to retrieve in each request, defaults to 1000; 1000 max.
+        :param prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of `Outlier`
+        """
+        return iter_items(lambda page: self.get_timeseries_outliers(session_id, page, page_size),
+                          lambda result: result.data, lambda result: result.data.total_pages, prefetch)
+
+    def iter_distance_metrics(self, session_id, page_size=1000, prefetch=2):
+        """
+        Iterate over the distances and anomaly scores of a completed anomalies session
+        :param session_id: the unique id of the a completed anomalies session
+        :param page_size: number of items to retrieve in each request, defaults to 1000; 1000 max.
+        :param prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of `DistanceMetric`
+        """
+        return iter_items(lambda page: self.get_distance_metrics(session_id, page, page_size),
+                          lambda result: result.data, lambda result: result.data.total_pages, prefetch)
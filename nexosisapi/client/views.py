@@ -1,5 +1,6 @@
 from nexosisapi.paged_list import PagedList
 from nexosisapi.view_definition import ViewDefinition, ViewData, Join
+from .paging import iter_items
 
 
 class Views(object):
@@ -25,6 +26,18 @@ class Views(object):
             [ViewDefinition(item) for item in listing.get('items', [])],
             listing)
 
+    def iter_list(self, partial_name='', dataset_name='', page_size=1000, prefetch=2):
+        """Iterate over every saved view, optionally filtering by view and/or dataset name, fetching pages as needed
+
+        :param str partial_name: optional name to filter view names on
+        :param str dataset_name: optional filter to limit views based on dataset name
+        :param int page_size: optional count of results to retrieve in each request (default 1000, max 1000).
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of ViewDefinition objects
+        """
+        return iter_items(lambda page: self.list(partial_name, dataset_name, page, page_size),
+                          lambda listing: listing, lambda listing: listing.total_pages, prefetch)
+
     def create(self, name, dataset_name, right_datasource_name):
         """Create a view or update an existing one by name
 
@@ -92,6 +105,23 @@ class Views(object):
 
         return ViewData(response)
 
+    def iter_all(self, view_name, page_size=1000, start_date=None, end_date=None, include=None, prefetch=2):
+        """Iterate over all of the rows resulting from running a view, fetching pages as needed
+
+        :param str view_name: the view name to pull data from
+        :param int page_size: optional count of rows to retrieve in each request (default 1000, max 1000).
+        :param datetime start_date: optional first date to return
+        :param datetime end_date: optional last date to return
+        :param include: optional string or array of strings specifying the names of the columns to return
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of `dict` rows
+        """
+        if view_name is None:
+            raise ValueError('a view definition must give the view a name')
+
+        return iter_items(lambda page: self.get(view_name, page, page_size, start_date, end_date, include),
+                          lambda view: view.data or [], lambda view: view.total_pages, prefetch)
+
     def remove(self, view_name, cascade=None):
         """Remove a view by name
 
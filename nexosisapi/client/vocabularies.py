@@ -2,6 +2,7 @@ from nexosisapi.paged_list import PagedList
 from nexosisapi.vocabulary_summary import VocabularySummary
 from nexosisapi.vocabulary import Vocabulary
 from nexosisapi.word import Word
+from .paging import iter_items
 
 
 class Vocabularies(object):
@@ -38,6 +39,19 @@ class Vocabularies(object):
             listing)
 
 
+    def iter_list(self, data_source=None, created_from_session=None, page_size=1000, prefetch=2):
+        """Iterate over every vocabulary, optionally filtering by data set name or the session from which the
+        vocabularies were built, fetching pages as needed
+
+        :param str data_source: optional name to filter vocabularies on
+        :param str created_from_session: optional filter to limit vocabularies to those built from a particular session
+        :param int page_size: optional count of results to retrieve in each request (default 1000, max 1000).
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of VocabularySummary objects
+        """
+        return iter_items(lambda page: self.list(data_source, created_from_session, page, page_size),
+                          lambda listing: listing, lambda listing: listing.total_pages, prefetch)
+
     def get(self, vocabulary_id, type=None, page_number=0, page_size=50):
         """Get the list of vocabulary words in a vocabulary
 
@@ -60,3 +74,15 @@ class Vocabularies(object):
         return Vocabulary.from_response(
             [Word(item) for item in listing.get('items', [])],
             listing)
+
+    def iter_all(self, vocabulary_id, type=None, page_size=1000, prefetch=2):
+        """Iterate over every word in a vocabulary, fetching pages as needed
+
+        :param str vocabulary_id: the vocabulary id whose words should be retrieved
+        :param str type: optional filter to limit words to only Words or StopWords
+        :param int page_size: optional count of results to retrieve in each request (default 1000, max 1000).
+        :param int prefetch: the number of pages to download ahead of the one being read
+        :return: an iterator of Word objects
+        """
+        return iter_items(lambda page: self.get(vocabulary_id, type, page, page_size),
+                          lambda vocabulary: vocabulary, lambda vocabulary: vocabulary.total_pages, prefetch)
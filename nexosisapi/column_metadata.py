@@ -1,4 +1,5 @@
 import io
+import threading
 from enum import Enum
 
 
@@ -38,10 +39,18 @@ class Aggregation(Enum):
 
 
 class ColumnMetadata(object):
-    """The data describing a column in a dataset."""
+    """The data describing a column in a dataset.
 
-    def __init__(self, data_dict=None):
-        """Create an instance with the data or defaults
+    Instances are immutable and shared: every ColumnMetadata built from the same values is the same object.
+    """
+
+    __slots__ = ('_data_type', '_role', '_imputation', '_aggregation')
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, data_dict=None):
+        """Get the instance with the data or defaults
 
         Defaults to data_type = ColumnType.string and role = ColumnRole.none
 
@@ -50,13 +59,58 @@ class ColumnMetadata(object):
         if data_dict is None:
             data_dict = {}
 
-        impute = data_dict.get('imputation')
-        aggregate = data_dict.get('aggregation')
+        key = (cls, data_dict.get('dataType') or 'string', data_dict.get('role') or 'none',
+               data_dict.get('imputation'), data_dict.get('aggregation'))
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
+
+        _, data_type, role, impute, aggregate = key
+        instance = super(ColumnMetadata, cls).__new__(cls)
+        object.__setattr__(instance, '_data_type', ColumnType[data_type])
+        object.__setattr__(instance, '_role', Role[role])
+        object.__setattr__(instance, '_imputation', Imputation[impute] if impute is not None else None)
+        object.__setattr__(instance, '_aggregation', Aggregation[aggregate] if aggregate is not None else None)
+        with cls._instances_lock:
+            return cls._instances.setdefault(key, instance)
+
+    def __init__(self, data_dict=None):
+        # all of the work is done by __new__, which may return an existing instance
+        pass
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ColumnMetadata is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('ColumnMetadata is immutable')
 
-        self._data_type = ColumnType[data_dict.get('dataType') or 'string']
-        self._role = Role[data_dict.get('role') or 'none']
-        self._imputation = Imputation[impute] if impute is not None else None
-        self._aggregation = Aggregation[aggregate] if aggregate is not None else None
+    def __reduce__(self):
+        return self.__class__, (self.to_dict(),)
+
+    def __eq__(self, other):
+        if not isinstance(other, ColumnMetadata):
+            return NotImplemented
+        return (self._data_type, self._role, self._imputation, self._aggregation) == \
+            (other._data_type, other._role, other._imputation, other._aggregation)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash((self._data_type, self._role, self._imputation, self._aggregation))
+
+    def to_dict(self):
+        """The data describing the column, as sent to and from the API
+
+        :rtype: dict
+        """
+        value = {'dataType': self._data_type.name, 'role': self._role.name}
+        if self._imputation is not None:
+            value['imputation'] = self._imputation.name
+        if self._aggregation is not None:
+            value['aggregation'] = self._aggregation.name
+        return value
 
     @property
     def data_type(self):
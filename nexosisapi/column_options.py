@@ -3,6 +3,8 @@ from nexosisapi.time_interval import TimeInterval
 class ColumnOptions(object):
     """The options defined on a specific column within a join"""
 
+    __slots__ = ('_join_interval', '_alias')
+
     def __init__(self, data_dict):
         if data_dict is None:
             data_dict = {}
@@ -0,0 +1,177 @@
+from collections import OrderedDict
+from datetime import datetime
+import re
+
+from nexosisapi.column_metadata import ColumnType
+from nexosisapi.dates import parse_datetime
+
+_OFFSET = re.compile(r'T.*[+-]\d{2}:?\d{2}$')
+_TRUE = ('true', '1', 't', 'yes', 'y')
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required for columnar data, install it with `pip install numpy`')
+    return numpy
+
+
+def _pandas():
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError('pandas is required for DataFrames, install it with `pip install pandas`')
+    return pandas
+
+
+def _is_missing(value):
+    return value is None or value == ''
+
+
+def _numbers(name, values, dtype):
+    numpy = _numpy()
+    array = numpy.array(values, dtype=object)
+    missing = numpy.array([_is_missing(value) for value in values], dtype=bool)
+    if missing.any() and numpy.dtype(dtype).kind in 'iu':
+        raise ValueError('column %s has missing values, which the integer dtype %s cannot hold; use a float dtype'
+                         % (name, dtype))
+    array[missing] = 'nan'
+    return array.astype(dtype)
+
+
+def _logicals(name, values, dtype=None):
+    numpy = _numpy()
+    text = numpy.char.lower(numpy.array([str(value) for value in values], dtype=str))
+    result = numpy.isin(text, _TRUE)
+    missing = numpy.array([_is_missing(value) for value in values], dtype=bool)
+    if not missing.any():
+        return result
+    if dtype is not None:
+        raise ValueError('column %s has missing values, which the bool dtype cannot hold; leave its dtype unset to '
+                         'keep them as None' % name)
+    # a bool array has no room for missing values, so keep them as None rather than reading them as False
+    result = result.astype(object)
+    result[missing] = None
+    return result
+
+
+def _utc_text(value):
+    if _is_missing(value):
+        return 'NaT'
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    if value.endswith('Z'):
+        return value[:-1]
+    if value.endswith('+00:00'):
+        return value[:-6]
+    if _OFFSET.search(value):
+        # numpy will not convert other offsets, so move the time to UTC ourselves
+        parsed = parse_datetime(value)
+        return (parsed - parsed.utcoffset()).replace(tzinfo=None).isoformat()
+    return value
+
+
+def _dates(values, dtype):
+    return _numpy().array([_utc_text(value) for value in values], dtype=dtype)
+
+
+def _column(name, values, column_type, dtype):
+    numpy = _numpy()
+    if dtype is not None:
+        kind = numpy.dtype(dtype).kind
+        if kind in 'fiuc':
+            return _numbers(name, values, dtype)
+        if kind == 'b':
+            return _logicals(name, values, dtype)
+        if kind == 'M':
+            return _dates(values, dtype)
+        return numpy.array(values, dtype=object).astype(dtype)
+
+    if column_type in (ColumnType.numeric, ColumnType.numericMeasure):
+        return _numbers(name, values, 'float64')
+    if column_type == ColumnType.logical:
+        return _logicals(name, values)
+    if column_type == ColumnType.date:
+        return _dates(values, 'datetime64[ns]')
+    return numpy.array(values, dtype=object)
+
+
+def to_columns(data, metadata, dtypes=None, columns=None):
+    """Convert rows of data into a typed numpy array for each column
+
+    Numeric columns become float64 arrays with NaN for missing values, logical columns become bool arrays (or,
+    when values are missing, arrays of objects holding True, False and None), date columns become datetime64[ns]
+    arrays in UTC, and anything else is kept as an array of objects.
+
+    :param list data: the rows, each a dict of column name to value
+    :param dict metadata: the ColumnMetadata for each column, used to choose the type of its array
+    :param dict dtypes: numpy dtypes to use for some columns in place of the ones chosen from the metadata; integer
+        and bool dtypes can only be used for columns with no missing values
+    :param list columns: the columns to convert, in order; defaults to every column in the metadata, followed by
+        any others found in the first row
+    :return: the array for each column, in column order
+    :rtype: OrderedDict
+    """
+    data = data or []
+    metadata = metadata or {}
+    dtypes = dtypes or {}
+    if columns is None:
+        columns = list(metadata)
+        columns.extend(name for name in (data[0] if data else {}) if name not in metadata)
+
+    result = OrderedDict()
+    for name in columns:
+        column_type = metadata[name].data_type if name in metadata else None
+        result[name] = _column(name, [row.get(name) for row in data], column_type, dtypes.get(name))
+    return result
+
+
+def to_numpy(data, metadata, dtypes=None, columns=None):
+    """Convert rows of data into a numpy structured array with a typed field for each column
+
+    The parameters, and the type chosen for each column, are the same as for `to_columns`.
+
+    :rtype: numpy.ndarray
+    """
+    arrays = to_columns(data, metadata, dtypes, columns)
+    numpy = _numpy()
+    result = numpy.empty(len(data or []), dtype=[(str(name), array.dtype) for name, array in arrays.items()])
+    for name, array in arrays.items():
+        result[str(name)] = array
+    return result
+
+
+def read_frame(csv_file, metadata, dtypes=None):
+    """Read csv data into a pandas DataFrame, typing each column from its metadata
+
+    Numeric columns are read as float64, logical columns as pandas' nullable boolean, date columns as UTC
+    timestamps, and anything else as text.
+
+    :param csv_file: an open file, or buffer, to read the csv data from
+    :param dict metadata: the ColumnMetadata for each column
+    :param dict dtypes: dtypes to use for some columns in place of the ones chosen from the metadata
+    :rtype: pandas.DataFrame
+    """
+    pandas = _pandas()
+    dtypes = dtypes or {}
+    types = {}
+    dates = []
+    for name, column in (metadata or {}).items():
+        if name in dtypes:
+            continue
+        if column.data_type in (ColumnType.numeric, ColumnType.numericMeasure):
+            types[name] = 'float64'
+        elif column.data_type == ColumnType.logical:
+            types[name] = 'boolean'
+        elif column.data_type == ColumnType.date:
+            dates.append(name)
+        else:
+            types[name] = 'object'
+    types.update(dtypes)
+
+    frame = pandas.read_csv(csv_file, dtype=types)
+    for name in dates:
+        if name in frame:
+            frame[name] = pandas.to_datetime(frame[name], utc=True)
+    return frame
@@ -2,6 +2,8 @@ from nexosisapi.session import Session
 
 
 class ConfusionMatrix(Session):
+    __slots__ = ('_classes', '_values')
+
     def __init__(self, data_dict=None):
         super(ConfusionMatrix, self).__init__(data_dict)
         self._classes = data_dict.get('classes', [])
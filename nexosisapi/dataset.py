@@ -1,7 +1,10 @@
 from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.columnar import to_columns, to_numpy
 
 
 class Dataset(object):
+    __slots__ = ('_data', '_metadata', '_links', '_page_number', '_total_pages', '_page_size', '_item_total')
+
     def __init__(self, data_dict=None):
         """
         A Dataset is the representation of your data as stored by the Nexosis API
@@ -77,6 +80,25 @@ class Dataset(object):
     def item_total(self, value):
         self._item_total = value
 
+    def to_columns(self, dtypes=None, columns=None):
+        """Gets the data for this Dataset as a typed numpy array for each column
+
+        :param dict dtypes: numpy dtypes to use for some columns in place of the ones chosen from the metadata
+        :param list columns: the columns to include, in order; defaults to all of them
+        :return: the array for each column, by column name
+        :rtype: OrderedDict
+        """
+        return to_columns(self._data, self._metadata, dtypes, columns)
+
+    def to_numpy(self, dtypes=None, columns=None):
+        """Gets the data for this Dataset as a numpy structured array with a typed field for each column
+
+        :param dict dtypes: numpy dtypes to use for some columns in place of the ones chosen from the metadata
+        :param list columns: the columns to include, in order; defaults to all of them
+        :rtype: numpy.ndarray
+        """
+        return to_numpy(self._data, self._metadata, dtypes, columns)
+
     def __repr__(self):
         return """Dataset({\n\
     'metadata': %s,
@@ -1,6 +1,8 @@
 class DatasetJoin(object):
     """An object that represents the definition of a join target within a join"""
 
+    __slots__ = ('_name',)
+
     def __init__(self, data_dict):
         self._name = data_dict.get('name')
 
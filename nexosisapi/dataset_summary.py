@@ -2,6 +2,8 @@ from nexosisapi.column_metadata import ColumnMetadata
 
 
 class DatasetSummary(object):
+    __slots__ = ('_name', '_column_metadata')
+
     def __init__(self, data_dict):
         self._name = data_dict['dataSetName']
         cols = data_dict.get('columns') or {}
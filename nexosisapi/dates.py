@@ -0,0 +1,51 @@
+from datetime import date, datetime
+import re
+
+import dateutil.parser
+from dateutil.tz import tzoffset, tzutc
+
+_ISO_8601 = re.compile(r'^(\d{4})-(\d{2})-(\d{2})'
+                       r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6})\d*)?)?)?'
+                       r'(Z|[+-]\d{2}(?::?\d{2})?)?$')
+_UTC = tzutc()
+_offsets = {}
+
+
+def _tz(designator):
+    if designator == 'Z':
+        return _UTC
+    zone = _offsets.get(designator)
+    if zone is None:
+        digits = designator[1:].replace(':', '')
+        seconds = int(digits[:2]) * 3600 + int(digits[2:4] or 0) * 60
+        if designator[0] == '-':
+            seconds = -seconds
+        zone = _UTC if seconds == 0 else tzoffset(None, seconds)
+        _offsets[designator] = zone
+    return zone
+
+
+def parse_datetime(value):
+    """Parse a date sent by the API
+
+    The ISO-8601 timestamps the API returns are parsed directly; anything else falls back to dateutil's parser.
+    Values that are already dates, and None, are returned unchanged so model properties can call this every
+    time they are read.
+
+    :param value: the text of the date
+    :return: the parsed date
+    :rtype: datetime
+    """
+    if value is None or isinstance(value, (datetime, date)):
+        return value
+
+    match = _ISO_8601.match(value)
+    if match is None:
+        return dateutil.parser.parse(value)
+
+    year, month, day, hour, minute, second, fraction, zone = match.groups()
+    try:
+        return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0),
+                        int(fraction.ljust(6, '0')) if fraction else 0, _tz(zone) if zone else None)
+    except ValueError:
+        return dateutil.parser.parse(value)
@@ -1,4 +1,6 @@
 class DistanceMetric(object):
+    __slots__ = ('_anomaly_score', '_distance', '_data')
+
     def __init__(self, metric_dict):
         keys = ['anomaly','mahalanobis_distance']
         try:
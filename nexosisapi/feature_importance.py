@@ -3,10 +3,32 @@ from nexosisapi.paged_list import PagedList
 
 
 class FeatureImportance(Session):
+    __slots__ = ('_scores', '_page_number', '_total_pages', '_page_size', '_item_total')
+
     def __init__(self, scores_dict=None):
         super(FeatureImportance, self).__init__(scores_dict)
         self._scores = scores_dict.get('featureImportance', {})
+        self._page_number = scores_dict.get('pageNumber', 0)
+        self._total_pages = scores_dict.get('totalPages', 0)
+        self._page_size = scores_dict.get('pageSize', 50)
+        self._item_total = scores_dict.get('totalCount', 0)
 
     @property
     def scores(self):
-        return self._scores
\ No newline at end of file
+        return self._scores
+
+    @property
+    def page_number(self):
+        return self._page_number
+
+    @property
+    def total_pages(self):
+        return self._total_pages
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @property
+    def item_total(self):
+        return self._item_total
@@ -1,7 +1,7 @@
 from enum import Enum
-import dateutil.parser
 
 from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.dates import parse_datetime
 from nexosisapi.status import Status
 
 
@@ -12,6 +12,9 @@ class ImportType(Enum):
 
 
 class ImportResponse(object):
+    __slots__ = ('_import_id', '_type', '_status', '_dataset_name', '_requested_date', '_status_history', '_links',
+                 '_parameters', '_messages', '_column_metadata')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
@@ -20,7 +23,7 @@ class ImportResponse(object):
         self._type = ImportType[data_dict['type']]
         self._status = Status[data_dict['status']]
         self._dataset_name = data_dict['dataSetName']
-        self._requested_date = dateutil.parser.parse(data_dict['requestedDate'])
+        self._requested_date = data_dict['requestedDate']
         self._status_history = data_dict['statusHistory']
         self._links = data_dict['links']
         self._parameters = data_dict['parameters']
@@ -66,4 +69,5 @@ class ImportResponse(object):
 
     @property
     def requested_date(self):
+        self._requested_date = parse_datetime(self._requested_date)
         return self._requested_date
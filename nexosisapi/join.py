@@ -5,6 +5,8 @@ from nexosisapi.dataset_join import DatasetJoin
 class Join(object):
     """An object that represents the definition of a join within a view"""
 
+    __slots__ = ('_dataset_name', '_join_target', '_column_options', '_joins')
+
     def __init__(self, data_dict):
         if data_dict is None:
             data_dict = {}
@@ -1,4 +1,6 @@
 class Link(object):
+    __slots__ = ('_rel', '_href')
+
     def __init__(self, rel, href):
         self._rel = rel
         self._href = href
@@ -3,6 +3,9 @@ from nexosisapi.column_metadata import ColumnMetadata
 
 
 class ModelSummary(object):
+    __slots__ = ('_model_id', '_prediction_domain', '_datasource_name', '_created_on', '_algorithm',
+                 '_column_metadata', '_metrics')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
@@ -57,6 +60,8 @@ class ModelSummary(object):
 
 
 class PredictResults(ModelSummary):
+    __slots__ = ('_data',)
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
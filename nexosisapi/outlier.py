@@ -1,4 +1,6 @@
 class Outlier(object):
+    __slots__ = ('_timestamp', '_actual', '_smooth')
+
     def __init__(self, outlier_data):
         self._timestamp = outlier_data.get('timeStamp')
         try:
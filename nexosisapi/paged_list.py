@@ -2,6 +2,8 @@ from nexosisapi.link import Link
 
 
 class PagedList(list):
+    __slots__ = ('_page_number', '_total_pages', '_page_size', '_item_total', '_links')
+
     def __init__(self, *args, **kwargs):
         super(PagedList, self).__init__(args[0])
         if kwargs is not None:
@@ -1,8 +1,7 @@
 from enum import Enum
 
-import dateutil.parser
-
 from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.dates import parse_datetime
 from nexosisapi.status import Status
 from nexosisapi.time_interval import TimeInterval
 
@@ -15,6 +14,11 @@ class SessionType(Enum):
 
 
 class Session(object):
+    __slots__ = ('_session_id', '_type', '_status', '_status_history', '_datasource_name', '_target_column',
+                 '_model_id', '_start_date', '_end_date', '_requested_date', '_links', '_extra_parameters',
+                 '_result_interval', '_available_prediction_intervals', '_prediction_domain', '_column_metadata',
+                 '_supports_feature_importance')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
@@ -29,15 +33,10 @@ class Session(object):
             self._model_id = data_dict['modelId']
         else:
             self._model_id = None
-        if 'startDate' in data_dict:
-            self._start_date = dateutil.parser.parse(data_dict['startDate'])
-        else:
-            self._start_date = None
-        if 'endDate' in data_dict:
-            self._end_date = dateutil.parser.parse(data_dict['endDate'])
-        else:
-            self._end_date = None
-        self._requested_date = dateutil.parser.parse(data_dict['requestedDate'])
+        # dates are kept as text until they are first read, which saves parsing them for every session in a list
+        self._start_date = data_dict.get('startDate')
+        self._end_date = data_dict.get('endDate')
+        self._requested_date = data_dict['requestedDate']
         self._links = data_dict['links']
         self._extra_parameters = data_dict['extraParameters']
         self._result_interval = TimeInterval[data_dict['resultInterval']] \
@@ -79,14 +78,17 @@ class Session(object):
 
     @property
     def start_date(self):
+        self._start_date = parse_datetime(self._start_date)
         return self._start_date
 
     @property
     def end_date(self):
+        self._end_date = parse_datetime(self._end_date)
         return self._end_date
 
     @property
     def requested_date(self):
+        self._requested_date = parse_datetime(self._requested_date)
         return self._requested_date
 
     @property
@@ -136,12 +138,15 @@ class Session(object):
     'links': %s
     'supportsFeatureImportance': %s
 })""" % (self._session_id, self._type.name, self._status.name, self._status_history, self._datasource_name,
-            self._target_column, self._model_id, self._start_date, self._end_date, self._result_interval.name,
-            self._column_metadata, self._requested_date, self._available_prediction_intervals,
+            self._target_column, self._model_id, self.start_date, self.end_date, self._result_interval.name,
+            self._column_metadata, self.requested_date, self._available_prediction_intervals,
             self._extra_parameters, self._links, self._supports_feature_importance)
 
 
 class SessionResponse(Session):
+    __slots__ = ('_dataset_count', '_datasets_allowed', '_session_count', '_sessions_allowed', '_prediction_count',
+                 '_predictions_allowed')
+
     def __init__(self, data_dict, headers):
         super(SessionResponse, self).__init__(data_dict)
         self._dataset_count = headers.get('nexosis-account-datasetcount-current')
@@ -177,11 +182,17 @@ class SessionResponse(Session):
 
 
 class SessionResult(Session):
+    __slots__ = ('_metrics', '_data', '_page_number', '_total_pages', '_page_size', '_item_total')
+
     def __init__(self, data_dict):
         super(SessionResult, self).__init__(data_dict)
 
         self._metrics = data_dict['metrics']
         self._data = data_dict['data']
+        self._page_number = data_dict.get('pageNumber', 0)
+        self._total_pages = data_dict.get('totalPages', 1)
+        self._page_size = data_dict.get('pageSize', len(self._data or []))
+        self._item_total = data_dict.get('totalCount', len(self._data or []))
 
     @property
     def metrics(self):
@@ -191,6 +202,22 @@ class SessionResult(Session):
     def data(self):
         return self._data
 
+    @property
+    def page_number(self):
+        return self._page_number
+
+    @property
+    def total_pages(self):
+        return self._total_pages
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @property
+    def item_total(self):
+        return self._item_total
+
     def __repr__(self):
         return """SessionResult({
     'sessionId': '%s',
@@ -211,7 +238,7 @@ class SessionResult(Session):
     'metrics': %s,
     'data': %s
 })""" % (self._session_id, self._type.name, self._status.name, self._status_history, self._datasource_name,
-            self._target_column, self._model_id, self._start_date, self._end_date, self._result_interval.name,
-            self._column_metadata, self._requested_date, self._available_prediction_intervals,
+            self._target_column, self._model_id, self.start_date, self.end_date, self._result_interval.name,
+            self._column_metadata, self.requested_date, self._available_prediction_intervals,
             self._extra_parameters, self._links, self._metrics, self._data)
 
@@ -2,6 +2,8 @@ from nexosisapi.session import Session
 from nexosisapi.algorithm_contestant import AlgorithmContestant
 
 class SessionContest(Session):
+    __slots__ = ('_champion', '_contestants', '_champion_metric')
+
     def __init__(self, data_dict=None):
         super(SessionContest, self).__init__(data_dict)
         self._champion = data_dict.get('champion')
@@ -1,6 +1,8 @@
 from nexosisapi.session import Session
 
 class SessionSelectionMetrics(Session):
+    __slots__ = ('_metric_sets',)
+
     def __init__(self, data_dict):
         super(SessionSelectionMetrics, self).__init__(data_dict)
         self._metric_sets = data_dict.get('metricSets', [])
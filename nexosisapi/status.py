@@ -8,3 +8,6 @@ class Status(Enum):
     cancelled = 3,
     failed = 4,
     estimated = 5
+
+
+FINISHED_STATUSES = frozenset([Status.completed, Status.cancelled, Status.failed, Status.estimated])
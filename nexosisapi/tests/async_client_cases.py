@@ -0,0 +1,85 @@
+import asyncio
+import datetime
+import io
+import unittest
+
+from nexosisapi import AsyncClient
+from nexosisapi.client.aio.http_client import _encode_params, _error_body
+from nexosisapi.model_summary import PredictResults
+from nexosisapi.session import SessionResponse
+from nexosisapi.tests.fake_async_http_client import FakeAsyncHttpClient
+
+
+def run(coroutine):
+    # asyncio.run needs python 3.7, and the asynchronous client supports 3.5
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+class AsyncClientTests(unittest.TestCase):
+    session_data = {
+        'sessionId': 'f8d11e26-79f0-43b4-9545-111b8eaa00a5',
+        'type': 'model',
+        'status': 'completed',
+        'requestedDate': '2017-12-19T04:30:16.070806+00:00',
+        'statusHistory': [],
+        'extraParameters': {},
+        'dataSourceName': 'ds',
+        'targetColumn': 'y',
+        'links': []
+    }
+
+    def test_get_session_builds_session_response(self):
+        http = FakeAsyncHttpClient(self.session_data, {'nexosis-account-sessioncount-current': '3'})
+        actual = run(AsyncClient(client=http).sessions.get('f8d11e26-79f0-43b4-9545-111b8eaa00a5'))
+
+        self.assertIsInstance(actual, SessionResponse)
+        self.assertEqual(actual.session_count, '3')
+        self.assertEqual(http.calls[0][1], 'sessions/f8d11e26-79f0-43b4-9545-111b8eaa00a5')
+
+    def test_predict_posts_features(self):
+        http = FakeAsyncHttpClient({'modelId': 'm', 'data': [{'x': 1, 'y': 2}]})
+        actual = run(AsyncClient(client=http).models.predict('m', [{'x': 1}]))
+
+        self.assertIsInstance(actual, PredictResults)
+        verb, uri, args = http.calls[0]
+        self.assertEqual((verb, uri), ('POST', 'models/m/predict'))
+        self.assertEqual(args['data']['data'], [{'x': 1}])
+
+    def test_concurrent_requests_share_transport(self):
+        http = FakeAsyncHttpClient({'items': []})
+
+        async def fan_out():
+            async with AsyncClient(client=http) as client:
+                return await asyncio.gather(*[client.datasets.list() for _ in range(20)])
+
+        results = run(fan_out())
+        self.assertEqual(len(results), 20)
+        self.assertEqual(len(http.calls), 20)
+        self.assertTrue(http.closed)
+
+    def test_encode_params_matches_requests_behaviour(self):
+        actual = _encode_params({'page': 0, 'missing': None, 'include': ['a', 'b'], 'flag': True,
+                                 'startDate': datetime.datetime(2017, 1, 1)})
+        self.assertIn(('page', 0), actual)
+        self.assertIn(('include', 'a'), actual)
+        self.assertIn(('include', 'b'), actual)
+        self.assertIn(('flag', 'True'), actual)
+        self.assertIn(('startDate', '2017-01-01 00:00:00'), actual)
+        self.assertNotIn('missing', [k for k, _ in actual])
+
+    def test_get_csv_writes_bytes_to_text_file(self):
+        http = FakeAsyncHttpClient(u'x,y\n1,\u00e9\n'.encode('utf-8'))
+        target = io.StringIO()
+        run(AsyncClient(client=http).datasets.get_csv('test', target))
+
+        self.assertEqual(target.getvalue(), u'x,y\n1,\u00e9\n')
+
+    def test_error_body_tolerates_non_json(self):
+        self.assertEqual(_error_body(b'<html>502 Bad Gateway</html>'), {})
+        self.assertEqual(_error_body(b'{"statusCode": 404}'), {'statusCode': 404})
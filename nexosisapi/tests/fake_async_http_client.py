@@ -0,0 +1,16 @@
+class FakeAsyncHttpClient(object):
+    def __init__(self, return_value, headers=None):
+        self._return = return_value
+        self._headers = headers or {}
+        self.calls = []
+        self.closed = False
+
+    async def request(self, verb, uri, **kwargs):
+        self.calls.append((verb, uri, kwargs))
+        return self._return
+
+    async def request_with_headers(self, verb, uri_path, **kwargs):
+        return await self.request(verb, uri_path, **kwargs), 200, self._headers
+
+    async def close(self):
+        self.closed = True
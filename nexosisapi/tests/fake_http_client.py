@@ -4,6 +4,7 @@ class FakeHttpClient(object):
         self._verb = None
         self._uri = None
         self._args = None
+        self._calls = []
 
     @property
     def verb(self):
@@ -17,12 +18,22 @@ class FakeHttpClient(object):
     def args(self):
         return self._args
 
+    @property
+    def calls(self):
+        return self._calls
+
     def request(self, verb, uri, **kwargs):
         self._verb = verb
         self._uri = uri
         self._args = kwargs
+        self._calls.append((verb, uri, kwargs))
         return self._return
 
     def request_with_headers(self, verb, uri_path, **kwargs):
         return self.request(verb=verb, uri=uri_path, **kwargs), None, {}
 
+    def stream(self, verb, uri_path, **kwargs):
+        yield self.request(verb=verb, uri=uri_path, **kwargs)
+
+    def close(self):
+        pass
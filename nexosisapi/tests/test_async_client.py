@@ -0,0 +1,5 @@
+import sys
+
+# the asynchronous client, and its tests, use syntax added in python 3.5, so they are only loaded from there on
+if sys.version_info >= (3, 5):
+    from nexosisapi.tests.async_client_cases import AsyncClientTests  # noqa: F401
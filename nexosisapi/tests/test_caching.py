@@ -0,0 +1,234 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from nexosisapi import Client, SESSION_STATUS_HEADER
+from nexosisapi.client.caching import LRUCache, PredictionCache, MemoryResultCache, DiskResultCache
+from nexosisapi.tests.fake_http_client import FakeHttpClient
+
+
+class LRUCacheTests(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        target = LRUCache(max_entries=2)
+        target.set('a', 1)
+        target.set('b', 2)
+        target.get('a')
+        target.set('c', 3)
+
+        self.assertEqual(target.get('a'), 1)
+        self.assertIsNone(target.get('b'))
+        self.assertEqual(target.get('c'), 3)
+
+    def test_size_limit_evicts_entries(self):
+        target = LRUCache(max_entries=None, max_bytes=10)
+        target.set('a', 1, size=6)
+        target.set('b', 2, size=6)
+        target.set('c', 3, size=20)
+
+        self.assertIsNone(target.get('a'))
+        self.assertEqual(target.get('b'), 2)
+        self.assertIsNone(target.get('c'))
+        self.assertEqual(target.size, 6)
+
+    def test_expired_entries_are_missing(self):
+        target = LRUCache(ttl=-1)
+        target.set('a', 1)
+
+        self.assertIsNone(target.get('a'))
+        self.assertEqual(len(target), 0)
+
+    def test_counts_hits_and_misses(self):
+        target = LRUCache()
+        target.set('a', 1)
+        target.get('a')
+        target.get('b')
+
+        self.assertEqual((target.hits, target.misses), (1, 1))
+
+
+class PredictionCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+
+        def request(verb, uri, **kwargs):
+            rows = kwargs['data']['data']
+            self.sent.append(rows)
+            return {'modelId': 'm', 'algorithm': {'name': 'a'}, 'data': [dict(row, y=row['x'] * 2) for row in rows]}
+
+        self.http = FakeHttpClient({})
+        self.http.request = request
+        self.client = Client(client=self.http)
+        self.client.models.prediction_cache = PredictionCache()
+
+    def test_only_missing_rows_are_sent(self):
+        self.client.models.predict('m', [{'x': 1}, {'x': 2}])
+        actual = self.client.models.predict('m', [{'x': 2}, {'x': 3}, {'x': 1}])
+
+        self.assertEqual(self.sent, [[{'x': 1}, {'x': 2}], [{'x': 3}]])
+        self.assertEqual([row['y'] for row in actual.data], [4, 6, 2])
+        self.assertEqual(self.client.models.prediction_cache.hits, 2)
+
+    def test_all_hits_keep_model_details(self):
+        self.client.models.predict('m', [{'x': 1}])
+        actual = self.client.models.predict('m', [{'x': 1}])
+
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(actual.model_id, 'm')
+        self.assertEqual(actual.algorithm.name, 'a')
+        self.assertEqual(actual.data, [{'x': 1, 'y': 2}])
+
+    def test_key_ignores_dict_order_but_not_parameters(self):
+        self.client.models.predict('m', [{'x': 1, 'z': 0}])
+        self.client.models.predict('m', [{'z': 0, 'x': 1}])
+        self.client.models.predict('m', [{'x': 1, 'z': 0}], extra_parameters={'includeClassScores': True})
+
+        self.assertEqual(len(self.sent), 2)
+
+    def test_duplicate_rows_are_sent_once(self):
+        actual = self.client.models.predict('m', [{'x': 5}, {'x': 5}])
+
+        self.assertEqual(self.sent, [[{'x': 5}]])
+        self.assertEqual([row['y'] for row in actual.data], [10, 10])
+
+    def test_changing_returned_rows_leaves_cache_alone(self):
+        self.client.models.predict('m', [{'x': 1}]).data[0]['y'] = 'changed'
+        actual = self.client.models.predict('m', [{'x': 1}, {'x': 1}])
+
+        actual.data[0]['y'] = 'changed'
+        self.assertEqual(actual.data[1], {'x': 1, 'y': 2})
+        self.assertEqual(self.client.models.predict('m', [{'x': 1}]).data, [{'x': 1, 'y': 2}])
+
+    def test_partial_response_raises(self):
+        self.http.request = lambda verb, uri, **kwargs: {'modelId': 'm', 'data': [{'x': 1, 'y': 2}]}
+
+        with self.assertRaises(ValueError):
+            self.client.models.predict('m', [{'x': 1}, {'x': 2}])
+
+
+class ResultHttpClient(FakeHttpClient):
+    def __init__(self, status='completed'):
+        super(ResultHttpClient, self).__init__(None)
+        self.status = status
+
+    def request(self, verb, uri, **kwargs):
+        super(ResultHttpClient, self).request(verb, uri, **kwargs)
+        if uri.endswith('/champion'):
+            return {'id': 'c', 'algorithm': {'key': 'a', 'name': 'a', 'description': ''}, 'metrics': {},
+                    'links': [], 'dataSourceProperties': []}
+        return {'sessionId': 'abc', 'type': 'model', 'status': self.status, 'statusHistory': [],
+                'requestedDate': '2017-12-19T04:30:16.070806+00:00', 'extraParameters': {},
+                'dataSourceName': 'ds', 'targetColumn': 'y', 'data': [], 'metrics': {}, 'links': []}
+
+    def request_with_headers(self, verb, uri_path, **kwargs):
+        return self.request(verb, uri_path, **kwargs), 200, {SESSION_STATUS_HEADER: self.status}
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.http = ResultHttpClient()
+        self.sessions = Client(client=self.http).sessions
+        self.sessions.result_cache = MemoryResultCache()
+
+    def test_completed_results_are_downloaded_once(self):
+        self.sessions.get_results('abc')
+        self.sessions.get_results('abc')
+
+        self.assertEqual([call[0] for call in self.http.calls], ['GET'])
+        self.assertEqual(self.sessions.result_cache.hit_rate, 0.5)
+
+    def test_unfinished_results_are_not_cached(self):
+        self.http.status = 'started'
+        self.sessions.get_results('abc')
+        self.sessions.get_results('abc')
+
+        self.assertEqual([call[0] for call in self.http.calls], ['GET', 'GET'])
+
+    def test_results_taken_before_completion_are_not_cached(self):
+        self.http.status = 'started'
+        request = self.http.request
+
+        def finish_during_download(verb, uri, **kwargs):
+            response = request(verb, uri, **kwargs)
+            self.http.status = 'completed'
+            return response
+
+        self.http.request = finish_during_download
+        self.sessions.get_results('abc')
+        self.sessions.get_results('abc')
+        self.sessions.get_results('abc')
+
+        self.assertEqual([call[0] for call in self.http.calls], ['GET', 'GET'])
+
+    def test_results_without_status_are_cached_once_completion_is_known(self):
+        self.sessions.get_champion('abc')
+        self.sessions.get_champion('abc')
+        self.sessions.get('abc')
+        self.sessions.get_champion('abc')
+        self.sessions.get_champion('abc')
+
+        self.assertEqual([call[1] for call in self.http.calls],
+                         ['sessions/abc/contest/champion', 'sessions/abc/contest/champion', 'sessions/abc',
+                          'sessions/abc/contest/champion'])
+
+    def test_listed_sessions_record_completion(self):
+        request = self.http.request
+
+        def list_sessions(verb, uri, **kwargs):
+            response = request(verb, uri, **kwargs)
+            return {'items': [response], 'pageNumber': 0, 'totalPages': 1} if uri == 'sessions' else response
+
+        self.http.request = list_sessions
+        self.sessions.list()
+        self.sessions.get_champion('abc')
+        self.sessions.get_champion('abc')
+
+        self.assertEqual([call[1] for call in self.http.calls], ['sessions', 'sessions/abc/contest/champion'])
+
+    def test_pages_are_cached_separately(self):
+        self.sessions.get_feature_importance('abc', page_number=0)
+        self.sessions.get_feature_importance('abc', page_number=1)
+        self.sessions.get_feature_importance('abc', page_number=0)
+
+        self.assertEqual([call[0] for call in self.http.calls], ['GET', 'GET'])
+
+    def test_remove_invalidates_session(self):
+        self.sessions.get_results('abc')
+        self.sessions.remove('abc')
+        self.sessions.get_results('abc')
+
+        self.assertEqual([call[0] for call in self.http.calls], ['GET', 'DELETE', 'GET'])
+
+
+class DiskResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_results_are_shared_between_caches(self):
+        DiskResultCache(self.directory).set('abc', 'sessions/abc/results', {'data': [1]})
+        target = DiskResultCache(self.directory)
+
+        self.assertEqual(target.get('abc', 'sessions/abc/results'), {'data': [1]})
+        self.assertIsNone(target.get('abc', 'sessions/abc/contest'))
+        self.assertEqual((target.hits, target.misses), (1, 1))
+
+    def test_invalidate_and_clear(self):
+        target = DiskResultCache(self.directory)
+        target.set('abc', 'a', {})
+        target.set('def', 'a', {})
+        target.invalidate('abc')
+
+        self.assertIsNone(target.get('abc', 'a'))
+        self.assertEqual(target.get('def', 'a'), {})
+        target.clear()
+        self.assertIsNone(target.get('def', 'a'))
+
+    def test_unsafe_session_ids_stay_inside_directory(self):
+        target = DiskResultCache(self.directory)
+        target.set('../outside', 'a', {})
+
+        self.assertEqual(target.get('../outside', 'a'), {})
+        self.assertEqual(len(os.listdir(self.directory)), 1)
@@ -0,0 +1,101 @@
+import unittest
+
+from requests.exceptions import ConnectionError
+
+from nexosisapi import ClientError, CircuitOpenError
+from nexosisapi.client.backoff import is_transient
+from nexosisapi.client.circuit_breaker import CircuitBreaker
+from nexosisapi.client.endpoints import endpoint_family
+from nexosisapi.client.rate_limit import RateLimiter
+from nexosisapi.client.retry import RetryPolicy
+from nexosisapi.tests.test_http_client import FakeResponse
+from nexosisapi.tests.test_retry import SequenceHttpClient
+
+
+class EndpointFamilyTests(unittest.TestCase):
+    def test_groups_by_first_segment(self):
+        self.assertEqual(endpoint_family('/data/sales?page=1'), 'data')
+        self.assertEqual(endpoint_family('sessions/abc/results'), 'sessions')
+        self.assertEqual(endpoint_family('/vocabulary/123'), 'vocabulary')
+
+    def test_separates_predictions_from_models(self):
+        self.assertEqual(endpoint_family('models/abc/predict'), 'models/*/predict')
+        self.assertEqual(endpoint_family('models/abc'), 'models')
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def _fail(self, target, path, count, error=None):
+        for _ in range(count):
+            target.record(target.allow(path), error or ClientError(path, 503, {}), 0.1)
+
+    def test_opens_when_failure_rate_is_reached(self):
+        target = CircuitBreaker(failure_rate=0.5, minimum_calls=4)
+        target.record(target.allow('data'), None, 0.1)
+        self._fail(target, 'data', 2)
+        self.assertEqual(target.state('data'), 'closed')
+
+        self._fail(target, 'data', 1)
+
+        self.assertEqual(target.state('data'), 'open')
+        with self.assertRaises(CircuitOpenError):
+            target.allow('data/sales')
+        self.assertEqual(target.state('sessions'), 'closed')
+        target.allow('sessions')
+
+    def test_client_errors_are_not_failures(self):
+        target = CircuitBreaker(minimum_calls=2)
+        self._fail(target, 'data', 5, ClientError('data', 404, {}))
+
+        self.assertEqual(target.state('data'), 'closed')
+
+    def test_slow_calls_count_as_failures(self):
+        target = CircuitBreaker(minimum_calls=2, slow_call_duration=1)
+        for _ in range(2):
+            target.record(target.allow('views'), None, 5)
+
+        self.assertEqual(target.state('views'), 'open')
+
+    def test_half_open_trial_closes_or_reopens(self):
+        target = CircuitBreaker(minimum_calls=1, open_duration=0)
+        self._fail(target, 'imports', 1)
+        self.assertEqual(target.state('imports'), 'half_open')
+
+        family = target.allow('imports')
+        with self.assertRaises(CircuitOpenError):
+            target.allow('imports')
+        target.record(family, ConnectionError(), 0.1)
+        self.assertEqual(target.state('imports'), 'half_open')
+
+        target.record(target.allow('imports'), None, 0.1)
+        self.assertEqual(target.state('imports'), 'closed')
+
+    def test_http_client_fails_fast_while_open(self):
+        breaker = CircuitBreaker(minimum_calls=2)
+        http = SequenceHttpClient([FakeResponse({}, 502), FakeResponse({}, 503)], circuit_breaker=breaker,
+                                  retry_policy=RetryPolicy(initial=0))
+
+        with self.assertRaises(CircuitOpenError):
+            http.request('GET', 'models/abc/predict')
+        self.assertEqual(len(http.sessions[0].calls), 2)
+        self.assertEqual(http.request('GET', 'models'), {'ok': True})
+
+    def test_rate_limiter_waits_are_not_slow_calls(self):
+        breaker = CircuitBreaker(minimum_calls=2, slow_call_duration=0.1)
+        http = SequenceHttpClient([], circuit_breaker=breaker, rate_limiter=RateLimiter(rate=5, capacity=1))
+
+        for _ in range(3):
+            http.request('GET', 'data')
+
+        self.assertEqual(breaker.state('data'), 'closed')
+
+    def test_cancel_frees_half_open_trial(self):
+        target = CircuitBreaker(minimum_calls=1, open_duration=0)
+        self._fail(target, 'views', 1)
+
+        target.cancel(target.allow('views'))
+
+        target.allow('views')
+
+    def test_open_circuit_is_not_transient(self):
+        self.assertTrue(is_transient(ClientError('data', 503, {})))
+        self.assertFalse(is_transient(CircuitOpenError('data', 'data')))
@@ -0,0 +1,71 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from nexosisapi.dataset import Dataset
+from nexosisapi.view_definition import ViewData
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class ColumnarTests(unittest.TestCase):
+    response = {
+        'columns': {
+            'timestamp': {'dataType': 'date', 'role': 'timestamp'},
+            'sales': {'dataType': 'numeric', 'role': 'target'},
+            'open': {'dataType': 'logical', 'role': 'feature'},
+            'store': {'dataType': 'string', 'role': 'feature'}
+        },
+        'data': [
+            {'timestamp': '2017-01-01T00:00:00Z', 'sales': '10.5', 'open': 'True', 'store': 'a', 'note': 'x'},
+            {'timestamp': '2017-01-02T00:00:00+00:00', 'sales': '', 'open': 'false', 'store': 'b'},
+            {'timestamp': '2017-01-02T19:00:00-05:00', 'sales': 3, 'open': '1', 'store': None}
+        ]
+    }
+
+    def test_columns_are_typed_from_metadata(self):
+        actual = Dataset(self.response).to_columns()
+
+        self.assertEqual(list(actual), ['timestamp', 'sales', 'open', 'store', 'note'])
+        self.assertEqual(actual['sales'].dtype, numpy.float64)
+        self.assertTrue(numpy.isnan(actual['sales'][1]))
+        self.assertEqual(actual['sales'][2], 3.0)
+        self.assertEqual(actual['open'].tolist(), [True, False, True])
+        self.assertEqual(actual['store'].tolist(), ['a', 'b', None])
+        self.assertEqual(actual['note'].tolist(), ['x', None, None])
+
+    def test_dates_are_converted_to_utc(self):
+        actual = Dataset(self.response).to_columns()['timestamp']
+
+        self.assertEqual(actual.dtype, numpy.dtype('datetime64[ns]'))
+        self.assertEqual(actual.astype(str).tolist()[1:],
+                         ['2017-01-02T00:00:00.000000000', '2017-01-03T00:00:00.000000000'])
+
+    def test_dtype_overrides_and_column_selection(self):
+        actual = Dataset(self.response).to_columns(dtypes={'sales': 'float32'}, columns=['sales', 'store'])
+
+        self.assertEqual(list(actual), ['sales', 'store'])
+        self.assertEqual(actual['sales'].dtype, numpy.float32)
+
+    def test_integer_dtype_rejects_missing_values(self):
+        with self.assertRaises(ValueError) as context:
+            Dataset(self.response).to_columns(dtypes={'sales': 'int64'})
+
+        self.assertIn('sales', str(context.exception))
+
+    def test_missing_logical_values_are_kept_as_none(self):
+        data = [{'open': 'true'}, {'open': None}, {'open': ''}, {'open': 'False'}]
+        actual = Dataset(dict(self.response, data=data)).to_columns(columns=['open'])['open']
+
+        self.assertEqual(actual.tolist(), [True, None, None, False])
+        with self.assertRaises(ValueError):
+            Dataset(dict(self.response, data=data)).to_columns(dtypes={'open': bool})
+
+    def test_view_to_numpy_builds_structured_array(self):
+        view = ViewData(dict(self.response, viewName='v', dataSetName='d'))
+        actual = view.to_numpy(columns=['sales', 'open'])
+
+        self.assertEqual(actual.dtype.names, ('sales', 'open'))
+        self.assertEqual(actual['open'].tolist(), [True, False, True])
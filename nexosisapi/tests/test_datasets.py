@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+import gc
+import io
+import unittest
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+from nexosisapi import Client, ClientError
+from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.tests.fake_http_client import FakeHttpClient
+
+
+class FlakyHttpClient(FakeHttpClient):
+    """Fails the first request for each chunk starting with a row in `fail_rows`"""
+
+    def __init__(self, return_value, fail_rows):
+        super(FlakyHttpClient, self).__init__(return_value)
+        self._fail_rows = set(fail_rows)
+
+    def request(self, verb, uri, **kwargs):
+        first_row = kwargs['data']['data'][0]['x']
+        if first_row in self._fail_rows:
+            self._fail_rows.remove(first_row)
+            raise ClientError(uri, 503, {})
+        return super(FlakyHttpClient, self).request(verb, uri, **kwargs)
+
+
+class DatasetOperationTests(unittest.TestCase):
+    def setUp(self):
+        self.http = FakeHttpClient({'dataSetName': 'test'})
+        self.client = Client(client=self.http)
+
+    def test_create_sends_single_request_by_default(self):
+        self.client.datasets.create('test', [{'x': 1}, {'x': 2}])
+
+        self.assertEqual(len(self.http.calls), 1)
+        self.assertEqual(self.http.verb, 'PUT')
+        self.assertEqual(self.http.uri, '/data/test')
+
+    def test_create_chunked_uploads_every_row(self):
+        rows = ({'x': i} for i in range(25))
+        metadata = {'x': ColumnMetadata({'dataType': 'numeric'})}
+        reported = []
+
+        self.client.datasets.create('test', rows, metadata=metadata, chunk_size=10, workers=3,
+                                    progress=reported.append)
+
+        sent = [call[2]['data'] for call in self.http.calls]
+        self.assertEqual(len(sent), 3)
+        self.assertEqual(sent[0]['columns'], metadata)
+        self.assertTrue(all('columns' not in body for body in sent[1:]))
+        self.assertEqual(sorted(row['x'] for body in sent for row in body['data']), list(range(25)))
+        self.assertEqual(reported, [10, 20, 25])
+
+    def test_create_chunked_retries_failed_chunk(self):
+        http = FlakyHttpClient({'dataSetName': 'test'}, fail_rows=[10])
+        client = Client(client=http)
+
+        client.datasets.create('test', [{'x': i} for i in range(20)], chunk_size=10, workers=2, retries=1)
+
+        self.assertEqual(len(http.calls), 2)
+
+    def test_create_chunked_raises_when_retries_exhausted(self):
+        http = FlakyHttpClient({'dataSetName': 'test'}, fail_rows=[10])
+        client = Client(client=http)
+
+        with self.assertRaises(ClientError):
+            client.datasets.create('test', [{'x': i} for i in range(20)], chunk_size=10, retries=0)
+
+    def test_create_csv_streams_text_file(self):
+        csv_file = io.StringIO(u'x,y\n1,a\n2,b\n')
+        self.client.datasets.create_csv('test', csv_file)
+
+        body = self.http.args['data']
+        self.assertFalse(isinstance(body, (str, bytes)))
+        self.assertEqual(b''.join(body), b'x,y\n1,a\n2,b\n')
+        self.assertEqual(self.http.args['headers']['Content-Type'], 'text/csv')
+
+    def test_create_csv_passes_binary_file_through(self):
+        csv_file = io.BytesIO(b'x,y\n1,a\n')
+        self.client.datasets.create_csv('test', csv_file)
+
+        self.assertIs(self.http.args['data'], csv_file)
+
+    def test_create_csv_splits_on_rows_with_header(self):
+        csv_file = io.StringIO(u'x,y\n1,"multi\nline"\n2,b\n3,c\n')
+        self.client.datasets.create_csv('test', csv_file, rows_per_request=2, workers=1)
+
+        bodies = [call[2]['data'] for call in self.http.calls]
+        self.assertEqual(bodies, ['x,y\n1,"multi\nline"\n2,b\n', 'x,y\n3,c\n'])
+
+    def test_create_csv_split_leaves_binary_file_open(self):
+        csv_file = io.BytesIO(u'x,y\n1,é\n2,b\n'.encode('utf-8'))
+        self.client.datasets.create_csv('test', csv_file, rows_per_request=1, workers=1)
+        gc.collect()
+
+        self.assertFalse(csv_file.closed)
+        self.assertEqual([call[2]['data'] for call in self.http.calls], [u'x,y\n1,é\n', 'x,y\n2,b\n'])
+
+    def test_get_csv_writes_bytes_to_text_file(self):
+        http = FakeHttpClient(u'x,y\n1,é\n'.encode('utf-8'))
+        target = io.StringIO()
+        Client(client=http).datasets.get_csv('test', target)
+
+        self.assertEqual(target.getvalue(), u'x,y\n1,é\n')
+        self.assertEqual(http.args['headers'], {'Accept': 'text/csv'})
+
+    def _serve_csv_pages(self, pages, total):
+        requested = []
+
+        def stream(verb, uri_path, **kwargs):
+            requested.append((kwargs['params']['page'], kwargs['params']['pageSize']))
+            return iter(pages[kwargs['params']['page']])
+
+        self.http = FakeHttpClient({'dataSetName': 'test', 'totalCount': total, 'data': [], 'columns': {}})
+        self.http.stream = stream
+        self.client = Client(client=self.http)
+        return requested
+
+    def test_get_csv_all_pages_writes_one_header(self):
+        pages = {0: [b'x,y\n1,a\n', b'2,b\n'], 1: [b'x,', b'y\n3,c\n4,d\n'], 2: [b'x,y\n5,e']}
+        requested = self._serve_csv_pages(pages, 5)
+        target = io.BytesIO()
+        self.client.datasets.get_csv('test', target, page_size=2, all_pages=True)
+
+        self.assertEqual(target.getvalue(), b'x,y\n1,a\n2,b\n3,c\n4,d\n5,e')
+        self.assertEqual(requested, [(0, 2), (1, 2), (2, 2)])
+
+    def test_get_csv_all_pages_from_later_page_keeps_header(self):
+        pages = {2: [b'x,y\n5,e\n6,f\n'], 3: [b'x,y\n7,g\n']}
+        self._serve_csv_pages(pages, 7)
+        target = io.BytesIO()
+        self.client.datasets.get_csv('test', target, page_number=2, page_size=2, all_pages=True)
+
+        self.assertEqual(target.getvalue(), b'x,y\n5,e\n6,f\n7,g\n')
+
+    def test_get_csv_all_pages_counts_rows_not_lines(self):
+        pages = {0: [b'x,y\n1,"multi\nline"\n2,b\n'], 1: [b'x,y\n3,c\n']}
+        requested = self._serve_csv_pages(pages, 3)
+        target = io.BytesIO()
+        self.client.datasets.get_csv('test', target, page_size=2, all_pages=True)
+
+        self.assertEqual(target.getvalue(), b'x,y\n1,"multi\nline"\n2,b\n3,c\n')
+        self.assertEqual(requested, [(0, 2), (1, 2)])
+
+    def test_get_csv_all_pages_limits_page_size(self):
+        requested = self._serve_csv_pages({0: [b'x\n'], 1: [b'x\n']}, 1500)
+        self.client.datasets.get_csv('test', io.BytesIO(), page_size=5000, all_pages=True)
+
+        self.assertEqual(requested, [(0, 1000), (1, 1000)])
+
+
+@unittest.skipIf(pandas is None, 'pandas is not installed')
+class DatasetFrameTests(unittest.TestCase):
+    columns = {'when': {'dataType': 'date', 'role': 'timestamp'}, 'x': {'dataType': 'numeric', 'role': 'target'},
+               'ok': {'dataType': 'logical', 'role': 'feature'}, 'name': {'dataType': 'string', 'role': 'feature'}}
+
+    def setUp(self):
+        self.http = FakeHttpClient({'dataSetName': 'test'})
+        self.client = Client(client=self.http)
+
+    def test_create_from_frame_streams_csv(self):
+        frame = pandas.DataFrame({'x': range(5), 'name': list('abcde')})
+        self.client.datasets.create_from_frame('test', frame)
+
+        self.assertEqual(self.http.args['headers'], {'Content-Type': 'text/csv'})
+        self.assertEqual(b''.join(self.http.args['data']), b'x,name\n0,a\n1,b\n2,c\n3,d\n4,e\n')
+
+    def test_create_from_frame_sends_metadata_then_csv_chunks(self):
+        frame = pandas.DataFrame({'x': range(5)})
+        metadata = {'x': ColumnMetadata({'dataType': 'numeric'})}
+        reported = []
+        self.client.datasets.create_from_frame('test', frame, metadata, rows_per_request=2, workers=2,
+                                               progress=reported.append)
+
+        sent = [call[2]['data'] for call in self.http.calls]
+        self.assertEqual(sent[0], {'data': [{'x': 0}, {'x': 1}], 'columns': metadata})
+        self.assertEqual(sent[1:], [b'x\n2\n3\n', b'x\n4\n'])
+        self.assertEqual(reported, [2, 4, 5])
+
+    def test_get_frame_reads_pages_with_metadata_types(self):
+        pages = {0: b'when,x,ok,name\n2017-01-01T00:00:00Z,1.5,True,a\n2017-01-02T00:00:00Z,,False,b',
+                 1: b'when,x,ok,name\n2017-01-03T00:00:00Z,3,,c\n'}
+        self.http = FakeHttpClient({'data': [{}], 'columns': self.columns, 'totalCount': 3})
+        self.http.stream = lambda verb, uri_path, **kwargs: iter([pages[kwargs['params']['page']]])
+        actual = Client(client=self.http).datasets.get_frame('test', page_size=2)
+
+        self.assertEqual(self.http.args['params']['pageSize'], 1)
+        self.assertEqual(len(actual), 3)
+        self.assertEqual(str(actual['x'].dtype), 'float64')
+        self.assertEqual(str(actual['ok'].dtype), 'boolean')
+        self.assertEqual(str(actual['when'].dt.tz), 'UTC')
+        self.assertEqual(actual['name'].tolist(), ['a', 'b', 'c'])
+        self.assertTrue(pandas.isna(actual['ok'][2]))
+
+    def test_get_frame_of_empty_dataset_has_columns(self):
+        self.http = FakeHttpClient({'data': [], 'columns': self.columns, 'totalCount': 0})
+        actual = Client(client=self.http).datasets.get_frame('test')
+
+        self.assertEqual(sorted(actual.columns), ['name', 'ok', 'when', 'x'])
+        self.assertEqual(len(actual), 0)
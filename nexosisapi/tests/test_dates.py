@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+import unittest
+
+import dateutil.parser
+
+from nexosisapi.dates import parse_datetime
+from nexosisapi.session import Session
+
+
+class ParseDatetimeTests(unittest.TestCase):
+    def test_matches_dateutil_for_api_formats(self):
+        for value in ['2017-12-19T04:30:16.070806+00:00', '2017-12-19T04:30:16.0708069Z', '2017-12-19T04:30:16',
+                      '2017-12-19T04:30:16.07-05:00', '2017-12-19T04:30+0530', '2017-12-19']:
+            actual = parse_datetime(value)
+            expected = dateutil.parser.parse(value)
+            self.assertEqual(actual, expected, value)
+            self.assertEqual(actual.utcoffset(), expected.utcoffset(), value)
+
+    def test_other_formats_fall_back_to_dateutil(self):
+        self.assertEqual(parse_datetime('Dec 19 2017 4:30PM'), datetime(2017, 12, 19, 16, 30))
+
+    def test_dates_and_none_are_unchanged(self):
+        value = datetime(2017, 1, 1)
+
+        self.assertIs(parse_datetime(value), value)
+        self.assertIsNone(parse_datetime(None))
+
+    def test_session_parses_dates_when_read(self):
+        target = Session({'sessionId': 'abc', 'type': 'model', 'status': 'completed', 'statusHistory': [],
+                          'dataSourceName': 'ds', 'targetColumn': 'y', 'links': [], 'extraParameters': {},
+                          'requestedDate': '2017-12-19T04:30:16.070806-05:00'})
+
+        self.assertEqual(target._requested_date, '2017-12-19T04:30:16.070806-05:00')
+        self.assertEqual(target.requested_date.utcoffset(), timedelta(hours=-5))
+        self.assertIsNone(target.start_date)
@@ -0,0 +1,108 @@
+import threading
+import time
+import unittest
+
+from requests.exceptions import ReadTimeout
+
+from nexosisapi import ClientError, DeadlineExceededError
+from nexosisapi.client.backoff import call_with_retries
+from nexosisapi.client.batching import ordered_map
+from nexosisapi.client.deadline import deadline, remaining
+from nexosisapi.client.retry import RetryPolicy
+from nexosisapi.tests.test_http_client import SessionRecordingHttpClient
+from nexosisapi.tests.test_retry import SequenceHttpClient
+
+
+class DeadlineTests(unittest.TestCase):
+    def test_nested_deadlines_keep_the_earliest(self):
+        self.assertIsNone(remaining())
+        with deadline(1):
+            with deadline(60):
+                self.assertTrue(remaining() <= 1)
+            with deadline(None):
+                self.assertIsNotNone(remaining())
+        self.assertIsNone(remaining())
+
+    def test_ordered_map_workers_share_the_deadline(self):
+        seen = []
+        lock = threading.Lock()
+
+        def work(item):
+            with lock:
+                seen.append((threading.current_thread().name, remaining()))
+            return item
+
+        with deadline(30):
+            self.assertEqual(list(ordered_map(work, range(6), 3)), list(range(6)))
+
+        self.assertTrue(all(left is not None and left <= 30 for _, left in seen))
+        self.assertTrue(any(name != threading.current_thread().name for name, _ in seen))
+
+    def test_ordered_map_stops_starting_work_after_the_deadline(self):
+        started = []
+
+        def work(item):
+            started.append(item)
+            time.sleep(0.05)
+            return item
+
+        with self.assertRaises(DeadlineExceededError):
+            with deadline(0.02):
+                list(ordered_map(work, range(20), 2))
+        self.assertTrue(len(started) < 20)
+
+    def test_retries_stop_when_the_deadline_would_pass(self):
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ClientError('data', 503, {})
+
+        # the backoff is jittered, so only a spent deadline rules out every retry
+        with deadline(0):
+            with self.assertRaises(ClientError):
+                call_with_retries(fail, retries=5, initial=1)
+        self.assertEqual(len(calls), 1)
+
+
+class HttpClientTimeoutTests(unittest.TestCase):
+    def test_default_and_per_call_timeouts(self):
+        target = SessionRecordingHttpClient('key', 'https://example.com/v1', timeout=(2, 20))
+        target.request('GET', 'data')
+        target.request('GET', 'data', timeout=5)
+
+        self.assertEqual([c[2]['timeout'] for c in target.sessions[0].calls], [(2, 20), 5])
+
+    def test_deadline_cuts_timeouts_and_stops_requests(self):
+        target = SessionRecordingHttpClient('key', 'https://example.com/v1')
+        with deadline(1):
+            target.request('GET', 'data')
+            connect, read = target.sessions[0].calls[0][2]['timeout']
+            self.assertTrue(connect <= 1 and read <= 1)
+
+        with deadline(0):
+            with self.assertRaises(DeadlineExceededError):
+                target.request('GET', 'data')
+        self.assertEqual(len(target.sessions[0].calls), 1)
+
+    def test_timeout_past_the_deadline_is_not_retried(self):
+        calls = []
+        target = SequenceHttpClient([], retry_policy=RetryPolicy(initial=0))
+        target._new_session = lambda: SlowSession(calls)
+
+        with deadline(0.01):
+            with self.assertRaises(DeadlineExceededError):
+                target.request('GET', 'data')
+        self.assertEqual(len(calls), 1)
+
+
+class SlowSession(object):
+    """Times out only after the deadline has passed"""
+
+    def __init__(self, calls):
+        self._calls = calls
+
+    def request(self, verb, uri, **kwargs):
+        self._calls.append(1)
+        time.sleep(0.02)
+        raise ReadTimeout()
@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from nexosisapi import Client
+from nexosisapi.client.export import export_dataset, export_session_results
+from nexosisapi.tests.test_paging import PagedFakeHttpClient
+
+
+class TypedPagesHttpClient(PagedFakeHttpClient):
+    columns = {'x': {'dataType': 'numeric', 'role': 'target'}, 'odd': {'dataType': 'logical', 'role': 'feature'},
+               'when': {'dataType': 'date', 'role': 'timestamp'}}
+
+    def request(self, verb, uri, **kwargs):
+        response = super(TypedPagesHttpClient, self).request(verb, uri, **kwargs)
+        for row in response['data']:
+            row.update(odd=str(row['x'] % 2 == 1), when='2017-01-%02dT00:00:00Z' % (row['x'] + 1),
+                       name='r%d' % row['x'])
+        response.update(columns=self.columns, metadata=self.columns, sessionId='abc', type='model',
+                        status='completed', statusHistory=[], dataSourceName='ds', targetColumn='x', links=[],
+                        extraParameters={}, requestedDate='2017-12-19T04:30:16+00:00', metrics={})
+        return response
+
+
+class MissingLogicalsHttpClient(TypedPagesHttpClient):
+    def request(self, verb, uri, **kwargs):
+        response = super(MissingLogicalsHttpClient, self).request(verb, uri, **kwargs)
+        for row in response['data']:
+            if row['x'] % 5 == 0:
+                row['odd'] = '' if row['x'] % 10 == 0 else None
+        return response
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class ExportTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.http = TypedPagesHttpClient(total=25, page_size=10, key='data')
+        self.client = Client(client=self.http)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_dataset_exports_typed_parquet(self):
+        path = os.path.join(self.directory, 'data.parquet')
+        written = export_dataset(self.client, 'test', path, page_size=10, workers=3)
+
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(written, 25)
+        self.assertEqual(table.num_rows, 25)
+        self.assertEqual(table.column('x').to_pylist(), [float(i) for i in range(25)])
+        self.assertEqual(str(table.schema.field('odd').type), 'bool')
+        self.assertEqual(str(table.schema.field('when').type), 'timestamp[ns, tz=UTC]')
+        self.assertEqual(table.column('name').to_pylist()[:2], ['r0', 'r1'])
+        self.assertEqual(sorted(self.http.pages_requested), [0, 1, 2])
+
+    def test_session_results_export_to_feather(self):
+        path = os.path.join(self.directory, 'results.feather')
+        export_session_results(self.client, 'abc', path, format='feather', page_size=10)
+
+        table = pyarrow.feather.read_table(path)
+        self.assertEqual(table.num_rows, 25)
+
+    def test_missing_logicals_are_written_as_nulls(self):
+        client = Client(client=MissingLogicalsHttpClient(total=25, page_size=10, key='data'))
+        for format, read in (('parquet', pyarrow.parquet.read_table), ('feather', pyarrow.feather.read_table)):
+            path = os.path.join(self.directory, 'data.' + format)
+            export_dataset(client, 'test', path, format=format, page_size=10)
+
+            odd = read(path).column('odd')
+            self.assertEqual(odd.null_count, 5)
+            self.assertEqual(odd.to_pylist()[:6], [None, True, False, True, False, None])
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            export_dataset(self.client, 'test', os.path.join(self.directory, 'data.csv'), format='csv')
@@ -0,0 +1,88 @@
+import json
+import unittest
+
+from nexosisapi import Client
+from nexosisapi.client.http_client import HttpClient
+
+
+class FakeResponse(object):
+    def __init__(self, body=None, status_code=200, headers=None):
+        self.content = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.status_code = status_code
+        self.headers = headers or {'content-type': 'application/json; charset=utf-8'}
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    def request(self, verb, uri, **kwargs):
+        self.calls.append((verb, uri, kwargs))
+        return FakeResponse({'items': []})
+
+    def close(self):
+        self.closed = True
+
+
+class SessionRecordingHttpClient(HttpClient):
+    def __init__(self, *args, **kwargs):
+        super(SessionRecordingHttpClient, self).__init__(*args, **kwargs)
+        self.sessions = []
+
+    def _new_session(self):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+
+class HttpClientTests(unittest.TestCase):
+    def test_requests_share_one_session(self):
+        target = SessionRecordingHttpClient('key', 'https://example.com/v1/')
+        target.request('GET', 'data')
+        target.request('GET', '/sessions')
+
+        self.assertEqual(len(target.sessions), 1)
+        self.assertEqual([c[1] for c in target.sessions[0].calls],
+                         ['https://example.com/v1/data', 'https://example.com/v1/sessions'])
+
+    def test_close_releases_session_and_reconnects(self):
+        target = SessionRecordingHttpClient('key', 'https://example.com/v1')
+        target.request('GET', 'data')
+        target.close()
+        target.request('GET', 'data')
+
+        self.assertTrue(target.sessions[0].closed)
+        self.assertEqual(len(target.sessions), 2)
+
+    def test_idle_timeout_recycles_session(self):
+        target = SessionRecordingHttpClient('key', 'https://example.com/v1', idle_timeout=0)
+        target.request('GET', 'data')
+        target._last_used -= 1
+        target.request('GET', 'data')
+
+        self.assertTrue(target.sessions[0].closed)
+        self.assertEqual(len(target.sessions), 2)
+
+    def test_resources_share_client_transport(self):
+        http = SessionRecordingHttpClient('key', 'https://example.com/v1')
+        with Client(client=http) as client:
+            client.datasets.list()
+            client.models.list()
+            client.sessions.list()
+
+        self.assertEqual(len(http.sessions), 1)
+        self.assertEqual(len(http.sessions[0].calls), 3)
+        self.assertTrue(http.sessions[0].closed)
+
+    def test_client_passes_pool_options(self):
+        client = Client(key='key', uri='https://example.com/v1', pool_maxsize=32, idle_timeout=30)
+        self.assertEqual(client._client._pool_maxsize, 32)
+        self.assertEqual(client._client._idle_timeout, 30)
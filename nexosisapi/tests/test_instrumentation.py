@@ -0,0 +1,97 @@
+import unittest
+
+from nexosisapi import ClientError
+from nexosisapi.client.circuit_breaker import CircuitBreaker
+from nexosisapi.client.endpoints import path_template
+from nexosisapi.client.instrumentation import Histogram, HistogramCollector, Instrument, to_prometheus
+from nexosisapi.tests.test_http_client import FakeResponse
+from nexosisapi.tests.test_retry import SequenceHttpClient
+
+
+class RecordingInstrument(Instrument):
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(('before_request', event.template, event.status))
+
+    def after_response(self, event):
+        self.calls.append(('after_response', event.template, event.status))
+
+    def on_error(self, event):
+        self.calls.append(('on_error', event.template, event.status))
+
+
+class PathTemplateTests(unittest.TestCase):
+    def test_replaces_ids(self):
+        self.assertEqual(path_template('sessions/abc/results?page=2'), 'sessions/{id}/results')
+        self.assertEqual(path_template('/data/sales'), 'data/{id}')
+        self.assertEqual(path_template('sessions/a/contest/contestants/b'), 'sessions/{id}/contest/contestants/{id}')
+
+    def test_keeps_actions(self):
+        self.assertEqual(path_template('sessions/forecast'), 'sessions/forecast')
+        self.assertEqual(path_template('/imports/s3'), 'imports/s3')
+        self.assertEqual(path_template('/views'), 'views')
+
+
+class HistogramTests(unittest.TestCase):
+    def test_cumulative_counts_and_quantiles(self):
+        target = Histogram((1, 5))
+        for value in (0.5, 1, 3, 10):
+            target.observe(value)
+
+        self.assertEqual(target.cumulative(), [(1, 2), (5, 3), (float('inf'), 4)])
+        self.assertEqual(target.quantile(0.5), 1)
+        self.assertEqual(target.quantile(1), float('inf'))
+        self.assertIsNone(Histogram().quantile(0.5))
+
+
+class InstrumentationTests(unittest.TestCase):
+    def test_hooks_are_called_for_responses_and_errors(self):
+        instrument = RecordingInstrument()
+        http = SequenceHttpClient([FakeResponse({'ok': True}), FakeResponse({}, 404)], instruments=[instrument])
+
+        http.request('GET', 'sessions/abc/results')
+        with self.assertRaises(ClientError):
+            http.request('DELETE', 'data/sales')
+
+        self.assertEqual(instrument.calls, [('before_request', 'sessions/{id}/results', None),
+                                            ('after_response', 'sessions/{id}/results', 200),
+                                            ('before_request', 'data/{id}', None),
+                                            ('on_error', 'data/{id}', 404)])
+
+    def test_collector_records_sizes_and_phases(self):
+        collector = HistogramCollector()
+        http = SequenceHttpClient([], instruments=[collector])
+        http.request('POST', 'models/abc/predict', data={'data': [{'x': 1}]})
+
+        durations = collector.durations
+        phases = sorted(phase for verb, template, phase in durations)
+        self.assertEqual(phases, ['decode', 'download', 'rate_limit', 'total', 'wait'])
+        self.assertEqual(collector.requests, {('POST', 'models/{id}/predict', '200'): 1})
+        self.assertEqual(collector.sizes[('POST', 'models/{id}/predict', 'request')].sum, 20)
+        self.assertEqual(collector.sizes[('POST', 'models/{id}/predict', 'response')].sum, 12)
+
+    def test_prometheus_text(self):
+        collector = HistogramCollector(duration_buckets=(1,), size_buckets=(100,))
+        http = SequenceHttpClient([], instruments=[collector])
+        http.request('GET', 'views/v1')
+        text = to_prometheus(collector, prefix='test')
+
+        self.assertIn('# TYPE test_request_duration_seconds histogram', text)
+        self.assertIn('test_requests_total{path="views/{id}",status="200",verb="GET"} 1', text)
+        self.assertIn('test_request_duration_seconds_bucket{le="+Inf",path="views/{id}",phase="total",verb="GET"} 1',
+                      text)
+        self.assertIn('test_payload_bytes_count{direction="response",path="views/{id}",verb="GET"} 1', text)
+
+    def test_circuit_breaker_rejections_are_reported_as_errors(self):
+        instrument = RecordingInstrument()
+        breaker = CircuitBreaker(minimum_calls=1)
+        http = SequenceHttpClient([FakeResponse({}, 503)], instruments=[instrument], circuit_breaker=breaker)
+
+        for _ in range(2):
+            with self.assertRaises(ClientError):
+                http.request('GET', 'data')
+
+        self.assertEqual(instrument.calls[-2:], [('before_request', 'data', None), ('on_error', 'data', None)])
+        self.assertEqual(len(http.sessions[0].calls), 1)
@@ -1,6 +1,6 @@
 import unittest
 from nexosisapi.tests.fake_http_client import FakeHttpClient
-from nexosisapi import Client
+from nexosisapi import Client, ClientError
 from nexosisapi.list_queries import ModelListQuery
 
 
@@ -42,3 +42,30 @@ class ModelOperationTests(unittest.TestCase):
         self.assertEqual(params['dataSourceName'], 'some-datasource')
         self.assertEqual(params['createdBeforeDate'], '2017-01-01T00:00:00')
         self.assertEqual(params['createdAfterDate'], '2017-10-10T00:00:00')
+
+    def test_predict_many_merges_batches_in_order(self):
+        def request(verb, uri, **kwargs):
+            rows = kwargs['data']['data']
+            return {'modelId': 'm', 'data': [dict(row, y=row['x'] * 2) for row in rows]}
+
+        self.http.request = request
+        actual = self.client.models.predict_many('m', ({'x': i} for i in range(55)), batch_size=10, workers=3)
+
+        self.assertEqual(actual.model_id, 'm')
+        self.assertEqual([row['y'] for row in actual.data], [i * 2 for i in range(55)])
+
+    def test_predict_many_retries_failed_batch(self):
+        failures = [20]
+
+        def request(verb, uri, **kwargs):
+            rows = kwargs['data']['data']
+            if rows[0]['x'] in failures:
+                failures.remove(rows[0]['x'])
+                raise ClientError(uri, 500, {})
+            return {'modelId': 'm', 'data': rows}
+
+        self.http.request = request
+        actual = self.client.models.predict_many('m', [{'x': i} for i in range(30)], batch_size=10, retries=1)
+
+        self.assertEqual(len(actual.data), 30)
+        self.assertEqual(failures, [])
@@ -0,0 +1,61 @@
+from enum import Enum
+import importlib
+import inspect
+import os
+import pickle
+import unittest
+
+import nexosisapi
+from nexosisapi.column_metadata import ColumnMetadata, Role
+from nexosisapi.list_queries import ListQuery
+from nexosisapi.word import Word
+from nexosisapi.session import SessionResponse
+
+
+class ModelSlotsTests(unittest.TestCase):
+    def test_every_model_defines_slots(self):
+        package = os.path.dirname(nexosisapi.__file__)
+        for name in sorted(os.listdir(package)):
+            if not name.endswith('.py') or name == '__init__.py':
+                continue
+            module = importlib.import_module('nexosisapi.%s' % name[:-3])
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__ or issubclass(cls, (Enum, ListQuery)):
+                    continue
+                self.assertIn('__slots__', vars(cls), cls.__name__)
+
+    def test_models_have_no_instance_dict(self):
+        word = Word({'text': 'a', 'type': 1, 'rank': 2})
+        session = SessionResponse({'sessionId': 'abc', 'type': 'model', 'status': 'completed', 'statusHistory': [],
+                                   'dataSourceName': 'ds', 'targetColumn': 'y', 'links': [],
+                                   'extraParameters': {}, 'requestedDate': '2017-12-19T04:30:16+00:00'}, {})
+
+        self.assertFalse(hasattr(word, '__dict__'))
+        self.assertFalse(hasattr(session, '__dict__'))
+        self.assertEqual(session.session_id, 'abc')
+
+
+class ColumnMetadataTests(unittest.TestCase):
+    def test_equal_metadata_is_shared(self):
+        first = ColumnMetadata({'dataType': 'numeric', 'role': 'target'})
+        second = ColumnMetadata({'role': 'target', 'dataType': 'numeric', 'imputation': None})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, ColumnMetadata({'dataType': 'numeric', 'role': 'feature'}))
+
+    def test_metadata_is_immutable(self):
+        target = ColumnMetadata({'dataType': 'numeric'})
+
+        with self.assertRaises(AttributeError):
+            target._role = Role.target
+        self.assertEqual(target.role, Role.none)
+
+    def test_invalid_values_still_raise(self):
+        with self.assertRaises(KeyError):
+            ColumnMetadata({'dataType': 'not-a-type'})
+
+    def test_round_trips_through_pickle(self):
+        target = ColumnMetadata({'dataType': 'numeric', 'role': 'target', 'imputation': 'mean'})
+
+        self.assertIs(pickle.loads(pickle.dumps(target)), target)
+        self.assertEqual(target.to_dict(), {'dataType': 'numeric', 'role': 'target', 'imputation': 'mean'})
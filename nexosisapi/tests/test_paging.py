@@ -0,0 +1,126 @@
+import threading
+import unittest
+
+from nexosisapi import Client
+from nexosisapi.client.paging import iter_pages
+from nexosisapi.list_queries import SessionListQuery
+
+
+class PagedFakeHttpClient(object):
+    """Serves `total` numbered items, `page_size` at a time, from any paged endpoint"""
+
+    def __init__(self, total, page_size, key='items'):
+        self._total = total
+        self._page_size = page_size
+        self._key = key
+        self._lock = threading.Lock()
+        self.pages_requested = []
+
+    def request(self, verb, uri, **kwargs):
+        page = kwargs['params']['page']
+        with self._lock:
+            self.pages_requested.append(page)
+        start = page * self._page_size
+        items = [{'x': i} for i in range(start, min(start + self._page_size, self._total))]
+        return {self._key: items, 'pageNumber': page, 'pageSize': self._page_size,
+                'totalPages': -(-self._total // self._page_size), 'totalCount': self._total}
+
+    def request_with_headers(self, verb, uri_path, **kwargs):
+        return self.request(verb, uri_path, **kwargs), 200, {}
+
+
+class PagingTests(unittest.TestCase):
+    def test_iter_pages_yields_in_order(self):
+        fetched = []
+
+        def fetch(page):
+            fetched.append(page)
+            return page
+
+        actual = list(iter_pages(fetch, lambda page: 6, prefetch=3))
+
+        self.assertEqual(actual, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(sorted(fetched), [0, 1, 2, 3, 4, 5])
+
+    def test_iter_pages_is_lazy(self):
+        fetched = []
+
+        def fetch(page):
+            fetched.append(page)
+            return page
+
+        pages = iter_pages(fetch, lambda page: 100, prefetch=2)
+        self.assertEqual(fetched, [])
+        next(pages)
+        next(pages)
+        pages.close()
+
+        self.assertTrue(len(fetched) <= 5)
+
+    def test_dataset_iter_all_reads_every_row(self):
+        http = PagedFakeHttpClient(total=25, page_size=10, key='data')
+        rows = list(Client(client=http).datasets.iter_all('test', page_size=10))
+
+        self.assertEqual([row['x'] for row in rows], list(range(25)))
+        self.assertEqual(sorted(http.pages_requested), [0, 1, 2])
+
+    def test_session_iter_list_does_not_change_query(self):
+        requested = []
+
+        def request(verb, uri, **kwargs):
+            requested.append(kwargs['params']['page'])
+            return {'items': [], 'totalPages': 3}
+
+        http = PagedFakeHttpClient(0, 1)
+        http.request = request
+        query = SessionListQuery(page_size=2)
+        list(Client(client=http).sessions.iter_list(query))
+
+        self.assertEqual(sorted(requested), [0, 1, 2])
+        self.assertEqual(query.page_number, 0)
+
+    def test_vocabulary_iter_all_reads_every_word(self):
+        http = PagedFakeHttpClient(total=7, page_size=3)
+        http.request = self._words(http.request)
+        words = list(Client(client=http).vocabularies.iter_all('vocab', page_size=3))
+
+        self.assertEqual(len(words), 7)
+
+    def test_feature_importance_iterates_scores(self):
+        def request(verb, uri, **kwargs):
+            page = kwargs['params']['page']
+            return dict(self.session_data, featureImportance={'col%d' % page: page}, totalPages=2)
+
+        http = PagedFakeHttpClient(0, 1)
+        http.request = request
+        actual = list(Client(client=http).sessions.iter_feature_importance('abc'))
+
+        self.assertEqual(actual, [('col0', 0), ('col1', 1)])
+
+    @staticmethod
+    def _words(request):
+        def words(verb, uri, **kwargs):
+            response = request(verb, uri, **kwargs)
+            response['items'] = [{'text': str(item['x']), 'type': 0, 'rank': item['x']} for item in response['items']]
+            return response
+        return words
+
+    session_data = {
+        'sessionId': 'abc',
+        'type': 'model',
+        'status': 'completed',
+        'requestedDate': '2017-12-19T04:30:16.070806+00:00',
+        'statusHistory': [],
+        'extraParameters': {},
+        'dataSourceName': 'ds',
+        'targetColumn': 'y',
+        'links': []
+    }
+
+    def test_dataset_get_all_reassembles_pages_in_order(self):
+        http = PagedFakeHttpClient(total=95, page_size=10, key='data')
+        actual = Client(client=http).datasets.get_all('test', workers=4, page_size=10)
+
+        self.assertEqual([row['x'] for row in actual.data], list(range(95)))
+        self.assertEqual(actual.item_total, 95)
+        self.assertEqual(sorted(http.pages_requested), list(range(10)))
@@ -0,0 +1,81 @@
+import threading
+import unittest
+
+from nexosisapi import Client, ClientError
+from nexosisapi.client.predict_batcher import PredictBatcher
+from nexosisapi.tests.fake_http_client import FakeHttpClient
+
+
+class EchoHttpClient(FakeHttpClient):
+    def __init__(self):
+        super(EchoHttpClient, self).__init__(None)
+        self._lock = threading.Lock()
+
+    def request(self, verb, uri, **kwargs):
+        with self._lock:
+            self.calls.append((verb, uri, kwargs))
+        rows = kwargs['data']['data']
+        return {'modelId': uri.split('/')[1], 'data': [dict(row, y=row['x'] * 2) for row in rows]}
+
+
+class PredictBatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.http = EchoHttpClient()
+        self.client = Client(client=self.http)
+
+    def test_full_batches_are_sent_together(self):
+        with PredictBatcher(self.client.models, max_batch_size=5, max_wait=10) as target:
+            futures = [target.submit('m', {'x': i}) for i in range(10)]
+            actual = [future.result(1) for future in futures]
+
+        self.assertEqual([row['y'] for row in actual], [i * 2 for i in range(10)])
+        self.assertEqual(len(self.http.calls), 2)
+
+    def test_partial_batch_is_sent_after_wait(self):
+        with PredictBatcher(self.client.models, max_batch_size=100, max_wait=0.01) as target:
+            futures = [target.submit('m', {'x': i}) for i in range(3)]
+            actual = [future.result(1)['y'] for future in futures]
+
+        self.assertEqual(actual, [0, 2, 4])
+        self.assertEqual(len(self.http.calls), 1)
+
+    def test_rows_are_grouped_by_model(self):
+        with PredictBatcher(self.client.models, max_batch_size=100, max_wait=0.01) as target:
+            first = target.submit('a', {'x': 1})
+            second = target.submit('b', {'x': 2})
+            first.result(1)
+            second.result(1)
+
+        self.assertEqual(sorted(call[1] for call in self.http.calls), ['models/a/predict', 'models/b/predict'])
+
+    def test_concurrent_callers_share_requests(self):
+        results = {}
+        with PredictBatcher(self.client.models, max_batch_size=50, max_wait=0.05) as target:
+            def call(i):
+                results[i] = target.predict('m', {'x': i}, timeout=1)['y']
+            threads = [threading.Thread(target=call, args=(i,)) for i in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(results, dict((i, i * 2) for i in range(20)))
+        self.assertTrue(len(self.http.calls) < 20)
+
+    def test_errors_reach_every_caller(self):
+        def fail(verb, uri, **kwargs):
+            raise ClientError(uri, 400, {})
+
+        self.http.request = fail
+        with PredictBatcher(self.client.models, max_batch_size=2, max_wait=10) as target:
+            futures = [target.submit('m', {'x': i}) for i in range(2)]
+
+        for future in futures:
+            self.assertIsInstance(future.exception(1), ClientError)
+
+    def test_close_sends_waiting_rows(self):
+        target = PredictBatcher(self.client.models, max_batch_size=100, max_wait=10)
+        future = target.submit('m', {'x': 4})
+        target.close()
+
+        self.assertEqual(future.result(0)['y'], 8)
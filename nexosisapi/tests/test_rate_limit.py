@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from nexosisapi.client.rate_limit import TokenBucket, FileTokenBucket, RateLimiter, fcntl
+from nexosisapi.tests.test_http_client import FakeResponse
+from nexosisapi.tests.test_retry import SequenceHttpClient
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_bursts_up_to_capacity(self):
+        target = TokenBucket(1, capacity=3)
+
+        self.assertEqual([target.try_acquire() for _ in range(4)], [True, True, True, False])
+
+    def test_pause_holds_back_tokens(self):
+        target = TokenBucket(100)
+        target.pause(1)
+
+        self.assertFalse(target.try_acquire())
+
+    @unittest.skipIf(fcntl is None, 'fcntl is not available')
+    def test_file_bucket_is_shared(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'bucket')
+            first = FileTokenBucket(path, 1, capacity=2)
+            second = FileTokenBucket(path, 1, capacity=2)
+
+            self.assertTrue(first.try_acquire())
+            self.assertTrue(second.try_acquire())
+            self.assertFalse(first.try_acquire())
+            first.set_rate(5)
+            self.assertEqual(second.rate, 5)
+        finally:
+            shutil.rmtree(directory)
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_throttling_halves_rate_and_success_recovers_it(self):
+        target = RateLimiter(rate=8, increase=1)
+        target.observe(429, {'Retry-After': '0'})
+        self.assertEqual(target.rate, 4)
+
+        for _ in range(10):
+            target.observe(200, {})
+        self.assertEqual(target.rate, 8)
+
+    def test_retry_after_pauses_requests(self):
+        target = RateLimiter(rate=100)
+        target.observe(429, {'Retry-After': '5'})
+
+        self.assertFalse(target.bucket.try_acquire())
+
+    def test_records_account_quotas(self):
+        target = RateLimiter()
+        target.observe(200, {'Nexosis-Account-PredictionCount-Current': '90',
+                             'Nexosis-Account-PredictionCount-Allotted': '100', 'content-type': 'application/json'})
+
+        self.assertEqual(target.quotas, {'predictioncount': (90, 100)})
+        self.assertEqual(target.remaining('predictioncount'), 10)
+        self.assertIsNone(target.remaining('sessioncount'))
+
+    def test_http_client_reports_responses(self):
+        limiter = RateLimiter(rate=50)
+        http = SequenceHttpClient([FakeResponse({}, 429, {'Retry-After': '0'})], rate_limiter=limiter)
+
+        with self.assertRaises(Exception):
+            http.request('GET', 'data')
+        self.assertEqual(limiter.rate, 25)
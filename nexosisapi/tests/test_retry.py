@@ -0,0 +1,113 @@
+import io
+import unittest
+
+from requests.exceptions import ConnectTimeout, ConnectionError
+
+from nexosisapi import ClientError
+from nexosisapi.client.retry import RetryPolicy, retry_after
+from nexosisapi.tests.test_http_client import FakeResponse, FakeSession, SessionRecordingHttpClient
+
+
+class SequenceSession(FakeSession):
+    """Returns, or raises, each of `outcomes` in turn, then succeeds"""
+
+    def __init__(self, outcomes):
+        super(SequenceSession, self).__init__()
+        self._outcomes = list(outcomes)
+        self.bodies = []
+
+    def request(self, verb, uri, **kwargs):
+        self.calls.append((verb, uri, kwargs))
+        if hasattr(kwargs.get('data'), 'read'):
+            self.bodies.append(kwargs['data'].read())
+        outcome = self._outcomes.pop(0) if self._outcomes else FakeResponse({'ok': True})
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class SequenceHttpClient(SessionRecordingHttpClient):
+    def __init__(self, outcomes, **kwargs):
+        super(SequenceHttpClient, self).__init__('key', 'https://example.com/v1', **kwargs)
+        self._outcomes = outcomes
+
+    def _new_session(self):
+        session = SequenceSession(self._outcomes)
+        self.sessions.append(session)
+        return session
+
+
+class RetryPolicyTests(unittest.TestCase):
+    def test_idempotent_verbs_retry_server_errors(self):
+        target = RetryPolicy()
+
+        self.assertTrue(target.is_retryable('GET', ClientError('data', 503, {})))
+        self.assertTrue(target.is_retryable('delete', ConnectionError()))
+        self.assertFalse(target.is_retryable('GET', ClientError('data', 404, {})))
+
+    def test_post_only_retries_requests_that_were_not_acted_on(self):
+        target = RetryPolicy()
+
+        self.assertTrue(target.is_retryable('POST', ClientError('models/m/predict', 429, {})))
+        self.assertTrue(target.is_retryable('POST', ConnectTimeout()))
+        self.assertFalse(target.is_retryable('POST', ClientError('models/m/predict', 503, {})))
+        self.assertFalse(target.is_retryable('POST', ConnectionError()))
+        self.assertTrue(RetryPolicy(idempotent_verbs=['POST']).is_retryable('POST', ConnectionError()))
+
+    def test_retry_after_sets_the_least_delay(self):
+        error = ClientError('data', 429, {}, {'Retry-After': '7'})
+
+        self.assertEqual(retry_after(error), 7.0)
+        self.assertTrue(RetryPolicy(initial=0.01).next_delay('GET', error, 0, 0) >= 7.0)
+
+    def test_gives_up_after_retries_or_elapsed_time(self):
+        target = RetryPolicy(retries=2, max_elapsed=10)
+        error = ClientError('data', 503, {})
+
+        self.assertIsNone(target.next_delay('GET', error, 2, 0))
+        self.assertIsNone(target.next_delay('GET', ClientError('data', 503, {}, {'Retry-After': '30'}), 0, 0))
+        self.assertIsNotNone(target.next_delay('GET', error, 1, 0))
+
+
+class HttpClientRetryTests(unittest.TestCase):
+    def test_transient_failures_are_retried(self):
+        target = SequenceHttpClient([FakeResponse({}, 503), ConnectionError()],
+                                    retry_policy=RetryPolicy(initial=0))
+
+        self.assertEqual(target.request('GET', 'data'), {'ok': True})
+        self.assertEqual(len(target.sessions[0].calls), 3)
+
+    def test_last_error_is_raised(self):
+        target = SequenceHttpClient([FakeResponse({}, 503)] * 3, retry_policy=RetryPolicy(retries=2, initial=0))
+
+        with self.assertRaises(ClientError) as context:
+            target.request('GET', 'data')
+        self.assertEqual(context.exception.status, 503)
+
+    def test_no_policy_raises_first_failure(self):
+        target = SequenceHttpClient([FakeResponse({}, 503)])
+
+        with self.assertRaises(ClientError):
+            target.request('GET', 'data')
+
+    def test_file_bodies_are_rewound(self):
+        body = io.BytesIO(b'x\n1\n')
+        target = SequenceHttpClient([FakeResponse({}, 502)],
+                                    retry_policy=RetryPolicy(initial=0, idempotent_verbs=['PUT']))
+        target.request('PUT', 'data/test', data=body, headers={'Content-Type': 'text/csv'})
+
+        self.assertEqual(target.sessions[0].bodies, [b'x\n1\n', b'x\n1\n'])
+
+    def test_dataset_append_is_sent_once(self):
+        target = SequenceHttpClient([FakeResponse({}, 502)], retry_policy=RetryPolicy(initial=0))
+
+        with self.assertRaises(ClientError):
+            target.request('PUT', 'data/test', data={'data': [{'x': 1}]})
+        self.assertEqual(len(target.sessions[0].calls), 1)
+
+    def test_streamed_bodies_are_not_retried(self):
+        target = SequenceHttpClient([FakeResponse({}, 502)],
+                                    retry_policy=RetryPolicy(initial=0, idempotent_verbs=['PUT']))
+
+        with self.assertRaises(ClientError):
+            target.request('PUT', 'data/test', data=iter([b'x\n']), headers={'Content-Type': 'text/csv'})
@@ -0,0 +1,64 @@
+from datetime import datetime, date
+import json
+import unittest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.client.serialization import encode, get_dumps, register_encoder
+from nexosisapi.time_interval import TimeInterval
+from nexosisapi.tests.test_http_client import SessionRecordingHttpClient
+
+
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class LabeledPoint(Point):
+    pass
+
+
+class SerializationTests(unittest.TestCase):
+    payload = {
+        'data': [{'when': datetime(2017, 1, 2, 3, 4, 5), 'day': date(2017, 1, 2), 'x': 1.5}],
+        'columns': {'x': ColumnMetadata({'dataType': 'numeric', 'role': 'target', 'imputation': 'mean'})},
+        'resultInterval': TimeInterval.hour
+    }
+    expected = {
+        'data': [{'when': '2017-01-02T03:04:05', 'day': '2017-01-02', 'x': 1.5}],
+        'columns': {'x': {'dataType': 'numeric', 'role': 'target', 'imputation': 'mean'}},
+        'resultInterval': 'hour'
+    }
+
+    def test_stdlib_backend_encodes_models(self):
+        self.assertEqual(json.loads(get_dumps('json')(self.payload)), self.expected)
+
+    @unittest.skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson_backend_matches_stdlib_for_models(self):
+        payload = dict(self.payload, resultInterval=TimeInterval.hour.name)
+
+        self.assertEqual(json.loads(get_dumps('orjson')(payload)), self.expected)
+
+    def test_registered_encoders_apply_to_subclasses(self):
+        register_encoder(Point, lambda obj: [obj.x, obj.y])
+
+        self.assertEqual(encode(LabeledPoint(1, 2)), [1, 2])
+
+    def test_unknown_types_raise(self):
+        with self.assertRaises(TypeError):
+            encode(object())
+
+    def test_unknown_backend_raises(self):
+        with self.assertRaises(ValueError):
+            get_dumps('yaml')
+
+    def test_http_client_uses_backend(self):
+        target = SessionRecordingHttpClient('key', 'https://example.com/v1', json_backend='json')
+        target.request('PUT', 'data/test', data=self.payload)
+
+        self.assertEqual(json.loads(target.sessions[0].calls[0][2]['data']), self.expected)
@@ -1,7 +1,8 @@
 import unittest
 import datetime
 from nexosisapi.tests.fake_http_client import FakeHttpClient
-from nexosisapi import Client
+from nexosisapi import Client, DeadlineExceededError
+from nexosisapi.status import Status
 from nexosisapi.class_scores import ClassScores
 from nexosisapi.anomaly_scores import AnomalyScores
 from nexosisapi.feature_importance import FeatureImportance
@@ -185,4 +186,45 @@ class TestSession(unittest.TestCase):
             'links': []
         }
         cls.http = FakeHttpClient(cls.session_data)
-        cls.client = Client(client=cls.http)
\ No newline at end of file
+        cls.client = Client(client=cls.http)
+
+
+class StatusSequenceHttpClient(FakeHttpClient):
+    """Reports each of `statuses` in turn from HEAD requests"""
+
+    def __init__(self, session_data, statuses):
+        super(StatusSequenceHttpClient, self).__init__(session_data)
+        self._statuses = list(statuses)
+
+    def request_with_headers(self, verb, uri_path, **kwargs):
+        if verb == 'HEAD':
+            self.calls.append((verb, uri_path, kwargs))
+            status = self._statuses.pop(0)
+            return None, 200, {'Nexosis-Session-Status': status} if status else {}
+        return super(StatusSequenceHttpClient, self).request_with_headers(verb, uri_path, **kwargs)
+
+
+class TestSessionWait(unittest.TestCase):
+    def test_wait_polls_status_until_finished(self):
+        http = StatusSequenceHttpClient(TestSession.session_data, ['Requested', 'Started', 'Completed'])
+        actual = Client(client=http).sessions.wait('abc', initial_interval=0)
+
+        self.assertEqual([verb for verb, _, _ in http.calls], ['HEAD', 'HEAD', 'HEAD', 'GET'])
+        self.assertEqual(actual.session_id, 'f8d11e26-79f0-43b4-9545-111b8eaa00a5')
+
+    def test_wait_uses_session_when_header_missing(self):
+        http = StatusSequenceHttpClient(TestSession.session_data, [None])
+        Client(client=http).sessions.wait('abc', initial_interval=0)
+
+        self.assertEqual([verb for verb, _, _ in http.calls], ['HEAD', 'GET'])
+
+    def test_wait_raises_after_timeout(self):
+        http = StatusSequenceHttpClient(TestSession.session_data, ['Started'] * 10)
+
+        with self.assertRaises(DeadlineExceededError):
+            Client(client=http).sessions.wait('abc', timeout=0.01, initial_interval=0.005)
+
+    def test_get_status_reads_header(self):
+        http = StatusSequenceHttpClient(TestSession.session_data, ['Failed'])
+
+        self.assertEqual(Client(client=http).sessions.get_status('abc'), Status.failed)
@@ -0,0 +1,71 @@
+import unittest
+
+from nexosisapi.client.session_tracker import SessionTracker
+from nexosisapi.paged_list import PagedList
+from nexosisapi.session import SessionResponse
+from nexosisapi.status import Status
+
+
+def session(session_id, status, requested='2018-01-01T00:00:00+00:00'):
+    return SessionResponse({
+        'sessionId': session_id,
+        'type': 'model',
+        'status': status,
+        'requestedDate': requested,
+        'statusHistory': [],
+        'extraParameters': {},
+        'dataSourceName': 'ds',
+        'targetColumn': 'y',
+        'links': []
+    }, {})
+
+
+class FakeSessions(object):
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = []
+
+    def get(self, session_id):
+        self.calls.append(('get', session_id))
+        return session(session_id, self.statuses[session_id])
+
+    def get_status(self, session_id):
+        self.calls.append(('get_status', session_id))
+        return Status[self.statuses[session_id]]
+
+    def list(self, query):
+        self.calls.append(('list', query.requested_after_date))
+        return PagedList([session(s, status) for s, status in self.statuses.items()], total_pages=1)
+
+
+class SessionTrackerTests(unittest.TestCase):
+    def test_ids_are_fetched_once_then_listed(self):
+        sessions = FakeSessions({'a': 'started', 'b': 'started', 'c': 'completed'})
+        target = SessionTracker(sessions, ['a', 'b', 'c'], list_threshold=2, requests_per_second=1000)
+
+        first = target.poll()
+        self.assertEqual([s.session_id for s in first], ['c'])
+        self.assertEqual(sorted(target.pending), ['a', 'b'])
+
+        sessions.statuses['a'] = 'failed'
+        sessions.calls = []
+        second = target.poll()
+
+        self.assertEqual([s.session_id for s in second], ['a'])
+        self.assertEqual([call[0] for call in sessions.calls], ['list'])
+
+    def test_few_sessions_are_checked_individually(self):
+        sessions = FakeSessions({'a': 'started'})
+        target = SessionTracker(sessions, [session('a', 'requested')], requests_per_second=1000)
+
+        self.assertEqual(target.poll(), [])
+        self.assertEqual(sessions.calls, [('get_status', 'a')])
+
+    def test_finished_yields_every_session(self):
+        sessions = FakeSessions({'a': 'completed', 'b': 'cancelled'})
+        target = SessionTracker(sessions, ['a', 'b'], poll_interval=0, requests_per_second=1000)
+
+        actual = sorted(s.session_id for s in target.finished())
+
+        self.assertEqual(actual, ['a', 'b'])
+        self.assertEqual(target.pending, [])
@@ -1,9 +1,12 @@
 from nexosisapi.column_metadata import ColumnMetadata
+from nexosisapi.columnar import to_columns, to_numpy
 from nexosisapi.join import Join
 
 class ViewDefinition(object):
     """A description of the definition of a view"""
 
+    __slots__ = ('_view_name', '_dataset_name', '_column_metadata', '_joins')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
@@ -64,12 +67,18 @@ class ViewDefinition(object):
 class ViewData(ViewDefinition):
     """A view definition including the data associated with the view"""
 
+    __slots__ = ('_data', '_page_number', '_total_pages', '_page_size', '_item_total')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
         ViewDefinition.__init__(self, data_dict)
 
         self._data = data_dict['data']
+        self._page_number = data_dict.get('pageNumber', 0)
+        self._total_pages = data_dict.get('totalPages', 0)
+        self._page_size = data_dict.get('pageSize', 50)
+        self._item_total = data_dict.get('totalCount', 0)
 
     @property
     def data(self):
@@ -80,6 +89,41 @@ class ViewData(ViewDefinition):
         """
         return self._data
 
+    @property
+    def page_number(self):
+        return self._page_number
+
+    @property
+    def total_pages(self):
+        return self._total_pages
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @property
+    def item_total(self):
+        return self._item_total
+
+    def to_columns(self, dtypes=None, columns=None):
+        """Gets the data for this View as a typed numpy array for each column
+
+        :param dict dtypes: numpy dtypes to use for some columns in place of the ones chosen from the metadata
+        :param list columns: the columns to include, in order; defaults to all of them
+        :return: the array for each column, by column name
+        :rtype: OrderedDict
+        """
+        return to_columns(self._data, self._column_metadata, dtypes, columns)
+
+    def to_numpy(self, dtypes=None, columns=None):
+        """Gets the data for this View as a numpy structured array with a typed field for each column
+
+        :param dict dtypes: numpy dtypes to use for some columns in place of the ones chosen from the metadata
+        :param list columns: the columns to include, in order; defaults to all of them
+        :rtype: numpy.ndarray
+        """
+        return to_numpy(self._data, self._column_metadata, dtypes, columns)
+
     def __repr__(self):
         return """ViewData({
     'viewName': '%s',
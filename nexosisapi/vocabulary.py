@@ -1,9 +1,12 @@
 from nexosisapi.word import Word
 from nexosisapi.paged_list import PagedList
+from nexosisapi.link import Link
 
 class Vocabulary(PagedList):
     """A vocabulary"""
 
+    __slots__ = ('_id',)
+
     def __init__(self, vocabulary_id, *args, **kwargs):
         super(Vocabulary, self).__init__(*args, **kwargs)
         self._id = vocabulary_id
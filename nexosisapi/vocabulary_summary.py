@@ -1,9 +1,12 @@
 from nexosisapi.data_source_type import DataSourceType
-import dateutil.parser
+from nexosisapi.dates import parse_datetime
 
 class VocabularySummary(object):
     """Summary information about a Vocabulary"""
 
+    __slots__ = ('_id', '_data_source_name', '_column_name', '_data_source_type', '_created_on_date',
+                 '_created_by_session_id')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
@@ -12,7 +15,7 @@ class VocabularySummary(object):
         self._data_source_name = data_dict.get('dataSourceName', None)
         self._column_name = data_dict.get('columnName', None)
         self._data_source_type = DataSourceType[data_dict.get('dataSourceType', 'dataSet')]
-        self._created_on_date = dateutil.parser.parse(data_dict.get('createdOnDate', None))
+        self._created_on_date = data_dict.get('createdOnDate', None)
         self._created_by_session_id = data_dict.get('createdBySessionId', None)
 
 
@@ -60,6 +63,7 @@ class VocabularySummary(object):
         :return: the created on date
         :rtype: string
         """
+        self._created_on_date = parse_datetime(self._created_on_date)
         return self._created_on_date
 
     @property
@@ -8,6 +8,8 @@ class WordType(Enum):
 class Word(object):
     """A word from a vocabulary"""
 
+    __slots__ = ('_text', '_type', '_rank')
+
     def __init__(self, data_dict=None):
         if data_dict is None:
             data_dict = {}
@@ -17,8 +17,15 @@ setup(name='nexosisapi',
       license='Apache 2.0',
       packages=find_packages(),
       install_requires=[
-          'requests', 'enum34', 'python-dateutil'
+          'requests', 'enum34', 'python-dateutil', 'futures; python_version < "3"'
       ],
+      extras_require={
+          'async': ['aiohttp'],
+          'numpy': ['numpy'],
+          'pandas': ['pandas'],
+          'arrow': ['pyarrow'],
+          'orjson': ['orjson'],
+      },
       test_suite='nexosisapi.tests.all',
       classifiers=[
         'Development Status :: 5 - Production/Stable',